@@ -0,0 +1,263 @@
+# Default (software engineering) concept dictionary for keyword matching. Kept as plain data so
+# the catalog can reload it without a restart; see services/catalog.py.
+BASE_CONCEPTS = {
+    "debugging": {
+        "label": "Debugging / fixing issues",
+        "tier": "core",
+        "weight": 1.0,
+        "synonyms": [
+            "debugging",
+            "debugged",
+            "fix bugs",
+            "fixed bugs",
+            "fix issues",
+            "bug fixes",
+            "bug-fixes",
+            "bug fixing",
+            "resolved defects",
+            "troubleshoot",
+            "troubleshooting",
+            "resolve issues",
+            "resolved issues",
+            "fixing issues",
+            "bugfix",
+            "bug fix",
+            "bug-fix",
+            "bugfixes",
+            "fixing technical issues",
+            "technical issues",
+            "api errors",
+            "reduce api errors",
+            "production issues",
+            "issue resolution",
+            "bug triage",
+            "fixing code",
+            "stability fixes",
+        ],
+    },
+    "testing": {
+        "label": "Testing / writing tests",
+        "tier": "core",
+        "weight": 1.0,
+        "synonyms": [
+            "unit test",
+            "unit tests",
+            "integration test",
+            "integration tests",
+            "automated tests",
+            "qa testing",
+            "qa",
+            "test coverage",
+            "tested features",
+            "wrote tests",
+            "test cases",
+            "verification",
+            "unit testing",
+            "test automation",
+            "quality assurance",
+            "testing features",
+            "tests",
+            "testing",
+            "test suites",
+            "playwright",
+            "pytest",
+            "jest",
+            "smoke tests",
+            "regression tests",
+            "test plan",
+            "test scripts",
+        ],
+    },
+    "version_control": {
+        "label": "Version control (Git/GitHub)",
+        "tier": "core",
+        "weight": 1.0,
+        "synonyms": [
+            "git",
+            "github",
+            "gitlab",
+            "bitbucket",
+            "version control",
+            "git workflow",
+            "git workflows",
+            "git flow",
+            "github flow",
+            "git version control",
+            "source control",
+            "merge request",
+            "pull request",
+            "git branching",
+            "git workflows",
+            "git repos",
+            "git repository",
+            "git repositories",
+            "git commits",
+            "branch strategy",
+            "code reviews",
+            "pr reviews",
+            "git operations",
+        ],
+    },
+    "teamwork": {
+        "label": "Team collaboration",
+        "tier": "core",
+        "weight": 0.9,
+        "synonyms": [
+            "collaborated",
+            "cross functional",
+            "team meetings",
+            "team meeting",
+            "standups",
+            "standup",
+            "scrum meetings",
+            "scrum",
+            "pair programming",
+            "paired with",
+            "worked with team",
+            "worked with teammates",
+            "collaboration",
+            "team sync",
+            "collaborated in team meetings",
+            "teamwork",
+            "teammates meetings",
+            "stakeholder updates",
+            "project updates",
+            "sprint ceremonies",
+        ],
+    },
+    "assigned_tasks": {
+        "label": "Assigned tasks / feature work",
+        "tier": "basic",
+        "weight": 0.6,
+        "synonyms": [
+            "assigned tasks",
+            "assigned work",
+            "project tasks",
+            "feature work",
+            "implement features",
+            "ticket",
+            "jira ticket",
+            "story points",
+            "backlog item",
+            "user stories",
+            "tasks",
+            "task list",
+            "deliverables",
+            "sprint tasks",
+            "work items",
+        ],
+    },
+    "clean_code": {
+        "label": "Clean, maintainable code",
+        "tier": "core",
+        "weight": 0.7,
+        "synonyms": [
+            "clean code",
+            "maintainable code",
+            "readable code",
+            "refactored code",
+            "code quality",
+            "linting",
+            "code cleanup",
+            "refactoring",
+            "codebase hygiene",
+            "style guide",
+        ],
+    },
+    "learning_mindset": {
+        "label": "Learning mindset",
+        "tier": "basic",
+        "weight": 0.5,
+        "synonyms": [
+            "learning new tools",
+            "self learning",
+            "self-taught",
+            "curious",
+            "eager to learn",
+            "willingness to learn",
+            "explore new tools",
+            "research new tech",
+            "learning mindset",
+            "continuous learning",
+        ],
+    },
+    "programming_fundamentals": {
+        "label": "Programming fundamentals",
+        "tier": "basic",
+        "weight": 1.0,
+        "synonyms": [
+            "python",
+            "javascript",
+            "typescript",
+            "java",
+            "c++",
+            "c#",
+            "go",
+            "loops",
+            "functions",
+            "data structures",
+            "algorithms",
+            "variables",
+            "control flow",
+            "conditionals",
+            "recursion",
+            "object oriented",
+            "oop",
+            "classes",
+            "ds&a",
+            "fundamentals",
+        ],
+    },
+    "web_fundamentals": {
+        "label": "Web/app fundamentals",
+        "tier": "basic",
+        "weight": 0.8,
+        "synonyms": [
+            "html",
+            "css",
+            "frontend",
+            "backend",
+            "api",
+            "rest api",
+            "database",
+            "sql",
+            "nosql",
+            "express",
+            "react",
+            "django",
+            "flask",
+            "full stack",
+            "client server",
+            "http",
+            "deployment",
+            "hosting",
+            "web app",
+            "web application",
+            "server side",
+            "client side",
+        ],
+    },
+    "advanced_engineering": {
+        "label": "Advanced engineering experience",
+        "tier": "advanced",
+        "weight": 0.6,
+        "synonyms": [
+            "production",
+            "deployment",
+            "scalability",
+            "microservices",
+            "distributed systems",
+            "cloud",
+            "kubernetes",
+            "docker",
+            "cicd",
+            "continuous integration",
+            "continuous deployment",
+            "mlops",
+            "devops",
+            "system design",
+            "architecture",
+            "high availability",
+        ],
+    },
+}
@@ -0,0 +1,195 @@
+# Role-specific concept dictionaries for keyword matching. Templates opt in with "concept_set";
+# templates without one (and unknown set names) fall back to the software engineering concepts.
+CONCEPT_SETS = {
+    "nursing": {
+        "patient_care": {
+            "label": "Patient care",
+            "tier": "basic",
+            "weight": 1.0,
+            "synonyms": [
+                "patient care",
+                "bedside care",
+                "direct patient care",
+                "patient assessment",
+                "vital signs",
+                "patient education",
+                "care plan",
+                "care plans",
+            ],
+        },
+        "licensure": {
+            "label": "Licensure / certifications",
+            "tier": "basic",
+            "weight": 0.9,
+            "synonyms": ["rn", "registered nurse", "nclex", "bls", "acls", "pals", "license", "licensed"],
+        },
+        "medication_administration": {
+            "label": "Medication administration",
+            "tier": "core",
+            "weight": 0.9,
+            "synonyms": [
+                "medication administration",
+                "administered medications",
+                "iv therapy",
+                "infusion",
+                "medication reconciliation",
+                "pharmacology",
+            ],
+        },
+        "clinical_documentation": {
+            "label": "Clinical documentation",
+            "tier": "core",
+            "weight": 0.8,
+            "synonyms": ["charting", "documentation", "ehr", "emr", "epic", "cerner", "electronic health records"],
+        },
+        "interdisciplinary_collaboration": {
+            "label": "Interdisciplinary collaboration",
+            "tier": "core",
+            "weight": 0.7,
+            "synonyms": [
+                "interdisciplinary",
+                "multidisciplinary",
+                "care team",
+                "physicians",
+                "collaborated with physicians",
+                "handoff",
+            ],
+        },
+        "acute_care": {
+            "label": "Acute / critical care experience",
+            "tier": "advanced",
+            "weight": 0.6,
+            "synonyms": [
+                "icu",
+                "intensive care",
+                "critical care",
+                "emergency department",
+                "trauma",
+                "telemetry",
+                "charge nurse",
+                "triage",
+            ],
+        },
+    },
+    "finance": {
+        "accounting_fundamentals": {
+            "label": "Accounting fundamentals",
+            "tier": "basic",
+            "weight": 1.0,
+            "synonyms": [
+                "gaap",
+                "ifrs",
+                "general ledger",
+                "journal entries",
+                "accounts payable",
+                "accounts receivable",
+                "bookkeeping",
+            ],
+        },
+        "financial_reporting": {
+            "label": "Financial reporting",
+            "tier": "core",
+            "weight": 0.9,
+            "synonyms": [
+                "financial statements",
+                "financial reporting",
+                "balance sheet",
+                "income statement",
+                "cash flow",
+                "month end close",
+                "reconciliation",
+                "reconciliations",
+            ],
+        },
+        "analysis_modeling": {
+            "label": "Financial analysis / modeling",
+            "tier": "core",
+            "weight": 0.9,
+            "synonyms": [
+                "financial modeling",
+                "financial analysis",
+                "forecasting",
+                "budgeting",
+                "variance analysis",
+                "valuation",
+                "dcf",
+            ],
+        },
+        "tools": {
+            "label": "Finance tools",
+            "tier": "basic",
+            "weight": 0.7,
+            "synonyms": ["excel", "pivot tables", "quickbooks", "sap", "oracle", "netsuite", "power bi", "tableau"],
+        },
+        "compliance_audit": {
+            "label": "Audit / compliance",
+            "tier": "advanced",
+            "weight": 0.6,
+            "synonyms": ["audit", "auditing", "internal controls", "sox", "tax", "compliance", "cpa", "cfa"],
+        },
+    },
+    "teaching": {
+        "instruction": {
+            "label": "Instruction / lesson delivery",
+            "tier": "basic",
+            "weight": 1.0,
+            "synonyms": ["lesson plans", "lesson planning", "curriculum", "instruction", "taught", "teaching", "lectures"],
+        },
+        "assessment": {
+            "label": "Student assessment",
+            "tier": "core",
+            "weight": 0.9,
+            "synonyms": ["assessment", "assessments", "grading", "rubrics", "formative", "summative", "student progress"],
+        },
+        "classroom_management": {
+            "label": "Classroom management",
+            "tier": "core",
+            "weight": 0.8,
+            "synonyms": ["classroom management", "behavior management", "learning environment", "classroom"],
+        },
+        "differentiation": {
+            "label": "Differentiated instruction",
+            "tier": "core",
+            "weight": 0.7,
+            "synonyms": ["differentiated instruction", "differentiation", "iep", "special education", "ell", "esl"],
+        },
+        "credentials_research": {
+            "label": "Credentials / scholarship",
+            "tier": "advanced",
+            "weight": 0.6,
+            "synonyms": ["teaching certificate", "certified teacher", "phd", "publications", "published", "research"],
+        },
+    },
+    "admissions": {
+        "academics": {
+            "label": "Academic record",
+            "tier": "basic",
+            "weight": 1.0,
+            "synonyms": ["gpa", "honor roll", "dean's list", "ap", "ib", "honors", "coursework", "transcript"],
+        },
+        "test_scores": {
+            "label": "Standardized tests",
+            "tier": "basic",
+            "weight": 0.6,
+            "synonyms": ["sat", "act", "gmat", "gre", "toefl", "ielts"],
+        },
+        "leadership": {
+            "label": "Leadership",
+            "tier": "core",
+            "weight": 0.9,
+            "synonyms": ["president", "captain", "founded", "led", "leadership", "team lead", "managed"],
+        },
+        "service_activities": {
+            "label": "Service / extracurriculars",
+            "tier": "core",
+            "weight": 0.8,
+            "synonyms": ["volunteer", "volunteered", "community service", "club", "extracurricular", "nonprofit"],
+        },
+        "distinctions": {
+            "label": "Awards / distinctions",
+            "tier": "advanced",
+            "weight": 0.6,
+            "synonyms": ["award", "awards", "scholarship", "olympiad", "published", "research", "national merit"],
+        },
+    },
+}
@@ -279,6 +279,7 @@ Requirements:
     },
     "financial_analyst": {
         "title": "Financial Analyst",
+        "concept_set": "finance",
         "description": """Looking for a Financial Analyst to provide financial insights and analysis.
 
 Responsibilities:
@@ -299,6 +300,7 @@ Requirements:
     },
     "accountant": {
         "title": "Accountant",
+        "concept_set": "finance",
         "description": """We are hiring an Accountant to manage financial records and ensure compliance.
 
 Responsibilities:
@@ -539,6 +541,7 @@ Requirements:
     },
     "college_applicant": {
         "title": "College Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a College Applicant resume for competitive undergraduate admissions.
 
 Responsibilities:
@@ -559,6 +562,7 @@ Requirements:
     },
     "stem_college_applicant": {
         "title": "STEM College Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a STEM College Applicant resume for admission into science, technology, engineering, or mathematics programs.
 
 Responsibilities:
@@ -579,6 +583,7 @@ Requirements:
     },
     "business_college_applicant": {
         "title": "Business College Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a Business College Applicant resume for admission into business, finance, or management programs.
 
 Responsibilities:
@@ -599,6 +604,7 @@ Requirements:
     },
     "premed_college_applicant": {
         "title": "Pre-Med College Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a Pre-Med College Applicant resume for pre-medical or health-related programs.
 
 Responsibilities:
@@ -619,6 +625,7 @@ Requirements:
     },
     "international_college_applicant": {
         "title": "International College Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating an International College Applicant resume for admission to global universities.
 
 Responsibilities:
@@ -639,6 +646,7 @@ Requirements:
     },
     "graduate_school_applicant": {
         "title": "Graduate School Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a Graduate School Applicant CV or resume for admission into master's or PhD programs.
 
 Responsibilities:
@@ -659,6 +667,7 @@ Requirements:
     },
     "mba_applicant": {
         "title": "MBA Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating an MBA Applicant resume for competitive business school admissions.
 
 Responsibilities:
@@ -679,6 +688,7 @@ Requirements:
     },
     "scholarship_applicant": {
         "title": "Scholarship Applicant",
+        "concept_set": "admissions",
         "description": """We are evaluating a Scholarship Applicant resume for merit- or need-based funding opportunities.
 
 Responsibilities:
@@ -899,6 +909,7 @@ Requirements:
     },
     "registered_nurse": {
         "title": "Registered Nurse",
+        "concept_set": "nursing",
         "description": """Seeking a Registered Nurse to provide compassionate, high-quality patient care.
 
 Responsibilities:
@@ -919,6 +930,7 @@ Requirements:
     },
     "teacher_k12": {
         "title": "K-12 Teacher",
+        "concept_set": "teaching",
         "description": """Looking for a K-12 Teacher to deliver engaging lessons and support student growth.
 
 Responsibilities:
@@ -939,6 +951,7 @@ Requirements:
     },
     "university_lecturer": {
         "title": "University Lecturer",
+        "concept_set": "teaching",
         "description": """We are evaluating a University Lecturer resume for higher education teaching roles.
 
 Responsibilities:
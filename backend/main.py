@@ -1,15 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 # Use relative imports
 # Import flexibly so it works whether started as "uvicorn backend.main:app" or "uvicorn main:app" from inside backend.
 try:
-    from backend.routers.evaluate import router as evaluate_router
+    from backend.routers.evaluate import ai_evaluator, router as evaluate_router
     from backend.routers.match import router as match_router
     from backend.routers.parse import router as parse_router
     from backend.data.job_templates import JOB_TEMPLATES
 except ImportError:
-    from routers.evaluate import router as evaluate_router
+    from routers.evaluate import ai_evaluator, router as evaluate_router
     try:
         from routers.match import router as match_router  # optional
     except ImportError:
@@ -20,10 +23,20 @@ except ImportError:
         parse_router = None
     from data.job_templates import JOB_TEMPLATES
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the semantic model and concept embeddings off the startup path, so /health answers and
+    # /evaluate/ serves (without semantic matches) while a cold start is still warming up.
+    ai_evaluator.catalog.warm_up_in_background()
+    yield
+
+
 app = FastAPI(
     title="AI Resume & Job Match Evaluator",
     description="Evaluate how well a resume matches a job description using AI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -50,6 +63,7 @@ async def root():
         "endpoints": {
             "evaluate": "/evaluate/",
             "upload": "/evaluate/upload",
+            "levels": "/evaluate/levels",
             "job_templates": "/evaluate/job-templates"
         }
     }
@@ -58,6 +72,12 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Model, matcher and embedding-cache warm-up status; 503 until the warm-up has finished"""
+    status = ai_evaluator.catalog.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -14,6 +14,9 @@ class EvaluationResponse(BaseModel):
     summary: str
     keyword_matches: Optional[List[Dict[str, Any]]] = None
     quality_gates: Optional[Dict[str, Any]] = None
+    requirement_coverage: Optional[Dict[str, Any]] = None
+    # "warming_up" while the semantic model loads in the background: keyword matches are exact/fuzzy only.
+    semantic_status: Optional[str] = None
     cache_status: Optional[str] = None
 
 class FileUploadResponse(BaseModel):
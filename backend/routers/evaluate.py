@@ -1,22 +1,26 @@
 import json
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Request, Depends
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Body, UploadFile, File, Form, HTTPException, Header, Request, Depends
 
 # Import flexibly to work whether launched as package ("backend.main") or module ("main").
 try:
     from backend.services.file_handler import FileHandler
     from backend.services.text_cleaner import TextCleaner
     from backend.services.ai_evaluator import AIEvaluator
+    from backend.services.match_telemetry import dump_telemetry
+    from backend.services.tenant_dictionaries import TenantQuotaError
     from backend.models.schemas import EvaluationResponse, FileUploadResponse, ChatResponse
-    from backend.data.job_templates import JOB_TEMPLATES, ROLE_LEVEL_TEMPLATES
-    from backend.utils.security import check_api_key, is_rate_limited
+    from backend.utils.security import check_admin_token, check_api_key, is_rate_limited, is_tenant_key
     from backend.utils.config import config
 except ImportError:  # fallback when running uvicorn from inside backend directory
     from services.file_handler import FileHandler
     from services.text_cleaner import TextCleaner
     from services.ai_evaluator import AIEvaluator
+    from services.match_telemetry import dump_telemetry
+    from services.tenant_dictionaries import TenantQuotaError
     from models.schemas import EvaluationResponse, FileUploadResponse, ChatResponse
-    from data.job_templates import JOB_TEMPLATES, ROLE_LEVEL_TEMPLATES
-    from utils.security import check_api_key, is_rate_limited
+    from utils.security import check_admin_token, check_api_key, is_rate_limited, is_tenant_key
     from utils.config import config
     from utils.logger import logger
     from backend.utils.logger import logger
@@ -37,6 +41,12 @@ def security_guard(request: Request, x_api_key: str = Header(default="")):
     return True
 
 
+def admin_guard(x_admin_token: str = Header(default="")):
+    if not check_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token missing, invalid or not configured.")
+    return True
+
+
 @router.get("/status")
 async def evaluation_status():
     """Report API key presence and upstream reachability."""
@@ -77,13 +87,14 @@ async def evaluate_resume(
     job_description: str = Form(...),
     resume_text: str = Form(...),
     intern_level: str = Form("general"),
+    template_id: str = Form(""),
+    x_api_key: str = Header(default=""),
     _: bool = Depends(security_guard),
 ):
     """Evaluate resume against job description"""
     try:
-        # Clean inputs
+        # Clean inputs; the evaluator cleans the JD once per distinct posting in its JD analysis.
         cleaned_resume = text_cleaner.clean_text(resume_text)
-        cleaned_job_desc = text_cleaner.clean_text(job_description)
 
         if len(cleaned_resume) > config.MAX_TEXT_LENGTH:
             cleaned_resume = cleaned_resume[: config.MAX_TEXT_LENGTH]
@@ -91,9 +102,11 @@ async def evaluate_resume(
         # Get AI evaluation
         evaluation_result = ai_evaluator.evaluate_resume(
             job_title=job_title,
-            job_description=cleaned_job_desc,
+            job_description=job_description,
             resume_text=cleaned_resume,
-            intern_level=intern_level
+            intern_level=intern_level,
+            template_id=template_id or None,
+            api_key=_tenant_key(x_api_key),
         )
         
         return EvaluationResponse(**evaluation_result)
@@ -102,6 +115,25 @@ async def evaluate_resume(
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
 
+@router.post("/levels")
+async def evaluate_levels(
+    job_description: str = Form(...),
+    resume_text: str = Form(...),
+    template_id: str = Form(""),
+    x_api_key: str = Header(default=""),
+    _: bool = Depends(security_guard),
+):
+    """Keyword scores for every intern level at once, so the UI can switch levels without re-evaluating"""
+    try:
+        cleaned_resume = text_cleaner.clean_text(resume_text)
+        levels = ai_evaluator.keyword_levels(
+            job_description, cleaned_resume, template_id=template_id or None, api_key=_tenant_key(x_api_key)
+        )
+        return {"levels": levels, "semantic_status": ai_evaluator.semantic_status()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def follow_up_chat(
     question: str = Form(...),
@@ -116,7 +148,7 @@ async def follow_up_chat(
     """
     try:
         cleaned_resume = text_cleaner.clean_text(resume_text)
-        cleaned_job_desc = text_cleaner.clean_text(job_description)
+        cleaned_job_desc = ai_evaluator.jd_analyzer.analyze(job_description).text
         evaluation = json.loads(evaluation_json) if evaluation_json else {}
         result = ai_evaluator.chat_follow_up(
             question=question,
@@ -130,34 +162,108 @@ async def follow_up_chat(
         logger.error(f"Chat failed: {e}")
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
+def _tenant_key(x_api_key: str) -> Optional[str]:
+    """The caller's key when it is a configured tenant key, so only tenants reach dictionary lookups."""
+    return x_api_key if is_tenant_key(x_api_key) else None
+
+
+def _require_tenant(x_api_key: str) -> str:
+    if not is_tenant_key(x_api_key):
+        raise HTTPException(
+            status_code=403, detail="Custom concept dictionaries need a tenant API key (TENANT_API_KEYS)."
+        )
+    return x_api_key
+
+
+@router.put("/concepts")
+async def upload_concepts(
+    concepts: Dict[str, Any] = Body(...),
+    x_api_key: str = Header(default=""),
+    _: bool = Depends(security_guard),
+):
+    """Upload this API key's concept dictionary (same shape as BASE_CONCEPTS); used by /evaluate/ afterwards"""
+    api_key = _require_tenant(x_api_key)
+    try:
+        matcher = ai_evaluator.matchers.register_tenant(api_key, concepts)
+    except TenantQuotaError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {
+        "fingerprint": matcher.index.fingerprint,
+        "concepts": len(matcher.concepts),
+        "patterns": matcher.index.pattern_count,
+    }
+
+
+@router.get("/concepts")
+async def get_concepts(x_api_key: str = Header(default=""), _: bool = Depends(security_guard)):
+    """This API key's uploaded concept dictionary"""
+    loaded = ai_evaluator.matchers.tenants.load(_require_tenant(x_api_key))
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="No custom concept dictionary for this API key.")
+    return {"concepts": loaded[1]}
+
+
+@router.delete("/concepts")
+async def delete_concepts(x_api_key: str = Header(default=""), _: bool = Depends(security_guard)):
+    """Remove this API key's dictionary; evaluations fall back to template/default concepts"""
+    return {"deleted": ai_evaluator.matchers.remove_tenant(_require_tenant(x_api_key))}
+
+
+@router.get("/matchers/stats")
+async def matcher_stats(_: bool = Depends(admin_guard)):
+    """Compiled concept-set matcher cache: size, hit rate and compile times (admin only: lists tenant sets)"""
+    return ai_evaluator.matchers.stats()
+
+
+@router.post("/admin/reload")
+async def reload_catalog(wait: bool = False, _: bool = Depends(admin_guard)):
+    """Rebuild concepts, templates and compiled matchers from the data files without a restart"""
+    if wait:
+        return ai_evaluator.catalog.reload()
+    started = ai_evaluator.catalog.reload_in_background()
+    return {"status": "started" if started else "already_running", **ai_evaluator.catalog.status()}
+
+
+@router.get("/admin/catalog")
+async def catalog_status(_: bool = Depends(admin_guard)):
+    """Current catalog version and reload history"""
+    return ai_evaluator.catalog.status()
+
+
+@router.get("/admin/telemetry")
+async def match_telemetry(include_tenants: bool = False, _: bool = Depends(admin_guard)):
+    """Per-concept/synonym hit counts (exact, fuzzy, semantic) and stage timings of compiled matchers"""
+    return {
+        "matchers": ai_evaluator.matchers.telemetry(include_tenants=include_tenants),
+        "embedding_cache": ai_evaluator.catalog.embedder.cache_stats(),
+        "embedding_service": ai_evaluator.catalog.embedder.service_stats(),
+    }
+
+
+@router.post("/admin/telemetry/dump")
+async def dump_match_telemetry(reset: bool = False, include_tenants: bool = False, _: bool = Depends(admin_guard)):
+    """Write match telemetry to MATCH_TELEMETRY_PATH, optionally starting a new counting window"""
+    registry = ai_evaluator.matchers
+    snapshots = registry.telemetry(include_tenants=include_tenants)
+    path = dump_telemetry(snapshots, config.MATCH_TELEMETRY_PATH)
+    if reset:
+        for _key, matcher in registry.matchers.items():
+            if matcher.telemetry is not None:
+                matcher.telemetry.reset()
+    return {"path": path, "matchers": len(snapshots), "reset": reset}
+
+
 @router.get("/job-templates")
 async def get_job_templates():
     """Get available job templates"""
-    templates = {}
-    for key, value in JOB_TEMPLATES.items():
-        entry = {
-            "title": value.get("title"),
-            "description": value.get("description"),
-        }
-        if "variants" in value:
-            entry["variants"] = value["variants"]
-        if key in ROLE_LEVEL_TEMPLATES:
-            entry["levels"] = ROLE_LEVEL_TEMPLATES[key]["levels"]
-            entry["bonus_signals"] = ROLE_LEVEL_TEMPLATES[key]["bonus_signals"]
-        templates[key] = entry
-
-    return {"templates": templates}
+    return {"templates": ai_evaluator.catalog.current.template_listing}
 
 @router.get("/job-templates/{template_id}")
 async def get_job_template(template_id: str):
     """Get specific job template"""
-    if template_id not in JOB_TEMPLATES:
+    template = ai_evaluator.catalog.current.job_template(template_id)
+    if template is None:
         raise HTTPException(status_code=404, detail="Template not found")
-
-    template = JOB_TEMPLATES[template_id]
-    profile = ROLE_LEVEL_TEMPLATES.get(template_id) or ROLE_LEVEL_TEMPLATES.get("default", {})
-    if profile:
-        template = dict(template)
-        template["levels"] = profile.get("levels", {})
-        template["bonus_signals"] = profile.get("bonus_signals", [])
     return template
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Dict
+from typing import Dict, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -10,15 +10,27 @@ from urllib3.util.retry import Retry
 try:
     from backend.utils.config import config
     from backend.utils.logger import logger
-    from backend.services.keyword_matcher import KeywordMatcher
+    from backend.services.catalog import CatalogManager
+    from backend.services.jd_analysis import JDAnalysis, JDAnalyzer
+    from backend.services.keyword_matcher import LEVEL_MULTIPLIERS, KeywordMatcher
+    from backend.services.match_result import MatchResult
+    from backend.services.matcher_registry import MatcherRegistry
     from backend.services.quality_gate import QualityGate
+    from backend.services.semantic_embedder import SemanticEmbedder
+    from backend.services.text_index import TextIndex
     from backend.utils.cache import ResponseCache
     from backend.utils.security import scrub_pii
 except ImportError:
     from utils.config import config
     from utils.logger import logger
-    from services.keyword_matcher import KeywordMatcher
+    from services.catalog import CatalogManager
+    from services.jd_analysis import JDAnalysis, JDAnalyzer
+    from services.keyword_matcher import LEVEL_MULTIPLIERS, KeywordMatcher
+    from services.match_result import MatchResult
+    from services.matcher_registry import MatcherRegistry
     from services.quality_gate import QualityGate
+    from services.semantic_embedder import SemanticEmbedder
+    from services.text_index import TextIndex
     from utils.cache import ResponseCache
     from utils.security import scrub_pii
 
@@ -27,8 +39,12 @@ class AIEvaluator:
     def __init__(self):
         self.api_key = config.DEEPSEEK_API_KEY
         self.api_url = config.DEEPSEEK_API_URL
-        self.keyword_matcher = KeywordMatcher()
+        # Concepts, templates and their compiled matchers; swapped as a whole on reload. With
+        # SEMANTIC_BACKGROUND_LOAD the model is loaded by catalog.warm_up() from the app lifespan.
+        self.catalog = CatalogManager(embedder=SemanticEmbedder(load=not config.SEMANTIC_BACKGROUND_LOAD))
         self.quality_gate = QualityGate()
+        # Cleaned text, index, flags and requirement bullets per distinct JD, shared across resumes.
+        self.jd_analyzer = JDAnalyzer()
         self.cache = ResponseCache(ttl_seconds=config.CACHE_TTL_SECONDS)
 
         self.session = requests.Session()
@@ -42,35 +58,62 @@ class AIEvaluator:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
+    @property
+    def matchers(self) -> MatcherRegistry:
+        return self.catalog.current.matchers
+
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        return self.matchers.for_template(None)
+
+    def semantic_status(self) -> str:
+        """ready, unavailable (no model: exact and fuzzy matching only) or warming_up (model still loading)."""
+        state = self.catalog.embedder.state
+        return state if state in ("ready", "unavailable") else "warming_up"
+
     def evaluate_resume(
         self,
         job_title: str,
         job_description: str,
         resume_text: str,
-        intern_level: str = "general"
+        intern_level: str = "general",
+        template_id: Optional[str] = None,
+        api_key: Optional[str] = None,
     ) -> Dict:
         """Evaluate resume against job description using DeepSeek API"""
         truncated_resume = (resume_text or "")[: config.MAX_TEXT_LENGTH]
+        jd = self.jd_analyzer.analyze(job_description)
+        # One snapshot for the whole request, so a concurrent reload cannot mix dictionary versions.
+        catalog = self.catalog.current
+        # The caller's own dictionary, else the template's concept set; its fingerprint and the
+        # catalog version key the cache, so nothing computed before a reload is served after it.
+        matcher = catalog.matchers.for_request(template_id, api_key)
+        # Results computed while the model is still loading lack semantic matches; keying on the
+        # status keeps them from being served once it is in.
+        semantic_status = self.semantic_status()
         cache_key = hashlib.sha256(
-            f"{job_title}:{job_description}:{truncated_resume}:{intern_level}".encode("utf-8")
+            f"{job_title}:{jd.fingerprint}:{truncated_resume}:{intern_level}:"
+            f"{catalog.version}:{matcher.index.fingerprint}:{semantic_status}".encode("utf-8")
         ).hexdigest()
         cached = self.cache.get(cache_key)
         if cached:
             cached["cache_status"] = "hit"
             return cached
 
+        # Normalize/tokenize the resume once; the JD side comes from its cached analysis.
+        resume_index = TextIndex(truncated_resume)
+
         if not self.api_key:
             logger.warning("DeepSeek API key not found, returning mock data")
-            keyword_report = self.keyword_matcher.evaluate(
-                resume_text=truncated_resume,
-                job_description=job_description,
-                intern_level=intern_level
+            keyword_report = self._keyword_report(
+                matcher, jd, truncated_resume, intern_level, catalog.version, resume_index=resume_index
             )
-            result = self._build_keyword_driven_fallback(keyword_report, job_description, truncated_resume)
+            result = self._build_keyword_driven_fallback(keyword_report, jd, truncated_resume)
+            result["semantic_status"] = semantic_status
             self.cache.set(cache_key, result)
             return result
 
-        prompt = self._build_evaluation_prompt(job_title, job_description, truncated_resume, intern_level)
+        prompt = self._build_evaluation_prompt(job_title, jd.text, truncated_resume, intern_level)
 
         try:
             headers = {
@@ -108,35 +151,87 @@ class AIEvaluator:
             # Parse JSON response from AI
             evaluation = self._parse_ai_response(ai_response)
 
-            keyword_report = self.keyword_matcher.evaluate(
-                resume_text=truncated_resume,
-                job_description=job_description,
-                intern_level=intern_level
+            keyword_report = self._keyword_report(
+                matcher, jd, truncated_resume, intern_level, catalog.version, resume_index=resume_index
             )
 
             evaluation["scores"]["keyword_match"] = keyword_report["score"]
             evaluation["missing_keywords"] = keyword_report["missing_keywords"]
             evaluation["keyword_matches"] = keyword_report.get("matches", [])
+            if "requirement_coverage" in keyword_report:
+                evaluation["requirement_coverage"] = keyword_report["requirement_coverage"]
 
-            quality = self.quality_gate.run(truncated_resume, job_description, evaluation["keyword_matches"])
+            quality = self.quality_gate.run(
+                truncated_resume, jd.text, evaluation["keyword_matches"], location_required=jd.location_required
+            )
             evaluation["quality_gates"] = quality
             evaluation["cache_status"] = "miss"
             evaluation["source"] = "ai"
+            evaluation["semantic_status"] = semantic_status
 
             self.cache.set(cache_key, evaluation)
             return evaluation
 
         except Exception as e:
             logger.error(f"AI API error: {scrub_pii(str(e))}")
-            keyword_report = self.keyword_matcher.evaluate(
-                resume_text=truncated_resume,
-                job_description=job_description,
-                intern_level=intern_level
+            keyword_report = self._keyword_report(
+                matcher, jd, truncated_resume, intern_level, catalog.version, resume_index=resume_index
             )
-            result = self._build_keyword_driven_fallback(keyword_report, job_description, truncated_resume)
+            result = self._build_keyword_driven_fallback(keyword_report, jd, truncated_resume)
+            result["semantic_status"] = semantic_status
             self.cache.set(cache_key, result)
             return result
 
+    def _keyword_match(
+        self,
+        matcher: KeywordMatcher,
+        jd: JDAnalysis,
+        resume_text: str,
+        catalog_version: str,
+        resume_index: Optional[TextIndex] = None,
+    ) -> MatchResult:
+        """
+        Level-independent keyword match, cached separately from per-level results so switching
+        intern levels re-scores the cached match instead of rescanning the resume. Keyed like
+        `evaluate`'s results (catalog version included), so a reload never serves an older match.
+        """
+        cache_key = hashlib.sha256(
+            f"match:{jd.fingerprint}:{resume_text}:{catalog_version}:{matcher.index.fingerprint}:"
+            f"{self.semantic_status()}".encode("utf-8")
+        ).hexdigest()
+        match_result = self.cache.get(cache_key)
+        if match_result is None:
+            match_result = matcher.match(resume_text, jd.text, resume_index=resume_index, jd=jd)
+            self.cache.set(cache_key, match_result)
+        return match_result
+
+    def _keyword_report(
+        self,
+        matcher: KeywordMatcher,
+        jd: JDAnalysis,
+        resume_text: str,
+        intern_level: str,
+        catalog_version: str,
+        resume_index: Optional[TextIndex] = None,
+    ) -> Dict:
+        match_result = self._keyword_match(matcher, jd, resume_text, catalog_version, resume_index=resume_index)
+        return matcher.score_level(match_result, intern_level)
+
+    def keyword_levels(
+        self,
+        job_description: str,
+        resume_text: str,
+        template_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> Dict[str, Dict]:
+        """Keyword scores for every intern level from one (cached) matching pass."""
+        truncated_resume = (resume_text or "")[: config.MAX_TEXT_LENGTH]
+        catalog = self.catalog.current
+        matcher = catalog.matchers.for_request(template_id, api_key)
+        jd = self.jd_analyzer.analyze(job_description)
+        match_result = self._keyword_match(matcher, jd, truncated_resume, catalog.version)
+        return {level: matcher.score_level(match_result, level) for level in LEVEL_MULTIPLIERS}
+
     def _get_system_prompt(self) -> str:
         return """You are a professional recruiter and AI resume analyst.
         Evaluate the resume against the provided job description.
@@ -250,7 +345,12 @@ class AIEvaluator:
             "summary": "Mock evaluation used when the AI response could not be parsed.",
         }
 
-    def _build_keyword_driven_fallback(self, keyword_report: Dict, job_description: str, resume_text: str) -> Dict:
+    def _build_keyword_driven_fallback(
+        self,
+        keyword_report: Dict,
+        jd: JDAnalysis,
+        resume_text: str,
+    ) -> Dict:
         """
         Build a deterministic evaluation using keyword coverage when the AI API is unavailable.
         Keeps scores tied to resume content to avoid always-100 results.
@@ -280,9 +380,9 @@ class AIEvaluator:
             suggestions.append("Quantify impact (latency, users, revenue, error-rate) per project.")
         suggestions.append("Ensure each project lists tech stack, tests, and debugging outcomes.")
 
-        quality = self.quality_gate.run(resume_text, job_description, matches)
+        quality = self.quality_gate.run(resume_text, jd.text, matches, location_required=jd.location_required)
 
-        return {
+        result = {
             "scores": {
                 "job_compatibility": job_compatibility,
                 "structure": structure,
@@ -306,6 +406,9 @@ class AIEvaluator:
                 "quantifying outcomes, and highlighting tests/debugging."
             ),
         }
+        if "requirement_coverage" in keyword_report:
+            result["requirement_coverage"] = keyword_report["requirement_coverage"]
+        return result
 
     def connectivity_check(self) -> Dict:
         """Best-effort check for API key presence and network reachability."""
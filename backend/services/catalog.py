@@ -0,0 +1,272 @@
+import hashlib
+import importlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    from backend.data import base_concepts, concept_sets, job_templates
+    from backend.services.matcher_registry import MatcherRegistry
+    from backend.services.semantic_embedder import SemanticEmbedder, dictionary_phrases, ngram_embedder
+    from backend.services.tenant_dictionaries import TenantDictionaryStore
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from data import base_concepts, concept_sets, job_templates
+    from services.matcher_registry import MatcherRegistry
+    from services.semantic_embedder import SemanticEmbedder, dictionary_phrases, ngram_embedder
+    from services.tenant_dictionaries import TenantDictionaryStore
+    from utils.config import config
+    from utils.logger import logger
+
+# Plain-data modules behind the catalog; editing any of them is picked up by a reload.
+_SOURCES = (base_concepts, concept_sets, job_templates)
+
+
+def catalog_version(*dictionaries: Dict) -> str:
+    """Content hash of the catalog dictionaries; unchanged data keeps its version across reloads."""
+    payload = json.dumps(dictionaries, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def template_listing(job_templates: Dict[str, Dict], role_level_templates: Dict[str, Dict]) -> Dict[str, Dict]:
+    """The GET /evaluate/job-templates payload, built once per snapshot instead of per request."""
+    templates = {}
+    for key, value in job_templates.items():
+        entry = {
+            "title": value.get("title"),
+            "description": value.get("description"),
+        }
+        if "variants" in value:
+            entry["variants"] = value["variants"]
+        if key in role_level_templates:
+            entry["levels"] = role_level_templates[key]["levels"]
+            entry["bonus_signals"] = role_level_templates[key]["bonus_signals"]
+        templates[key] = entry
+    return templates
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    One consistent generation of concepts, templates and the matchers compiled from them. A
+    request reads `CatalogManager.current` once and uses that snapshot throughout, so a reload
+    that lands mid-request never mixes old and new dictionaries.
+    """
+
+    version: str
+    generation: int
+    loaded_at: float
+    base_concepts: Dict[str, Dict]
+    concept_sets: Dict[str, Dict]
+    job_templates: Dict[str, Dict]
+    role_level_templates: Dict[str, Dict]
+    template_listing: Dict[str, Dict]
+    matchers: MatcherRegistry
+
+    def job_template(self, template_id: str) -> Optional[Dict]:
+        """A template merged with its role-level profile (falling back to the default profile)."""
+        if template_id not in self.job_templates:
+            return None
+        template = self.job_templates[template_id]
+        profile = self.role_level_templates.get(template_id) or self.role_level_templates.get("default", {})
+        if profile:
+            template = dict(template)
+            template["levels"] = profile.get("levels", {})
+            template["bonus_signals"] = profile.get("bonus_signals", [])
+        return template
+
+
+class CatalogManager:
+    """
+    Owns the current CatalogSnapshot and replaces it without a restart. Reloads re-import the data
+    modules, compile and warm a new registry (reusing compiled matchers whose concepts did not
+    change) and only then swap the reference, so requests never wait on a rebuild.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[SemanticEmbedder] = None,
+        tenants: Optional[TenantDictionaryStore] = None,
+        watch_seconds: Optional[float] = None,
+        store_directory: Optional[str] = None,
+    ):
+        self.embedder = embedder or SemanticEmbedder()
+        self.first_pass: Optional[SemanticEmbedder] = ngram_embedder() if config.SEMANTIC_NGRAM_FIRST_PASS else None
+        self.tenants = tenants or TenantDictionaryStore()
+        # Embedding artifact directory passed to every registry (None = EMBEDDING_STORE_DIR).
+        self.store_directory = store_directory
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._mtimes = self._source_mtimes()
+        self.reloads = 0
+        self.last_reload_ms = 0.0
+        self.last_error: Optional[str] = None
+        # Startup warm-up (model load, then every set's synonym embeddings); see warm_up().
+        self.warm_state = "pending"
+        self.warm_ms: Optional[float] = None
+        self.current = self._build(generation=0, previous=None, warm=False)
+        watch_seconds = config.CATALOG_WATCH_SECONDS if watch_seconds is None else watch_seconds
+        if watch_seconds > 0:
+            self.start_watcher(watch_seconds)
+
+    @staticmethod
+    def _source_mtimes() -> List[Optional[int]]:
+        mtimes = []
+        for module in _SOURCES:
+            try:
+                mtimes.append(os.stat(module.__file__).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def _build(self, generation: int, previous: Optional[CatalogSnapshot], warm: bool = True) -> CatalogSnapshot:
+        # N-gram embedders weigh by IDF over the dictionaries, so they follow this generation's
+        # phrases; a changed corpus yields new embedders, swapped in together with the snapshot.
+        phrases = dictionary_phrases(base_concepts.BASE_CONCEPTS, concept_sets.CONCEPT_SETS)
+        embedder = self.embedder.for_corpus(phrases)
+        first_pass = self.first_pass.for_corpus(phrases) if self.first_pass is not None else None
+        registry = MatcherRegistry(
+            embedder=embedder,
+            tenants=self.tenants,
+            base_concepts=base_concepts.BASE_CONCEPTS,
+            concept_sets=concept_sets.CONCEPT_SETS,
+            job_templates=job_templates.JOB_TEMPLATES,
+            first_pass=first_pass,
+            store_directory=self.store_directory,
+        )
+        if previous is not None:
+            registry.adopt(previous.matchers)
+        if warm:
+            registry.warm()
+        else:
+            # Startup only needs the default set; the rest compile on first use as before.
+            registry.for_template(None)
+        return CatalogSnapshot(
+            version=catalog_version(
+                base_concepts.BASE_CONCEPTS,
+                concept_sets.CONCEPT_SETS,
+                job_templates.JOB_TEMPLATES,
+                job_templates.ROLE_LEVEL_TEMPLATES,
+            ),
+            generation=generation,
+            loaded_at=time.time(),
+            base_concepts=base_concepts.BASE_CONCEPTS,
+            concept_sets=concept_sets.CONCEPT_SETS,
+            job_templates=job_templates.JOB_TEMPLATES,
+            role_level_templates=job_templates.ROLE_LEVEL_TEMPLATES,
+            template_listing=template_listing(job_templates.JOB_TEMPLATES, job_templates.ROLE_LEVEL_TEMPLATES),
+            matchers=registry,
+        )
+
+    def reload(self) -> Dict:
+        """
+        Re-imports the data modules and swaps in a freshly compiled snapshot. A module that fails
+        to import (e.g. a syntax error mid-edit) leaves the current snapshot serving.
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            previous = self.current
+            self._mtimes = self._source_mtimes()
+            try:
+                for module in _SOURCES:
+                    importlib.reload(module)
+                snapshot = self._build(generation=previous.generation + 1, previous=previous)
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.error(f"Catalog reload failed, keeping version {previous.version}: {self.last_error}")
+                snapshot = None
+            else:
+                # Single reference assignment: readers see either the old snapshot or the new one.
+                self.current = snapshot
+                self.embedder, self.first_pass = snapshot.matchers.embedder, snapshot.matchers.first_pass
+                self.reloads += 1
+                self.last_error = None
+                self.last_reload_ms = round((time.perf_counter() - start) * 1000, 2)
+                logger.info(f"Catalog reloaded in {self.last_reload_ms:.1f}ms ({previous.version} -> {snapshot.version})")
+        if snapshot is None:
+            return {"status": "failed", **self.status()}
+        return {"status": "reloaded" if snapshot.version != previous.version else "unchanged", **self.status()}
+
+    def reload_in_background(self) -> bool:
+        """Starts a reload thread; False when one is already running."""
+        if self._reload_lock.locked():
+            return False
+        threading.Thread(target=self.reload, name="catalog-reload", daemon=True).start()
+        return True
+
+    def warm_up(self) -> None:
+        """
+        Loads the semantic model, then compiles every concept set and encodes its synonyms. Until
+        the model is in, matchers skip the semantic stage instead of blocking requests on it.
+        """
+        self.warm_state = "warming"
+        start = time.perf_counter()
+        try:
+            self.embedder.load()
+            self.current.matchers.warm()
+        except Exception as exc:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            self.warm_state = "failed"
+            logger.error(f"Warm-up failed: {self.last_error}")
+        else:
+            self.warm_state = "ready"
+        self.warm_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Warm-up {self.warm_state} in {self.warm_ms:.0f}ms (semantic model: {self.embedder.state})")
+
+    def warm_up_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.warm_up, name="catalog-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def readiness(self) -> Dict:
+        """Warm-up progress of the model, compiled matchers and embedding cache, for GET /ready."""
+        registry = self.current.matchers
+        matchers = [matcher for _, matcher in registry.matchers.items()]
+        return {
+            "ready": self.warm_state == "ready",
+            "state": self.warm_state,
+            "warm_ms": self.warm_ms,
+            "error": self.last_error if self.warm_state == "failed" else None,
+            "model": self.embedder.status(),
+            "index": {
+                "matchers": len(matchers),
+                "embedded": sum(self.embedder.model_name in matcher._semantic_matrices for matcher in matchers),
+            },
+            "embedding_cache": self.embedder.cache_stats(),
+        }
+
+    def start_watcher(self, interval: float) -> None:
+        """Polls the data files' modification times and reloads after an edit."""
+        if self._watcher is not None:
+            return
+
+        def watch() -> None:
+            while not self._stop.wait(interval):
+                if self._source_mtimes() != self._mtimes:
+                    self.reload()
+
+        self._watcher = threading.Thread(target=watch, name="catalog-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        self._stop.set()
+
+    def status(self) -> Dict:
+        snapshot = self.current
+        return {
+            "version": snapshot.version,
+            "generation": snapshot.generation,
+            "loaded_at": snapshot.loaded_at,
+            "reloading": self._reload_lock.locked(),
+            "reloads": self.reloads,
+            "last_reload_ms": self.last_reload_ms,
+            "last_error": self.last_error,
+            "watching": self._watcher is not None and not self._stop.is_set(),
+            "templates": len(snapshot.job_templates),
+            "concept_sets": len(snapshot.concept_sets) + 1,
+        }
@@ -0,0 +1,103 @@
+import re
+from typing import List, Optional, Tuple
+
+try:
+    from backend.services.text_index import normalize_text
+except ImportError:
+    from services.text_index import normalize_text
+
+# Lower rank is kept first when a resume produces more chunks than the budget allows.
+SECTION_PRIORITY = {
+    "experience": 0,
+    "projects": 1,
+    "skills": 2,
+    "other": 3,
+    "education": 4,
+    "extras": 5,
+}
+
+_SECTION_HEADINGS = {
+    "experience": ("experience", "work experience", "professional experience", "employment", "work history",
+                   "internship", "internships", "relevant experience"),
+    "projects": ("projects", "personal projects", "academic projects", "selected projects"),
+    "skills": ("skills", "technical skills", "technologies", "tools", "tech stack"),
+    "education": ("education", "coursework", "relevant coursework", "certifications"),
+    "extras": ("interests", "hobbies", "references", "activities", "volunteering", "languages"),
+}
+_HEADING_TO_SECTION = {heading: section for section, headings in _SECTION_HEADINGS.items() for heading in headings}
+
+
+def _section_for(line: str) -> Optional[str]:
+    """Section name when the line is a bare heading ("Work Experience", "SKILLS:"), else None."""
+    heading = normalize_text(line).strip(" :#&")
+    if len(heading.split()) > 4:
+        return None
+    return _HEADING_TO_SECTION.get(heading)
+
+
+class ResumeChunker:
+    """
+    Turns resume text into a bounded list of chunks for the semantic stage. Repeated lines are
+    dropped, tiny fragments are merged into windows of at least `min_words`, long sentences are
+    cut into overlapping windows of `max_words`, and at most `budget` chunks survive, chosen by
+    section priority (experience and projects first) and then document order.
+    """
+
+    def __init__(self, budget: int = 48, min_words: int = 6, max_words: int = 40):
+        self.budget = budget
+        self.min_words = min_words
+        self.max_words = max_words
+
+    def _windows(self, words: List[str]) -> List[List[str]]:
+        if len(words) <= self.max_words:
+            return [words]
+        stride = max(1, self.max_words * 3 // 4)
+        windows = []
+        for start in range(0, len(words), stride):
+            windows.append(words[start:start + self.max_words])
+            if start + self.max_words >= len(words):
+                break
+        return windows
+
+    def sectioned_chunks(self, text: str) -> List[Tuple[str, str]]:
+        """All (section, chunk) pairs in document order, before the budget is applied."""
+        chunks: List[Tuple[str, str]] = []
+        seen = set()
+        section = "other"
+        pending: List[str] = []
+
+        def flush() -> None:
+            if pending:
+                chunks.append((section, " ".join(pending)))
+                pending.clear()
+
+        for line in (text or "").splitlines():
+            heading = _section_for(line)
+            if heading:
+                flush()
+                section = heading
+                continue
+            for sentence in re.split(r"[.;]", line):
+                words = sentence.split()
+                key = normalize_text(sentence)
+                if not words or key in seen:
+                    continue
+                seen.add(key)
+                if len(words) >= self.min_words:
+                    flush()
+                    chunks.extend((section, " ".join(window)) for window in self._windows(words))
+                    continue
+                pending.extend(words)
+                if len(pending) >= self.min_words:
+                    flush()
+        flush()
+        return [(name, chunk) for name, chunk in chunks if len(chunk) > 5]
+
+    def chunk(self, text: str) -> Tuple[List[str], int]:
+        """Returns (chunks within budget in document order, number of chunks dropped)."""
+        sectioned = self.sectioned_chunks(text)
+        if len(sectioned) <= self.budget:
+            return [chunk for _, chunk in sectioned], 0
+        ranked = sorted(range(len(sectioned)), key=lambda i: (SECTION_PRIORITY[sectioned[i][0]], i))
+        kept = sorted(ranked[:self.budget])
+        return [sectioned[i][1] for i in kept], len(sectioned) - self.budget
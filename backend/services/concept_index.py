@@ -0,0 +1,111 @@
+import hashlib
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from backend.services.text_index import TextIndex, normalize_text, stem, tokenize
+except ImportError:
+    from services.text_index import TextIndex, normalize_text, stem, tokenize
+
+_MATCHES = "\0"
+
+
+def concept_fingerprint(concepts: Dict[str, Dict]) -> str:
+    """Stable short hash of a concept dictionary, used to key compiled matchers and cached matches."""
+    payload = json.dumps(concepts, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ConceptIndex:
+    """
+    All concept synonyms compiled once into a character trie keyed by canonical phrase form.
+    A single left-to-right pass over the resume tokens reports every concept that has an exact hit.
+
+    With `morphology` on, tokens are stemmed and joined without separators, so inflections and
+    hyphen/space variants ("bugfix", "bug fix", "bug-fix", "bugfixes") compile to one pattern.
+    """
+
+    def __init__(self, concepts: Dict[str, Dict], morphology: bool = False):
+        self.concepts = concepts
+        self.morphology = morphology
+        self.fingerprint = concept_fingerprint(concepts)
+        self._separator = "" if morphology else " "
+        self._trie: Dict = {}
+        self.phrase_count = 0
+        self.pattern_count = 0
+        self.vocabulary: Set[str] = set()
+        # Every synonym in dictionary order; concept rows are contiguous so embedding matrices
+        # built from this list can be sliced per concept with `spans`.
+        self.synonyms: List[str] = []
+        self.spans: Dict[str, Tuple[int, int]] = {}
+        # Row of each concept in per-concept matrices such as the centroid embeddings.
+        self.concept_rows: Dict[str, int] = {key: row for row, key in enumerate(concepts)}
+
+        for concept_key, concept in concepts.items():
+            start = len(self.synonyms)
+            self.synonyms.extend(concept["synonyms"])
+            self.spans[concept_key] = (start, len(self.synonyms))
+            for position, phrase in enumerate(concept["synonyms"]):
+                tokens = self.canonical_tokens(tokenize(normalize_text(phrase)))
+                if not tokens:
+                    continue
+                self.phrase_count += 1
+                self.vocabulary.update(tokens)
+                node = self._trie
+                for char in self._separator.join(tokens):
+                    node = node.setdefault(char, {})
+                entries = node.setdefault(_MATCHES, [])
+                if not entries:
+                    self.pattern_count += 1
+                # Variants that fold onto an existing pattern only keep the concept's first synonym
+                # as the hit, but every folded synonym row is reported to `scan(rows=...)`.
+                existing = next((entry for entry in entries if entry[0] == concept_key), None)
+                if existing is None:
+                    entries.append((concept_key, position, phrase, [start + position]))
+                else:
+                    existing[3].append(start + position)
+
+    @property
+    def deduplicated(self) -> int:
+        """Synonyms that collapsed onto an already compiled pattern."""
+        return self.phrase_count - self.pattern_count
+
+    def canonical_tokens(self, tokens: List[str]) -> List[str]:
+        return [stem(token) for token in tokens] if self.morphology else tokens
+
+    def tokens_for(self, text_index: TextIndex) -> List[str]:
+        """Resume tokens in this index's canonical form (stemmed once per request and cached)."""
+        return text_index.stemmed_tokens() if self.morphology else text_index.tokens
+
+    def scan(self, tokens: List[str], rows: Optional[Set[int]] = None) -> Dict[str, Tuple[int, str]]:
+        """
+        Returns {concept_key: (synonym_position, phrase)} keeping, per concept, the synonym that is
+        listed first in the dictionary so matched phrases stay stable regardless of resume order.
+        `rows` collects the row (in `synonyms`) of every synonym that matched, winners or not.
+        `tokens` must already be canonical (see `tokens_for`).
+        """
+        hits: Dict[str, Tuple[int, str]] = {}
+        root = self._trie
+        separator = self._separator
+        total = len(tokens)
+        for start in range(total):
+            node = root
+            for offset in range(start, total):
+                if offset > start and separator:
+                    node = node.get(separator)
+                    if node is None:
+                        break
+                for char in tokens[offset]:
+                    node = node.get(char)
+                    if node is None:
+                        break
+                if node is None:
+                    break
+                # Patterns only end on token boundaries, which keeps "git" out of "github".
+                for concept_key, position, phrase, synonym_rows in node.get(_MATCHES, ()):
+                    if rows is not None:
+                        rows.update(synonym_rows)
+                    current = hits.get(concept_key)
+                    if current is None or position < current[0]:
+                        hits[concept_key] = (position, phrase)
+        return hits
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+try:
+    import onnxruntime
+    from tokenizers import Tokenizer
+except Exception:  # pragma: no cover - optional dependency
+    onnxruntime = None
+    Tokenizer = None
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+class EmbeddingBackendError(RuntimeError):
+    """A backend's runtime or model files are missing."""
+
+
+class EmbeddingBackend(ABC):
+    """
+    What SemanticEmbedder needs from an encoder: a `name` that identifies its vector space (it
+    keys caches and embedding artifacts) and `encode(texts, normalize_embeddings=True)` returning
+    one row per text, or a single vector for a string, like SentenceTransformer.encode.
+    Subclasses implement `encode_rows`; NGramVectorizer and EmbeddingServiceClient have the same
+    shape without subclassing.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def encode_rows(self, texts: List[str]) -> np.ndarray:
+        """Unnormalized float32 rows, one per text."""
+
+    def encode(self, texts: Union[str, List[str]], normalize_embeddings: bool = True) -> np.ndarray:
+        single = isinstance(texts, str)
+        matrix = np.asarray(self.encode_rows([texts] if single else list(texts)), dtype=np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix[0] if single else matrix
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """The sentence-transformers model (downloaded or from the local cache)."""
+
+    def __init__(self, model_name: str):
+        if SentenceTransformer is None:
+            raise EmbeddingBackendError("sentence-transformers is not installed")
+        self.model = SentenceTransformer(model_name)
+        self.name = model_name
+
+    def encode_rows(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, normalize_embeddings=False)
+
+    def encode(self, texts: Union[str, List[str]], normalize_embeddings: bool = True) -> np.ndarray:
+        return self.model.encode(texts, normalize_embeddings=normalize_embeddings)
+
+
+class OnnxBackend(EmbeddingBackend):
+    """
+    A sentence-transformers model exported to ONNX, run with ONNX Runtime on CPU. `model_dir`
+    holds model.onnx and tokenizer.json (e.g. from `optimum-cli export onnx --model <name> <dir>`);
+    token embeddings are mean-pooled over the attention mask like the original pooling layer.
+    """
+
+    def __init__(self, model_dir: str, max_length: int = 256, threads: int = 0):
+        if onnxruntime is None or Tokenizer is None:
+            raise EmbeddingBackendError("onnxruntime and tokenizers are not installed")
+        model_path = os.path.join(model_dir, "model.onnx")
+        tokenizer_path = os.path.join(model_dir, "tokenizer.json")
+        if not (os.path.exists(model_path) and os.path.exists(tokenizer_path)):
+            raise EmbeddingBackendError(f"{model_dir} must contain model.onnx and tokenizer.json")
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.inputs = {node.name for node in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        with open(model_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:8]
+        self.name = f"onnx-{os.path.basename(os.path.normpath(model_dir))}-{digest}"
+
+    def encode_rows(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        feeds = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        tokens = self.session.run(None, {name: value for name, value in feeds.items() if name in self.inputs})[0]
+        mask = feeds["attention_mask"][:, :, None].astype(np.float32)
+        return (tokens * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+
+class HashBackend(EmbeddingBackend):
+    """
+    Deterministic fake for tests and CI benchmarks: each word and word pair is hashed to a signed
+    unit in `dim` dimensions, so texts sharing words score above zero and identical texts score 1.
+    No model, no download, and the same vectors on every machine and run.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.name = f"hash-{dim}"
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD_RE.findall(text.lower())
+        return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+    def encode_rows(self, texts: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                matrix[row, value % self.dim] += 1.0 if value >> 63 else -1.0
+        return matrix
+
@@ -0,0 +1,377 @@
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+try:
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from utils.config import config
+    from utils.logger import logger
+
+_HEADER = struct.Struct("!I")
+
+
+class EmbeddingServiceError(RuntimeError):
+    pass
+
+
+def _send(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _receive(sock: socket.socket) -> bytes:
+    def exactly(size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("embedding service closed the connection")
+            data.extend(chunk)
+        return bytes(data)
+
+    (size,) = _HEADER.unpack(exactly(_HEADER.size))
+    return exactly(size)
+
+
+class _Pending:
+    __slots__ = ("texts", "done", "result", "error")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[str] = None
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent encode calls: one thread takes the first waiting request, collects more
+    for up to `max_wait_ms` (or until `max_batch` texts) and encodes them all in one model call.
+    Tracks queue depth and a power-of-two histogram of batch sizes (in texts).
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], max_batch: int = 64, max_wait_ms: float = 5.0):
+        self.encode = encode
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Optional[_Pending]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+        self.encode_seconds = 0.0
+        self.max_queue_depth = 0
+        self.histogram: Dict[int, int] = {}
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> np.ndarray:
+        pending = _Pending(texts)
+        self._queue.put(pending)
+        with self._lock:
+            self.requests += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        pending.done.wait()
+        if pending.error is not None:
+            raise EmbeddingServiceError(pending.error)
+        return pending.result
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first: _Pending) -> List[_Pending]:
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if pending is None:
+                # Stop after this batch.
+                self._queue.put(None)
+                break
+            batch.append(pending)
+            size += len(pending.texts)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._fail_waiting("embedding service is shutting down")
+                return
+            batch = self._collect(first)
+            texts = [text for pending in batch for text in pending.texts]
+            start = time.perf_counter()
+            try:
+                matrix = self.encode(texts) if texts else np.zeros((0, 0), dtype=np.float32)
+            except Exception as exc:
+                for pending in batch:
+                    pending.error = f"{type(exc).__name__}: {exc}"
+                    pending.done.set()
+                continue
+            elapsed = time.perf_counter() - start
+            offset = 0
+            for pending in batch:
+                pending.result = matrix[offset:offset + len(pending.texts)]
+                offset += len(pending.texts)
+                pending.done.set()
+            bucket = 1 << (max(len(texts), 1).bit_length() - 1)
+            with self._lock:
+                self.batches += 1
+                self.texts += len(texts)
+                self.encode_seconds += elapsed
+                self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def _fail_waiting(self, error: str) -> None:
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if pending is not None:
+                pending.error = error
+                pending.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self.max_queue_depth,
+                "requests": self.requests,
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "encode_ms": round(self.encode_seconds * 1000, 2),
+                # Batches by size in texts, bucketed to powers of two ("4" counts 4-7).
+                "batch_sizes": {str(bucket): count for bucket, count in sorted(self.histogram.items())},
+            }
+
+
+class EmbeddingServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Serves one in-memory model to every worker over a Unix socket. Each connection is handled on
+    its own thread; encode requests from all of them go through the shared MicroBatcher.
+
+    Frames are a 4-byte big-endian length followed by a JSON request ({"op": "encode" | "info" |
+    "stats"}); an encode reply is a JSON header frame followed by a frame of float32 rows.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, model, info: Dict[str, Any], max_batch: int = 64, max_wait_ms: float = 5.0):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.info = info
+        self.connections = set()
+        self.batcher = MicroBatcher(
+            lambda texts: np.asarray(model.encode(texts, normalize_embeddings=True), dtype=np.float32),
+            max_batch=max_batch,
+            max_wait_ms=max_wait_ms,
+        )
+        super().__init__(socket_path, _EmbeddingHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Hang up on connected workers so their clients fall back right away instead of timing out.
+        for connection in list(self.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.batcher.stop()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class _EmbeddingHandler(socketserver.BaseRequestHandler):
+    def setup(self) -> None:
+        self.server.connections.add(self.request)
+
+    def finish(self) -> None:
+        self.server.connections.discard(self.request)
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request = json.loads(_receive(self.request))
+            except (ConnectionError, OSError, ValueError):
+                return
+            op = request.get("op")
+            try:
+                if op == "encode":
+                    matrix = np.ascontiguousarray(self.server.batcher.submit(list(request["texts"])), dtype=np.float32)
+                    _send(self.request, json.dumps({"ok": True, "shape": list(matrix.shape)}).encode("utf-8"))
+                    _send(self.request, matrix.tobytes())
+                elif op == "info":
+                    _send(self.request, json.dumps({"ok": True, **self.server.info}).encode("utf-8"))
+                elif op == "stats":
+                    _send(self.request, json.dumps({"ok": True, **self.server.batcher.stats()}).encode("utf-8"))
+                else:
+                    _send(self.request, json.dumps({"ok": False, "error": f"unknown op {op!r}"}).encode("utf-8"))
+            except EmbeddingServiceError as exc:
+                _send(self.request, json.dumps({"ok": False, "error": str(exc)}).encode("utf-8"))
+            except OSError:
+                return
+
+
+class EmbeddingServiceClient:
+    """
+    Stands in for a model (`encode(texts, normalize_embeddings=True)`) by calling the shared
+    embedding service. Each thread keeps its own connection. When the service cannot be reached,
+    encoding falls back to an in-process copy of the same model (built on first need by
+    `fallback(backend, model_name)` from the service's info) and the service is retried after
+    `retry_seconds`.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        info: Dict[str, Any],
+        fallback: Callable[[str, str], Any],
+        timeout: float = 10.0,
+        retry_seconds: float = 30.0,
+    ):
+        self.socket_path = socket_path
+        self.info = info
+        self.name = info["model"]
+        self.backend = info["backend"]
+        self.timeout = timeout
+        self.retry_seconds = retry_seconds
+        self._fallback = fallback
+        self._local = None
+        self._local_lock = threading.Lock()
+        self._connections = threading.local()
+        self._retry_at = 0.0
+        self.fallback_calls = 0
+
+    @classmethod
+    def connect(cls, socket_path: str, fallback: Callable[[str, str], Any], timeout: float = 10.0) -> Optional["EmbeddingServiceClient"]:
+        """A client when the service answers; None (fall back to loading in-process) otherwise."""
+        client = cls(socket_path, {"model": "", "backend": ""}, fallback, timeout=timeout)
+        try:
+            info = client._call({"op": "info"})
+        except (OSError, EmbeddingServiceError) as exc:
+            logger.warning(f"Embedding service at {socket_path} unavailable ({exc}); loading the model in-process")
+            return None
+        client.info = info
+        client.name = info["model"]
+        client.backend = info["backend"]
+        return client
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._connections, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._connections.sock = sock
+        return sock
+
+    def _drop_connection(self) -> None:
+        sock = getattr(self._connections, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._connections.sock = None
+
+    def _call(self, request: Dict[str, Any], payload: bool = False):
+        try:
+            sock = self._connection()
+            _send(sock, json.dumps(request).encode("utf-8"))
+            header = json.loads(_receive(sock))
+            if not header.get("ok"):
+                raise EmbeddingServiceError(header.get("error", "embedding service error"))
+            if not payload:
+                header.pop("ok")
+                return header
+            matrix = np.frombuffer(_receive(sock), dtype=np.float32)
+            return matrix.reshape(header["shape"])
+        except OSError:
+            self._drop_connection()
+            raise
+
+    def _local_model(self):
+        with self._local_lock:
+            if self._local is None:
+                self._local = self._fallback(self.backend, self.name)
+                local_name = getattr(self._local, "name", self.name)
+                if self._local is None or local_name != self.name:
+                    self._local = None
+                    raise EmbeddingServiceError(
+                        f"In-process fallback cannot reproduce {self.name} (got {local_name}); check SEMANTIC_* settings"
+                    )
+            return self._local
+
+    def encode(self, texts: Union[str, List[str]], normalize_embeddings: bool = True) -> np.ndarray:
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        if time.monotonic() >= self._retry_at:
+            try:
+                matrix = self._call({"op": "encode", "texts": batch}, payload=True)
+                return matrix[0] if single else matrix
+            except (OSError, EmbeddingServiceError) as exc:
+                logger.warning(f"Embedding service failed ({exc}); encoding in-process for {self.retry_seconds:.0f}s")
+                self._retry_at = time.monotonic() + self.retry_seconds
+        self.fallback_calls += 1
+        return self._local_model().encode(texts, normalize_embeddings=normalize_embeddings)
+
+    def stats(self) -> Dict[str, Any]:
+        """The service's queue and batch statistics, plus this client's fallback usage."""
+        try:
+            remote = self._call({"op": "stats"})
+        except (OSError, EmbeddingServiceError) as exc:
+            remote = {"error": str(exc)}
+        return {"socket": self.socket_path, "fallback_calls": self.fallback_calls, **remote}
+
+
+def main() -> None:
+    """Runs the shared embedding service: python -m backend.services.embedding_service"""
+    try:
+        from backend.services.semantic_embedder import DEFAULT_MODEL_NAME, load_local_model
+    except ImportError:
+        from services.semantic_embedder import DEFAULT_MODEL_NAME, load_local_model
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--socket", default=config.EMBEDDING_SERVICE_SOCKET or "/tmp/resume-embeddings.sock")
+    parser.add_argument("--backend", default=config.SEMANTIC_BACKEND)
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME)
+    parser.add_argument("--max-batch", type=int, default=config.EMBEDDING_SERVICE_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=config.EMBEDDING_SERVICE_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    model, backend, error = load_local_model(args.backend.lower(), args.model)
+    if model is None:
+        raise SystemExit(f"Embedding model unavailable: {error}")
+    info = {"model": getattr(model, "name", args.model), "backend": backend}
+    server = EmbeddingServer(args.socket, model, info, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    logger.info(f"Embedding service for {info['model']} listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms build without a lock
+    fcntl = None
+
+try:
+    from backend.services.quantization import Embeddings, QuantizedMatrix, as_float
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from services.quantization import Embeddings, QuantizedMatrix, as_float
+    from utils.config import config
+    from utils.logger import logger
+
+
+def concept_centroids(synonym_matrix: Embeddings, spans: List[Tuple[int, int]]) -> Embeddings:
+    """
+    One L2-normalized mean vector per concept span; empty spans yield a zero row. Quantized
+    synonyms give quantized centroids.
+    """
+    dense = as_float(synonym_matrix)
+    centroids = np.zeros((len(spans), dense.shape[1]), dtype=np.float32)
+    for row, (start, end) in enumerate(spans):
+        if end <= start:
+            continue
+        mean = dense[start:end].mean(axis=0)
+        norm = np.linalg.norm(mean)
+        if norm:
+            centroids[row] = mean / norm
+    return QuantizedMatrix.quantize(centroids) if isinstance(synonym_matrix, QuantizedMatrix) else centroids
+
+
+def _scales_path(path: str) -> str:
+    return f"{path[:-len('.npy')]}-scales.npy"
+
+
+class EmbeddingStore:
+    """
+    Persists synonym and concept embeddings as .npy artifacts keyed by model name and a hash of
+    the concept dictionary. Workers open them with mmap so the pages are shared instead of each
+    process re-encoding and holding its own copy. Quantized matrices are stored as int8 codes
+    plus a "-scales.npy" sidecar.
+    """
+
+    def __init__(self, directory: Optional[str] = None, name: str = "concepts"):
+        self.directory = config.EMBEDDING_STORE_DIR if directory is None else directory
+        self.name = name
+
+    @staticmethod
+    def fingerprint(model_name: str, concepts: Dict[str, Dict]) -> str:
+        payload = json.dumps([[key, concept["synonyms"]] for key, concept in concepts.items()])
+        return hashlib.sha256(f"{model_name}:{payload}".encode("utf-8")).hexdigest()[:16]
+
+    def _prefix(self, model_name: str) -> str:
+        safe_model = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        return os.path.join(self.directory, f"{self.name}-{safe_model}")
+
+    def paths(self, model_name: str, concepts: Dict[str, Dict]) -> Tuple[str, str]:
+        base = f"{self._prefix(model_name)}-{self.fingerprint(model_name, concepts)}"
+        return f"{base}-synonyms.npy", f"{base}-concepts.npy"
+
+    @staticmethod
+    def _read(path: str) -> Embeddings:
+        matrix = np.load(path, mmap_mode="r")
+        if matrix.dtype == np.int8:
+            return QuantizedMatrix(matrix, np.load(_scales_path(path), mmap_mode="r"))
+        return matrix
+
+    def _load(self, synonyms_path: str, concepts_path: str) -> Optional[Tuple[Embeddings, Embeddings]]:
+        if not (os.path.exists(synonyms_path) and os.path.exists(concepts_path)):
+            return None
+        try:
+            return self._read(synonyms_path), self._read(concepts_path)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable embedding artifact: {exc}")
+            return None
+
+    def _write(self, path: str, matrix: Embeddings) -> None:
+        if isinstance(matrix, QuantizedMatrix):
+            # Scales first: once the codes file exists, its sidecar does too.
+            self._write(_scales_path(path), matrix.scales)
+            array = np.ascontiguousarray(matrix.codes, dtype=np.int8)
+        else:
+            array = np.ascontiguousarray(matrix, dtype=np.float32)
+        # Write next to the target and rename so readers never observe a partial file.
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _remove_stale(self, model_name: str, keep: Tuple[str, ...]) -> None:
+        for path in glob.glob(f"{glob.escape(self._prefix(model_name))}-*.npy"):
+            if path not in keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def disk_usage(self) -> int:
+        """Bytes of every artifact under this store's name, across models (e.g. one tenant's)."""
+        if not self.directory:
+            return 0
+        total = 0
+        for path in glob.glob(f"{glob.escape(os.path.join(self.directory, self.name))}-*.npy"):
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+
+    def remove_all(self) -> None:
+        """Deletes every artifact and lock file under this store's name."""
+        if not self.directory:
+            return
+        for path in glob.glob(f"{glob.escape(os.path.join(self.directory, self.name))}-*"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def build(self, embedder, index) -> Optional[Tuple[Embeddings, Embeddings]]:
+        """Encodes every synonym and derives concept centroids; returns (synonyms, concepts)."""
+        synonym_matrix = embedder.encode_batch(index.synonyms)
+        if synonym_matrix is None:
+            return None
+        return synonym_matrix, concept_centroids(synonym_matrix, list(index.spans.values()))
+
+    def load_or_build(self, embedder, index) -> Optional[Tuple[Embeddings, Embeddings]]:
+        """
+        Returns memory-mapped (synonyms, concepts) matrices, building and saving them first when the
+        artifact for this model + dictionary does not exist yet (e.g. after the concepts changed).
+        """
+        if not self.directory:
+            return self.build(embedder, index)
+
+        synonyms_path, concepts_path = self.paths(embedder.model_name, index.concepts)
+        loaded = self._load(synonyms_path, concepts_path)
+        if loaded is not None:
+            return loaded
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f"{self._prefix(embedder.model_name)}.lock", "w") as lock:
+            # Serialize builds so concurrently starting workers encode once and the rest load the result.
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            loaded = self._load(synonyms_path, concepts_path)
+            if loaded is not None:
+                return loaded
+
+            built = self.build(embedder, index)
+            if built is None:
+                return None
+            self._write(synonyms_path, built[0])
+            self._write(concepts_path, built[1])
+            sidecars = (_scales_path(synonyms_path), _scales_path(concepts_path))
+            self._remove_stale(embedder.model_name, keep=(synonyms_path, concepts_path, *sidecars))
+            logger.info(f"Built embedding artifact {os.path.basename(synonyms_path)}")
+
+        return self._load(synonyms_path, concepts_path) or built
+
+
+def main() -> None:
+    """Build step: pre-encodes BASE_CONCEPTS so workers start by mapping the artifact."""
+    try:
+        from backend.data.base_concepts import BASE_CONCEPTS
+        from backend.services.concept_index import ConceptIndex
+        from backend.services.semantic_embedder import SemanticEmbedder
+    except ImportError:
+        from data.base_concepts import BASE_CONCEPTS
+        from services.concept_index import ConceptIndex
+        from services.semantic_embedder import SemanticEmbedder
+
+    embedder = SemanticEmbedder()
+    if not embedder.model:
+        print("Embedding model unavailable; skipping artifact build.")
+        return
+    store = EmbeddingStore()
+    if store.load_or_build(embedder, ConceptIndex(BASE_CONCEPTS)) is not None:
+        print(f"Embedding artifact ready: {store.paths(embedder.model_name, BASE_CONCEPTS)[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def _max_distance(word: str) -> int:
+    # Short words get no tolerance ("go", "qa", "git" are too easy to hit by accident).
+    if len(word) < 5:
+        return 0
+    return 1 if len(word) <= 8 else 2
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {candidate[:i] + candidate[i + 1:] for candidate in frontier for i in range(len(candidate))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent transpositions)."""
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class DeletionIndex:
+    """
+    SymSpell-style typo index over the synonym vocabulary. Every vocabulary word is expanded into
+    its deletion neighborhood once, so correcting a resume token ("debuging", "troubleshoting")
+    is a handful of dict lookups instead of a scan over the dictionary.
+    """
+
+    def __init__(self, vocabulary: Iterable[str]):
+        self.vocabulary: Set[str] = {word for word in vocabulary if word.isalpha()}
+        self._deletes: Dict[str, Set[str]] = {}
+        for word in self.vocabulary:
+            for deleted in _deletes(word, _max_distance(word)):
+                self._deletes.setdefault(deleted, set()).add(word)
+        self.correct = lru_cache(maxsize=8192)(self._correct)
+
+    def _correct(self, token: str) -> Optional[str]:
+        """Closest vocabulary word within the allowed edit distance, or None."""
+        if token in self.vocabulary or not token.isalpha():
+            return None
+        limit = _max_distance(token)
+        if not limit:
+            return None
+
+        best: Optional[str] = None
+        best_distance = limit + 1
+        candidates: Set[str] = set()
+        for deleted in _deletes(token, limit):
+            candidates |= self._deletes.get(deleted, set())
+        for candidate in sorted(candidates):
+            # Typos and OCR slips rarely hit the first letter; requiring it keeps
+            # unrelated words ("capability" vs "scalability") from folding together.
+            if candidate[0] != token[0] or _max_distance(candidate) == 0:
+                continue
+            distance = edit_distance(token, candidate)
+            if distance <= min(limit, _max_distance(candidate)) and distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    def correct_tokens(self, tokens: List[str]) -> Optional[List[str]]:
+        """Returns the token list with typos replaced, or None when nothing was corrected."""
+        corrected = list(tokens)
+        changed = False
+        for position, token in enumerate(tokens):
+            replacement = self.correct(token)
+            if replacement:
+                corrected[position] = replacement
+                changed = True
+        return corrected if changed else None
@@ -0,0 +1,90 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from backend.services.jd_requirements import parse_requirements
+    from backend.services.quality_gate import QualityGate
+    from backend.services.text_cleaner import TextCleaner
+    from backend.services.text_index import TextIndex
+    from backend.utils.cache import LRUCache
+    from backend.utils.config import config
+except ImportError:
+    from services.jd_requirements import parse_requirements
+    from services.quality_gate import QualityGate
+    from services.text_cleaner import TextCleaner
+    from services.text_index import TextIndex
+    from utils.cache import LRUCache
+    from utils.config import config
+
+
+@dataclass(slots=True)
+class JDAnalysis:
+    """
+    Everything derived from a job description alone, computed once and shared by every resume
+    screened against it: the text the matcher and prompt see, its token index, the onsite/hybrid
+    and intern flags and the requirement bullets. Requirement embeddings (per embedder model) and
+    taxonomy skills (per taxonomy and token form) are filled in lazily by the matcher.
+    """
+
+    fingerprint: str  # hash of the normalized text and requirements; keys the evaluator's caches
+    text: str
+    index: TextIndex
+    location_required: bool
+    intern: bool
+    requirements: List[Tuple[str, str]]
+    requirement_embeddings: Dict[str, Optional[np.ndarray]] = field(default_factory=dict)
+    # (TaxonomyIndex, morphology) -> JD skills in JD order. Keyed by the index object itself, which
+    # the entry keeps alive, so a rebuilt taxonomy never reads another one's skills.
+    taxonomy_skills: Dict[Tuple[object, bool], List[int]] = field(default_factory=dict)
+
+
+def analyze_jd(job_description: str, clean: bool = True) -> JDAnalysis:
+    """
+    Builds a JDAnalysis (uncached). Bullets are parsed from the raw text, since cleaning collapses
+    the line breaks they depend on; `clean` applies TextCleaner to the text used for matching.
+    """
+    raw = job_description or ""
+    text = TextCleaner.clean_text(raw) if clean else raw
+    index = TextIndex(text)
+    requirements = parse_requirements(raw, max_items=config.REQUIREMENT_MAX_ITEMS)
+    # Covers everything derived here, so two postings with one fingerprint are interchangeable.
+    source = "\n".join([index.normalized] + [f"{section}:{requirement}" for section, requirement in requirements])
+    return JDAnalysis(
+        fingerprint=hashlib.sha1(source.encode("utf-8")).hexdigest(),
+        text=text,
+        index=index,
+        location_required=QualityGate().detect_location_requirement(text, index),
+        intern="intern" in index.normalized,
+        requirements=requirements,
+    )
+
+
+class JDAnalyzer:
+    """
+    LRU of JDAnalysis objects. Lookups go by a hash of the raw text first (no cleaning or
+    normalizing on a repeat), then by the fingerprint, so whitespace or casing variants of the
+    same posting share one analysis (and its requirement embeddings).
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.cache = LRUCache(max_entries=config.JD_ANALYSIS_CACHE_SIZE if max_entries is None else max_entries)
+
+    def analyze(self, job_description: str) -> JDAnalysis:
+        raw_key = ("raw", hashlib.sha1((job_description or "").encode("utf-8")).hexdigest())
+        analysis = self.cache.get(raw_key)
+        if analysis is not None:
+            return analysis
+        analysis = analyze_jd(job_description)
+        shared = self.cache.get(("normalized", analysis.fingerprint))
+        if shared is not None:
+            analysis = shared
+        else:
+            self.cache.set(("normalized", analysis.fingerprint), analysis)
+        self.cache.set(raw_key, analysis)
+        return analysis
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
@@ -0,0 +1,82 @@
+import re
+from typing import List, Tuple
+
+try:
+    from backend.services.text_index import normalize_text
+except ImportError:
+    from services.text_index import normalize_text
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪–]|\d{1,2}[.)])\s+(.*\S)")
+_SENTENCE_RE = re.compile(r"(?<=[.!?;])\s+|\n+")
+# Headings under which bullets are requirements; other headed lists ("Benefits", "About us") are skipped.
+_REQUIREMENT_HEADINGS = (
+    "responsibilities",
+    "requirements",
+    "qualifications",
+    "minimum qualifications",
+    "preferred qualifications",
+    "basic qualifications",
+    "what you'll do",
+    "what you will do",
+    "what you'll bring",
+    "what we're looking for",
+    "what we are looking for",
+    "must have",
+    "must haves",
+    "nice to have",
+    "nice to haves",
+    "skills",
+    "key skills",
+    "duties",
+    "key responsibilities",
+    "you will",
+    "you have",
+)
+_MIN_WORDS = 3
+
+
+def _heading(line: str) -> str:
+    """Normalized heading text when `line` is a short "Heading:" line, else ""."""
+    stripped = line.strip()
+    if not stripped.endswith(":") or _BULLET_RE.match(stripped):
+        return ""
+    heading = normalize_text(stripped).strip(" :#")
+    return heading if 0 < len(heading.split()) <= 5 else ""
+
+
+def parse_requirements(text: str, max_items: int = 24) -> List[Tuple[str, str]]:
+    """
+    (section, requirement) pairs from a job description's bullet lists. Bullets under headings
+    such as "Responsibilities:" or "Requirements:" (or before any heading) count; lists under
+    other headings are ignored. A JD without bullets falls back to its sentences, so free-form
+    postings still get a coverage report. Duplicates are dropped and at most `max_items` kept.
+    """
+    requirements: List[Tuple[str, str]] = []
+    seen = set()
+
+    def add(section: str, requirement: str) -> None:
+        key = normalize_text(requirement)
+        if len(key.split()) >= _MIN_WORDS and key not in seen and len(requirements) < max_items:
+            seen.add(key)
+            requirements.append((section, requirement))
+
+    section = "general"
+    relevant = True
+    bullets = 0
+    for line in (text or "").splitlines():
+        heading = _heading(line)
+        if heading:
+            section = heading
+            relevant = heading in _REQUIREMENT_HEADINGS
+            continue
+        bullet = _BULLET_RE.match(line)
+        if bullet:
+            bullets += 1
+            if relevant:
+                add(section, bullet.group(1).strip())
+    if bullets:
+        return requirements
+
+    for sentence in _SENTENCE_RE.split(text or ""):
+        add("description", sentence.strip().rstrip(".;"))
+    return requirements
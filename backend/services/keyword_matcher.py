@@ -1,272 +1,59 @@
+import hashlib
 import re
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
 try:
-    from backend.services.semantic_embedder import SemanticEmbedder
+    from backend.data import base_concepts
+    from backend.services.chunker import ResumeChunker
+    from backend.services.concept_index import ConceptIndex
+    from backend.services.embedding_store import EmbeddingStore
+    from backend.services.fuzzy_index import DeletionIndex
+    from backend.services.jd_analysis import JDAnalysis, analyze_jd
+    from backend.services.match_telemetry import STAGES, MatchTelemetry
+    from backend.services.quantization import Embeddings, as_float, cosine_scores, stack_rows
+    from backend.services.match_result import (
+        TIER_ADVANCED,
+        TIER_CORE,
+        ConceptHit,
+        ConceptLayout,
+        MatchResult,
+        RequirementCoverage,
+    )
+    from backend.services.semantic_embedder import SemanticEmbedder, ngram_embedder
+    from backend.services.skills_taxonomy import TaxonomyIndex, load_taxonomy
+    from backend.services.text_index import TextIndex, normalize_text, tokenize
+    from backend.utils.cache import LRUCache
+    from backend.utils.config import config
+    from backend.utils.logger import logger
 except ImportError:
-    from services.semantic_embedder import SemanticEmbedder
-
-BASE_CONCEPTS = {
-    "debugging": {
-        "label": "Debugging / fixing issues",
-        "tier": "core",
-        "weight": 1.0,
-        "synonyms": [
-            "debugging",
-            "debugged",
-            "fix bugs",
-            "fixed bugs",
-            "fix issues",
-            "bug fixes",
-            "bug-fixes",
-            "bug fixing",
-            "resolved defects",
-            "troubleshoot",
-            "troubleshooting",
-            "resolve issues",
-            "resolved issues",
-            "fixing issues",
-            "bugfix",
-            "bug fix",
-            "bug-fix",
-            "bugfixes",
-            "fixing technical issues",
-            "technical issues",
-            "api errors",
-            "reduce api errors",
-            "production issues",
-            "issue resolution",
-            "bug triage",
-            "fixing code",
-            "stability fixes",
-        ],
-    },
-    "testing": {
-        "label": "Testing / writing tests",
-        "tier": "core",
-        "weight": 1.0,
-        "synonyms": [
-            "unit test",
-            "unit tests",
-            "integration test",
-            "integration tests",
-            "automated tests",
-            "qa testing",
-            "qa",
-            "test coverage",
-            "tested features",
-            "wrote tests",
-            "test cases",
-            "verification",
-            "unit testing",
-            "test automation",
-            "quality assurance",
-            "testing features",
-            "tests",
-            "testing",
-            "test suites",
-            "playwright",
-            "pytest",
-            "jest",
-            "smoke tests",
-            "regression tests",
-            "test plan",
-            "test scripts",
-        ],
-    },
-    "version_control": {
-        "label": "Version control (Git/GitHub)",
-        "tier": "core",
-        "weight": 1.0,
-        "synonyms": [
-            "git",
-            "github",
-            "gitlab",
-            "bitbucket",
-            "version control",
-            "git workflow",
-            "git workflows",
-            "git flow",
-            "github flow",
-            "git version control",
-            "source control",
-            "merge request",
-            "pull request",
-            "git branching",
-            "git workflows",
-            "git repos",
-            "git repository",
-            "git repositories",
-            "git commits",
-            "branch strategy",
-            "code reviews",
-            "pr reviews",
-            "git operations",
-        ],
-    },
-    "teamwork": {
-        "label": "Team collaboration",
-        "tier": "core",
-        "weight": 0.9,
-        "synonyms": [
-            "collaborated",
-            "cross functional",
-            "team meetings",
-            "team meeting",
-            "standups",
-            "standup",
-            "scrum meetings",
-            "scrum",
-            "pair programming",
-            "paired with",
-            "worked with team",
-            "worked with teammates",
-            "collaboration",
-            "team sync",
-            "collaborated in team meetings",
-            "teamwork",
-            "teammates meetings",
-            "stakeholder updates",
-            "project updates",
-            "sprint ceremonies",
-        ],
-    },
-    "assigned_tasks": {
-        "label": "Assigned tasks / feature work",
-        "tier": "basic",
-        "weight": 0.6,
-        "synonyms": [
-            "assigned tasks",
-            "assigned work",
-            "project tasks",
-            "feature work",
-            "implement features",
-            "ticket",
-            "jira ticket",
-            "story points",
-            "backlog item",
-            "user stories",
-            "tasks",
-            "task list",
-            "deliverables",
-            "sprint tasks",
-            "work items",
-        ],
-    },
-    "clean_code": {
-        "label": "Clean, maintainable code",
-        "tier": "core",
-        "weight": 0.7,
-        "synonyms": [
-            "clean code",
-            "maintainable code",
-            "readable code",
-            "refactored code",
-            "code quality",
-            "linting",
-            "code cleanup",
-            "refactoring",
-            "codebase hygiene",
-            "style guide",
-        ],
-    },
-    "learning_mindset": {
-        "label": "Learning mindset",
-        "tier": "basic",
-        "weight": 0.5,
-        "synonyms": [
-            "learning new tools",
-            "self learning",
-            "self-taught",
-            "curious",
-            "eager to learn",
-            "willingness to learn",
-            "explore new tools",
-            "research new tech",
-            "learning mindset",
-            "continuous learning",
-        ],
-    },
-    "programming_fundamentals": {
-        "label": "Programming fundamentals",
-        "tier": "basic",
-        "weight": 1.0,
-        "synonyms": [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "c#",
-            "go",
-            "loops",
-            "functions",
-            "data structures",
-            "algorithms",
-            "variables",
-            "control flow",
-            "conditionals",
-            "recursion",
-            "object oriented",
-            "oop",
-            "classes",
-            "ds&a",
-            "fundamentals",
-        ],
-    },
-    "web_fundamentals": {
-        "label": "Web/app fundamentals",
-        "tier": "basic",
-        "weight": 0.8,
-        "synonyms": [
-            "html",
-            "css",
-            "frontend",
-            "backend",
-            "api",
-            "rest api",
-            "database",
-            "sql",
-            "nosql",
-            "express",
-            "react",
-            "django",
-            "flask",
-            "full stack",
-            "client server",
-            "http",
-            "deployment",
-            "hosting",
-            "web app",
-            "web application",
-            "server side",
-            "client side",
-        ],
-    },
-    "advanced_engineering": {
-        "label": "Advanced engineering experience",
-        "tier": "advanced",
-        "weight": 0.6,
-        "synonyms": [
-            "production",
-            "deployment",
-            "scalability",
-            "microservices",
-            "distributed systems",
-            "cloud",
-            "kubernetes",
-            "docker",
-            "cicd",
-            "continuous integration",
-            "continuous deployment",
-            "mlops",
-            "devops",
-            "system design",
-            "architecture",
-            "high availability",
-        ],
-    },
-}
+    from data import base_concepts
+    from services.chunker import ResumeChunker
+    from services.concept_index import ConceptIndex
+    from services.embedding_store import EmbeddingStore
+    from services.fuzzy_index import DeletionIndex
+    from services.jd_analysis import JDAnalysis, analyze_jd
+    from services.match_telemetry import STAGES, MatchTelemetry
+    from services.quantization import Embeddings, as_float, cosine_scores, stack_rows
+    from services.match_result import (
+        TIER_ADVANCED,
+        TIER_CORE,
+        ConceptHit,
+        ConceptLayout,
+        MatchResult,
+        RequirementCoverage,
+    )
+    from services.semantic_embedder import SemanticEmbedder, ngram_embedder
+    from services.skills_taxonomy import TaxonomyIndex, load_taxonomy
+    from services.text_index import TextIndex, normalize_text, tokenize
+    from utils.cache import LRUCache
+    from utils.config import config
+    from utils.logger import logger
+
+
+SEMANTIC_THRESHOLD = 0.62
 
 
 LEVEL_MULTIPLIERS = {
@@ -278,151 +65,570 @@ LEVEL_MULTIPLIERS = {
 }
 
 
+# Overqualified logic: strong senior signals should nearly max out freshman/sophomore/general scoring.
+_OVERQUALIFIED_FLOORS = {"freshman": 98, "sophomore": 98, "general": 95}
+
+
+def _sequential_sum(values: Iterable[float]) -> float:
+    # Plain left-to-right accumulation (unlike sum() on 3.12+), so np.cumsum in score_matrix agrees exactly.
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
+
 class KeywordMatcher:
-    """Combines synonym matching with semantic similarity to reduce false negatives."""
+    """
+    Combines synonym matching with semantic similarity to reduce false negatives.
 
-    def __init__(self, concepts: Dict[str, Dict] = None, embedder: SemanticEmbedder = None):
-        self.concepts = concepts or BASE_CONCEPTS
+    The catalog's registry passes `concepts` from its current snapshot; without them the installed
+    BASE_CONCEPTS are read when the matcher is built (not when this module was imported).
+    """
+
+    def __init__(
+        self,
+        concepts: Dict[str, Dict] = None,
+        embedder: SemanticEmbedder = None,
+        store: EmbeddingStore = None,
+        centroid_prefilter: Optional[bool] = None,
+        centroid_margin: Optional[float] = None,
+        fuzzy: Optional[bool] = None,
+        morphology: Optional[bool] = None,
+        chunker: Optional[ResumeChunker] = None,
+        taxonomy: Optional[TaxonomyIndex] = None,
+        telemetry: Optional[bool] = None,
+        first_pass: Optional[SemanticEmbedder] = None,
+    ):
+        self.concepts = concepts or base_concepts.BASE_CONCEPTS
         self.embedder = embedder or SemanticEmbedder()
+        self.store = store or EmbeddingStore()
+        # Optional cheap semantic pass (n-gram vectors) ahead of the model; only concepts it leaves
+        # unresolved are scored by `embedder`. Pointless when the embedder is the n-gram backend.
+        if first_pass is None and config.SEMANTIC_NGRAM_FIRST_PASS:
+            first_pass = ngram_embedder()
+        self.first_pass = None if getattr(self.embedder, "backend", "") == "ngram" else first_pass
+        self.centroid_prefilter = (
+            config.SEMANTIC_CENTROID_PREFILTER if centroid_prefilter is None else centroid_prefilter
+        )
+        self.centroid_margin = config.SEMANTIC_CENTROID_MARGIN if centroid_margin is None else centroid_margin
+        # Compiled once; every request then scans the resume a single time for all synonyms.
+        morphology = config.MORPHOLOGICAL_NORMALIZATION if morphology is None else morphology
+        self.layout = ConceptLayout(self.concepts)
+        self.index = ConceptIndex(self.concepts, morphology=morphology)
+        logger.info(
+            f"Compiled {self.index.pattern_count} synonym patterns "
+            f"({self.index.deduplicated} deduplicated, morphology={'on' if morphology else 'off'})"
+        )
+        # Optional large skills taxonomy, extracted in the same canonical token form as the concepts.
+        if taxonomy is None and config.SKILLS_TAXONOMY_PATH:
+            try:
+                taxonomy = load_taxonomy(config.SKILLS_TAXONOMY_PATH, morphology=morphology)
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning(f"Skills taxonomy unavailable: {exc}")
+        self.taxonomy = taxonomy
+        fuzzy = config.FUZZY_MATCHING if fuzzy is None else fuzzy
+        self.fuzzy_index = DeletionIndex(self.index.vocabulary) if fuzzy else None
+        # (synonym matrix, concept centroid matrix) per embedder model name.
+        self._semantic_matrices: Dict[str, Tuple[Embeddings, Embeddings]] = {}
+        # Per-chunk exact/fuzzy hits and embeddings keyed by content hash: re-evaluating an edited
+        # resume only processes the chunks that changed.
+        self.chunk_cache = LRUCache(max_entries=config.CHUNK_CACHE_SIZE)
+        self.chunker = chunker or ResumeChunker(
+            budget=config.SEMANTIC_CHUNK_BUDGET,
+            min_words=config.SEMANTIC_CHUNK_MIN_WORDS,
+            max_words=config.SEMANTIC_CHUNK_MAX_WORDS,
+        )
+        telemetry = config.MATCH_TELEMETRY if telemetry is None else telemetry
+        self.telemetry = MatchTelemetry(self.index) if telemetry else None
 
     @staticmethod
     def _normalize_text(text: str) -> str:
-        lowered = text.lower()
-        lowered = re.sub(r"[^a-z0-9+/#.& ]+", " ", lowered)
-        return re.sub(r"\s+", " ", lowered).strip()
+        return normalize_text(text)
+
+    def _split_segments(self, text: str) -> List[str]:
+        # Sentence ends ("." or ";" before whitespace) and blank lines only: dotted synonyms
+        # ("node.js") and phrases wrapped onto the next line must stay in one segment.
+        return [segment.strip() for segment in re.split(r"[.;](?=\s|$)|\n\s*\n", text or "") if segment.strip()]
+
+    def _chunk_text(self, text: str) -> Tuple[List[str], int]:
+        """Semantic-stage chunks within the configured budget, plus how many were dropped."""
+        return self.chunker.chunk(text)
+
+    @staticmethod
+    def _cache_key(kind: str, text: str) -> Tuple[str, str]:
+        return kind, hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def _segment_entry(self, segment: str, timings: Optional[Dict[str, float]] = None) -> Tuple[Dict, bool]:
+        """Cached exact/fuzzy hits for one segment; returns (entry, reused). Adds stage time to `timings`."""
+        key = self._cache_key("segment", segment)
+        entry = self.chunk_cache.get(key)
+        if entry is not None:
+            return entry, True
+        start = time.perf_counter()
+        tokens = self.index.canonical_tokens(tokenize(normalize_text(segment)))
+        exact_rows: Set[int] = set()
+        fuzzy_rows: Set[int] = set()
+        exact = self.index.scan(tokens, exact_rows)
+        scanned = time.perf_counter()
+        entry = {
+            "exact": exact,
+            "fuzzy": self._fuzzy_hits(tokens, exact, fuzzy_rows),
+            # Every matching synonym row, shadowed ones included, for telemetry.
+            "exact_rows": frozenset(exact_rows),
+            "fuzzy_rows": frozenset(fuzzy_rows - exact_rows),
+        }
+        if timings is not None:
+            timings["exact"] += scanned - start
+            timings["fuzzy"] += time.perf_counter() - scanned
+        self.chunk_cache.set(key, entry)
+        return entry, False
+
+    def _chunk_embeddings(self, chunks: List[str], embedder: Optional[SemanticEmbedder] = None) -> Optional[Embeddings]:
+        """Stacks cached chunk embeddings, encoding only chunks not embedded before in one batch call."""
+        embedder = embedder or self.embedder
+        kind = f"embedding:{embedder.model_name}"
+        vectors = {chunk: self.chunk_cache.get(self._cache_key(kind, chunk)) for chunk in dict.fromkeys(chunks)}
+        pending = [chunk for chunk, vector in vectors.items() if vector is None]
+        if pending:
+            encoded = embedder.encode_batch(pending)
+            if encoded is None:
+                return None
+            for chunk, vector in zip(pending, encoded):
+                vectors[chunk] = vector
+                self.chunk_cache.set(self._cache_key(kind, chunk), vector)
+        return stack_rows([vectors[chunk] for chunk in chunks])
+
+    def _semantic_embeddings(self, embedder: SemanticEmbedder) -> Optional[Tuple[Embeddings, Embeddings]]:
+        """
+        (synonym matrix, concept centroids) for `embedder`, one synonym row per `index.synonyms`
+        entry. Loaded from the shared on-disk artifact when present, otherwise encoded once and
+        persisted for other workers. Quantized artifacts are expanded to float32 here, once, so
+        every request scores them with BLAS instead of upcasting the codes on each call.
+        """
+        matrices = self._semantic_matrices.get(embedder.model_name)
+        if matrices is None:
+            matrices = self.store.load_or_build(embedder, self.index)
+            if matrices is not None:
+                matrices = (as_float(matrices[0]), as_float(matrices[1]))
+                self._semantic_matrices[embedder.model_name] = matrices
+        return matrices
+
+    def _synonym_embeddings(self) -> Optional[Embeddings]:
+        """Synonym embedding matrix of the main embedder (and of the first pass, when enabled)."""
+        if self.first_pass is not None and self.first_pass.model:
+            self._semantic_embeddings(self.first_pass)
+        matrices = self._semantic_embeddings(self.embedder) if self.embedder.model else None
+        return matrices[0] if matrices is not None else None
+
+    def _fuzzy_hits(
+        self, tokens: List[str], exact_hits: Dict[str, Tuple[int, str]], rows: Optional[Set[int]] = None
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        Re-scans the typo-corrected token stream; only concepts missed by the exact pass count.
+        `rows` collects every synonym row the corrected stream matched (see `ConceptIndex.scan`).
+        """
+        if not self.fuzzy_index or len(exact_hits) == len(self.concepts):
+            return {}
+        corrected = self.fuzzy_index.correct_tokens(tokens)
+        if corrected is None:
+            return {}
+        return {key: hit for key, hit in self.index.scan(corrected, rows).items() if key not in exact_hits}
+
+    def _prefilter_by_centroid(
+        self, keys: List[str], concept_matrix: Embeddings, chunk_matrix: Embeddings, threshold: float
+    ) -> List[str]:
+        """Stage one: keep only concepts whose centroid gets within `centroid_margin` of the threshold."""
+        rows = [self.index.concept_rows[key] for key in keys]
+        centroid_best = cosine_scores(concept_matrix[rows], chunk_matrix).max(axis=1)
+        cutoff = threshold - self.centroid_margin
+        return [key for key, score in zip(keys, centroid_best) if score >= cutoff]
+
+    def _semantic_hits(
+        self,
+        resume_chunks: List[str],
+        concept_keys: List[str],
+        embedder: Optional[SemanticEmbedder] = None,
+        matched_rows: Optional[Set[int]] = None,
+    ) -> Tuple[Dict[str, Tuple[str, float, int]], Dict[str, int]]:
+        """
+        Batched semantic stage: new chunks are encoded in one call and scored against every
+        pending synonym with a single matrix product. For each concept the first synonym (in
+        dictionary order) whose best chunk clears the threshold wins, mirroring the old
+        per-synonym loop. Returns concept_key -> (best chunk, score, synonym row) plus work counters.
+        `embedder` defaults to the matcher's own; each backend is compared against its own threshold.
+        `matched_rows` collects every synonym row that cleared it, not only the concepts' winners.
+        """
+        embedder = embedder or self.embedder
+        stats = {"concepts_considered": 0, "concepts_pruned": 0, "synonyms_scored": 0}
+        if not embedder or not embedder.model or not resume_chunks:
+            return {}, stats
+        keys = [key for key in concept_keys if self.index.spans[key][1] > self.index.spans[key][0]]
+        if not keys:
+            return {}, stats
+
+        matrices = self._semantic_embeddings(embedder)
+        chunk_matrix = self._chunk_embeddings(resume_chunks, embedder)
+        if matrices is None or chunk_matrix is None:
+            return {}, stats
+        synonym_matrix, concept_matrix = matrices
+        threshold = getattr(embedder, "threshold", None) or SEMANTIC_THRESHOLD
+
+        stats["concepts_considered"] = len(keys)
+        if self.centroid_prefilter:
+            keys = self._prefilter_by_centroid(keys, concept_matrix, chunk_matrix, threshold)
+            stats["concepts_pruned"] = stats["concepts_considered"] - len(keys)
+            if not keys:
+                return {}, stats
+
+        spans = [self.index.spans[key] for key in keys]
+        rows = np.concatenate([np.arange(start, end) for start, end in spans])
+        stats["synonyms_scored"] = len(rows)
+        scores = cosine_scores(synonym_matrix[rows], chunk_matrix)
+        best_chunk = scores.argmax(axis=1)
+        best_score = scores[np.arange(len(rows)), best_chunk]
+
+        # First qualifying row per concept segment: non-qualifying rows are pushed past the end.
+        offsets = np.cumsum([0] + [end - start for start, end in spans])
+        positions = np.where(best_score >= threshold, np.arange(len(rows)), len(rows))
+        first = np.minimum.reduceat(positions, offsets[:-1])
+
+        hits: Dict[str, Tuple[str, float, int]] = {}
+        for slot, key in enumerate(keys):
+            row = int(first[slot])
+            if row < offsets[slot + 1]:
+                hits[key] = (resume_chunks[int(best_chunk[row])], float(best_score[row]), int(rows[row]))
+        if matched_rows is not None:
+            matched_rows.update(rows[best_score >= threshold].tolist())
+        if self.telemetry is not None:
+            self.telemetry.record_scored(rows)
+        return hits, stats
+
+    def _requirement_embeddings(self, jd: JDAnalysis) -> Optional[Embeddings]:
+        """Embeddings of the JD's requirement bullets, computed once per JD analysis and embedder model."""
+        model_name = self.embedder.model_name
+        if model_name not in jd.requirement_embeddings:
+            texts = [text for _, text in jd.requirements]
+            jd.requirement_embeddings[model_name] = self.embedder.encode_batch(texts) if texts else None
+        return jd.requirement_embeddings[model_name]
+
+    def _requirement_coverage(self, jd: JDAnalysis, resume_chunks: List[str]) -> List[RequirementCoverage]:
+        """
+        Every JD requirement against every resume chunk in one matrix product; each requirement
+        reports its best supporting chunk. Chunk embeddings come from the semantic stage's cache.
+        """
+        if not config.REQUIREMENT_COVERAGE or not self.embedder or not self.embedder.model or not resume_chunks:
+            return []
+        requirements = jd.requirements
+        requirement_matrix = self._requirement_embeddings(jd)
+        if requirement_matrix is None:
+            return []
+        chunk_matrix = self._chunk_embeddings(resume_chunks)
+        if chunk_matrix is None:
+            return []
+        scores = cosine_scores(requirement_matrix, chunk_matrix)
+        best_chunk = scores.argmax(axis=1)
+        best_score = scores[np.arange(len(requirements)), best_chunk]
+        threshold = getattr(self.embedder, "threshold", None) or config.REQUIREMENT_COVERAGE_THRESHOLD
+        return [
+            RequirementCoverage(section, text, round(float(score), 4), resume_chunks[int(chunk)], bool(score >= threshold))
+            for (section, text), chunk, score in zip(requirements, best_chunk, best_score)
+        ]
 
-    def _phrase_present(self, haystack: str, phrase: str) -> bool:
-        # Require word boundaries to avoid false positives (e.g., "api" in "capabilities", "git" in "digital").
-        pattern = rf"(?<!\\w){re.escape(phrase)}(?!\\w)"
-        return re.search(pattern, haystack) is not None
+    def _jd_skills(self, jd: JDAnalysis) -> List[int]:
+        """Taxonomy skills of the JD, extracted once per analysis and shared by every resume."""
+        key = (self.taxonomy, self.index.morphology)
+        if key not in jd.taxonomy_skills:
+            jd.taxonomy_skills[key] = list(self.taxonomy.extract(self.index.tokens_for(jd.index)))
+        return jd.taxonomy_skills[key]
 
-    def _chunk_text(self, text: str) -> List[str]:
-        raw_chunks = re.split(r"[.;\\n]", text or "")
-        return [chunk.strip() for chunk in raw_chunks if len(chunk.strip()) > 5]
+    def _taxonomy_skills(self, resume_index: TextIndex, jd: JDAnalysis) -> Tuple[List[Tuple[int, str]], List[int]]:
+        """JD skills (in JD order) split into those the resume mentions and those it lacks."""
+        if self.taxonomy is None:
+            return [], []
+        jd_skills = self._jd_skills(jd)
+        if not jd_skills:
+            return [], []
+        resume_skills = self.taxonomy.extract(self.index.tokens_for(resume_index))
+        found = [(skill, resume_skills[skill]) for skill in jd_skills if skill in resume_skills]
+        missing = [skill for skill in jd_skills if skill not in resume_skills]
+        return found, missing
 
     def _detect_recency_and_impact(self, resume_text: str) -> Tuple[bool, bool]:
         recent = bool(re.search(r"20(2[3-9]|3\\d)", resume_text or ""))
         impact = bool(re.search(r"\\b\\d+%|\\b\\d+\\s?(k|m|million|billion)\\b", (resume_text or "").lower()))
         return recent, impact
 
-    def evaluate(self, resume_text: str, job_description: str, intern_level: str = "general") -> Dict:
-        normalized_resume = self._normalize_text(resume_text or "")
-        normalized_jd = self._normalize_text(job_description or "")
+    def match(
+        self,
+        resume_text: str,
+        job_description: str,
+        resume_index: Optional[TextIndex] = None,
+        jd: Optional[JDAnalysis] = None,
+    ) -> MatchResult:
+        """
+        Level-independent half of `evaluate`: which concepts were found and how. The result only
+        depends on the two texts, so it can be cached and re-scored for any level via `score_level`.
+        """
+        # Callers that already indexed the resume or analyzed the JD (AIEvaluator, match_batch)
+        # pass them in to avoid re-normalizing; `job_description` is then only the fallback source.
+        resume_index = resume_index or TextIndex(resume_text)
+        jd = jd or analyze_jd(job_description, clean=False)
+
+        # Token-level matching keeps word boundaries (e.g., no "api" in "capabilities", "git" in "digital").
+        # Only the resume is scanned; JD text should not auto-satisfy keywords. Each segment's hits
+        # come from the chunk cache when that text was seen before, then merge per concept.
+        timings = dict.fromkeys(STAGES, 0.0)
+        entries: Dict[str, Dict] = {}
+        reused = 0
+        for segment in self._split_segments(resume_text):
+            if segment not in entries:
+                entries[segment], was_cached = self._segment_entry(segment, timings)
+                reused += was_cached
+        exact_hits: Dict[str, Tuple[int, str]] = {}
+        fuzzy_hits: Dict[str, Tuple[int, str]] = {}
+        for entry in entries.values():
+            for merged, hits in ((exact_hits, entry["exact"]), (fuzzy_hits, entry["fuzzy"])):
+                for key, hit in hits.items():
+                    if key not in merged or hit[0] < merged[key][0]:
+                        merged[key] = hit
+        # Typos ("debuging") are caught by the deletion index before any embedding is computed.
+        fuzzy_hits = {key: hit for key, hit in fuzzy_hits.items() if key not in exact_hits}
+
+        stage_start = time.perf_counter()
+        resume_chunks, dropped = self._chunk_text(resume_text)
+        pending = [key for key in self.concepts if key not in exact_hits and key not in fuzzy_hits]
+        semantic_rows: Set[int] = set()
+        first_pass_hits: Dict[str, Tuple[str, float, int]] = {}
+        if self.first_pass is not None:
+            first_pass_hits, _ = self._semantic_hits(resume_chunks, pending, self.first_pass, semantic_rows)
+            pending = [key for key in pending if key not in first_pass_hits]
+        semantic_hits, semantic_stats = self._semantic_hits(resume_chunks, pending, matched_rows=semantic_rows)
+        if self.first_pass is not None:
+            semantic_hits.update(first_pass_hits)
+            semantic_stats["first_pass_hits"] = len(first_pass_hits)
+        timings["semantic"] = time.perf_counter() - stage_start
+
+        found_mask = 0
+        hits: List[ConceptHit] = []
+        for row, concept_key in enumerate(self.layout.keys):
+            exact_hit = exact_hits.get(concept_key)
+            if exact_hit:
+                hits.append(ConceptHit(row, "exact", exact_hit[1], 0.0))
+            elif concept_key in fuzzy_hits:
+                hits.append(ConceptHit(row, "fuzzy", fuzzy_hits[concept_key][1], 0.0))
+            elif concept_key in semantic_hits:
+                phrase, semantic_score, _ = semantic_hits[concept_key]
+                hits.append(ConceptHit(row, "semantic", phrase, semantic_score))
+            else:
+                continue
+            found_mask |= 1 << row
+
+        recent, impact = self._detect_recency_and_impact(resume_text)
+        stage_start = time.perf_counter()
+        skills, missing_skills = self._taxonomy_skills(resume_index, jd)
+        timings["taxonomy"] = time.perf_counter() - stage_start
+        stage_start = time.perf_counter()
+        requirements = self._requirement_coverage(jd, resume_chunks)
+        timings["requirements"] = time.perf_counter() - stage_start
+        if self.telemetry is not None:
+            # Every synonym that matched counts, not only each concept's winning (first-listed) one,
+            # so `never_matched` only lists synonyms that really never fire.
+            exact_rows = set().union(*(entry["exact_rows"] for entry in entries.values()))
+            fuzzy_rows = set().union(*(entry["fuzzy_rows"] for entry in entries.values())) - exact_rows
+            self.telemetry.record({"exact": exact_rows, "fuzzy": fuzzy_rows, "semantic": semantic_rows}, timings)
+        return MatchResult(
+            found_mask=found_mask,
+            hits=hits,
+            # Level scaling only applies when the JD or resume looks like an internship.
+            intern_context=jd.intern or "intern" in resume_index.normalized,
+            recent=recent,
+            impact=impact,
+            semantic_stats=semantic_stats,
+            chunk_stats={
+                "chunks": len(entries),
+                "reused": reused,
+                "semantic_chunks": len(resume_chunks),
+                "semantic_chunks_dropped": dropped,
+            },
+            skills=skills,
+            missing_skills=missing_skills,
+            requirements=requirements,
+        )
+
+    def score_level(self, match_result: MatchResult, intern_level: str = "general") -> Dict:
+        """Scores a `match` result for one intern level; cheap enough to run per level switch."""
+        layout = self.layout
 
         # If the job description doesn't look like an intern role, keep level general
         level_key = intern_level.lower().strip() or "general"
-        if "intern" not in normalized_jd and "intern" not in normalized_resume:
+        if not match_result.intern_context:
             level_key = "general"
         multiplier = LEVEL_MULTIPLIERS.get(level_key, 1.0)
 
-        tier_rank = {"basic": 1, "core": 2, "advanced": 3}
-        concept_results = {}
-        total_weight = 0.0
-        resume_chunks = self._chunk_text(resume_text)
-        matches: List[Dict] = []
-
-        for concept_key, concept in self.concepts.items():
-            weight = concept.get("weight", 1.0) * multiplier
-            total_weight += weight
-            found = False
-            method = "none"
-            matched_phrase = None
-            semantic_score = 0.0
-
-            for phrase in concept["synonyms"]:
-                norm_phrase = self._normalize_text(phrase)
-                # Only count matches present in the resume; JD text should not auto-satisfy keywords.
-                if norm_phrase and self._phrase_present(normalized_resume, norm_phrase):
-                    found = True
-                    method = "exact"
-                    matched_phrase = phrase
-                    break
-                if not found and self.embedder and self.embedder.model:
-                    hit, score, candidate = self.embedder.any_above_threshold(
-                        phrase, resume_chunks, threshold=0.62
-                    )
-                    if hit:
-                        found = True
-                        method = "semantic"
-                        matched_phrase = candidate or phrase
-                        semantic_score = score
-                        break
-
-            concept_results[concept_key] = {
-                "label": concept["label"],
-                "weight": weight,
-                "tier": concept.get("tier", "core"),
-                "found": found,
-                "method": method,
-                "matched_phrase": matched_phrase,
-                "semantic_score": semantic_score,
-            }
-            if found:
-                matches.append(
-                    {
-                        "key": concept_key,
-                        "label": concept["label"],
-                        "method": method,
-                        "matched_phrase": matched_phrase or "",
-                        "score": semantic_score or 1.0,
-                    }
-                )
+        total_weight = _sequential_sum(weight * multiplier for weight in layout.weights)
 
-        matched_concepts = {key for key, data in concept_results.items() if data["found"]}
-        highest_tier_hit = max(
-            [tier_rank.get(concept_results[key]["tier"], 1) for key in matched_concepts],
-            default=0,
-        )
+        found = match_result.found_mask
+        highest_tier_hit = layout.highest_tier(found)
+        matched = found
 
         # Advanced evidence implies core practices and fundamentals even if not explicitly listed.
-        if "advanced_engineering" in matched_concepts:
-            matched_concepts.update({"debugging", "testing", "version_control", "clean_code"})
+        if found & layout.advanced_concept_mask:
+            matched |= layout.advanced_implies_mask
 
         # If any core or advanced signals show up, do not penalize for missing basic fundamentals.
-        if highest_tier_hit >= tier_rank["core"]:
-            for key, data in concept_results.items():
-                if data["tier"] == "basic":
-                    matched_concepts.add(key)
+        if highest_tier_hit >= TIER_CORE:
+            matched |= layout.basic_mask
 
         # Advanced coverage implies core expectations as well.
-        if highest_tier_hit >= tier_rank["advanced"]:
-            for key, data in concept_results.items():
-                if data["tier"] == "core":
-                    matched_concepts.add(key)
-
-        matched_weight = sum(
-            data["weight"]
-            for key, data in concept_results.items()
-            if key in matched_concepts
-        )
+        if highest_tier_hit >= TIER_ADVANCED:
+            matched |= layout.core_mask
+
+        matched_weight = _sequential_sum(layout.weights[row] * multiplier for row in layout.rows(matched))
 
         score = 0
         if total_weight:
             score = round(max(0.0, min(100.0, (matched_weight / total_weight) * 100)))
 
         # Recency/impact boosts to reward up-to-date, outcome-focused resumes.
-        recent, impact = self._detect_recency_and_impact(resume_text)
-        if recent:
+        if match_result.recent:
             score = min(100, score + 4)
-        if impact:
+        if match_result.impact:
             score = min(100, score + 5)
 
         # Overqualified logic: strong senior signals should nearly max out freshman/sophomore/general scoring.
-        if highest_tier_hit >= tier_rank["advanced"]:
-            if level_key in ("freshman", "sophomore"):
-                score = min(100, max(score, 98))
-            elif level_key == "general":
-                score = min(100, max(score, 95))
-
-        missing = [
-            (key, data["label"])
-            for key, data in concept_results.items()
-            if key not in matched_concepts
-        ]
+        if highest_tier_hit >= TIER_ADVANCED:
+            score = min(100, max(score, _OVERQUALIFIED_FLOORS.get(level_key, 0)))
+
+        missing = [layout.labels[row] for row in layout.rows(layout.full_mask & ~matched)]
+        return self._report(match_result, score, missing, level_key)
 
-        return {
+    def _report(self, match_result: MatchResult, score: int, missing: List[str], level_key: str) -> Dict:
+        """Public result dict; taxonomy skills follow the concept matches and missing concepts."""
+        matches = self.layout.match_dicts(match_result.hits)
+        if self.taxonomy is not None:
+            matches.extend(
+                {
+                    "key": self.taxonomy.key(skill),
+                    "label": self.taxonomy.label(skill),
+                    "method": "taxonomy",
+                    "matched_phrase": phrase,
+                    "score": 1.0,
+                }
+                for skill, phrase in match_result.skills
+            )
+            limit = config.SKILLS_MISSING_LIMIT
+            missing = missing + [self.taxonomy.label(skill) for skill in match_result.missing_skills[:limit]]
+        report = {
             "score": score,
-            "missing_keywords": [label for _, label in missing],
+            "missing_keywords": missing,
             "intern_level": level_key,
             "matches": matches,
+            "semantic_stats": match_result.semantic_stats,
+            "chunk_stats": match_result.chunk_stats,
         }
+        if match_result.requirements:
+            covered = sum(item.covered for item in match_result.requirements)
+            report["requirement_coverage"] = {
+                "covered": covered,
+                "total": len(match_result.requirements),
+                "ratio": round(covered / len(match_result.requirements), 4),
+                "requirements": [
+                    {
+                        "section": item.section,
+                        "requirement": item.requirement,
+                        "covered": item.covered,
+                        "score": item.score,
+                        "evidence": item.evidence,
+                    }
+                    for item in match_result.requirements
+                ],
+            }
+        return report
+
+    def evaluate(
+        self,
+        resume_text: str,
+        job_description: str,
+        intern_level: str = "general",
+        resume_index: Optional[TextIndex] = None,
+        jd: Optional[JDAnalysis] = None,
+    ) -> Dict:
+        match_result = self.match(resume_text, job_description, resume_index=resume_index, jd=jd)
+        return self.score_level(match_result, intern_level)
+
+    def evaluate_levels(
+        self,
+        resume_text: str,
+        job_description: str,
+        resume_index: Optional[TextIndex] = None,
+        jd: Optional[JDAnalysis] = None,
+    ) -> Dict[str, Dict]:
+        """Scores every level in LEVEL_MULTIPLIERS from a single matching pass."""
+        match_result = self.match(resume_text, job_description, resume_index=resume_index, jd=jd)
+        return {level: self.score_level(match_result, level) for level in LEVEL_MULTIPLIERS}
+
+    def match_batch(self, resume_texts: List[str], job_description: str) -> List[MatchResult]:
+        """Matches many resumes against one JD, analyzing the JD once."""
+        jd = analyze_jd(job_description, clean=False)
+        return [self.match(resume_text, job_description, jd=jd) for resume_text in resume_texts]
+
+    def score_matrix(self, match_results: List[MatchResult], intern_level: str = "general") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `score_level` over many results: returns (scores, matched) where `matched` is the
+        resumes x concepts boolean matrix after tier implication. Weighted sums accumulate left to
+        right like the scalar path, so scores are bit-for-bit identical.
+        """
+        layout = self.layout
+        count, width = len(match_results), len(layout.keys)
+        found = layout.mask_matrix([result.found_mask for result in match_results])
+        intern_context = np.fromiter((result.intern_context for result in match_results), dtype=bool, count=count)
+        recent = np.fromiter((result.recent for result in match_results), dtype=bool, count=count)
+        impact = np.fromiter((result.impact for result in match_results), dtype=bool, count=count)
+
+        level_key = intern_level.lower().strip() or "general"
+        # Results without intern context are scored as "general", like score_level does.
+        multipliers = np.where(intern_context, LEVEL_MULTIPLIERS.get(level_key, 1.0), LEVEL_MULTIPLIERS["general"])
+        floors = np.where(intern_context, _OVERQUALIFIED_FLOORS.get(level_key, 0), _OVERQUALIFIED_FLOORS["general"])
+
+        columns = layout.mask_columns
+        advanced_hit = (found & columns(layout.advanced_mask)).any(axis=1)
+        core_hit = advanced_hit | (found & columns(layout.core_mask)).any(axis=1)
+        matched = found.copy()
+        matched |= (found & columns(layout.advanced_concept_mask)).any(axis=1)[:, None] & columns(
+            layout.advanced_implies_mask
+        )
+        matched |= core_hit[:, None] & columns(layout.basic_mask)
+        matched |= advanced_hit[:, None] & columns(layout.core_mask)
+
+        weights = np.asarray(layout.weights, dtype=np.float64)
+        scaled = weights[None, :] * multipliers[:, None]
+        if not width:
+            return np.zeros(count, dtype=np.int64), matched
+        total_weight = np.cumsum(scaled, axis=1)[:, -1]
+        matched_weight = np.cumsum(np.where(matched, scaled, 0.0), axis=1)[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(total_weight != 0, matched_weight / total_weight * 100, 0.0)
+        scores = np.rint(np.clip(ratio, 0.0, 100.0)).astype(np.int64)
+        scores = np.where(recent, np.minimum(100, scores + 4), scores)
+        scores = np.where(impact, np.minimum(100, scores + 5), scores)
+        scores = np.where(advanced_hit, np.minimum(100, np.maximum(scores, floors)), scores)
+        return scores, matched
+
+    def score_batch(self, match_results: List[MatchResult], intern_level: str = "general") -> List[Dict]:
+        """`score_level` for many results at once; each dict equals the scalar result."""
+        scores, matched = self.score_matrix(match_results, intern_level)
+        layout = self.layout
+        level_key = intern_level.lower().strip() or "general"
+        return [
+            self._report(
+                result,
+                int(scores[row]),
+                [layout.labels[col] for col in np.flatnonzero(~matched[row])],
+                level_key if result.intern_context else "general",
+            )
+            for row, result in enumerate(match_results)
+        ]
+
+    def evaluate_batch(self, resume_texts: List[str], job_description: str, intern_level: str = "general") -> List[Dict]:
+        """Scores many resumes against one JD with a single vectorized scoring pass."""
+        return self.score_batch(self.match_batch(resume_texts, job_description), intern_level)
@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+TIER_BASIC = 1
+TIER_CORE = 2
+TIER_ADVANCED = 3
+
+# Advanced engineering evidence implies these core practices even if they are not explicitly listed.
+ADVANCED_CONCEPT = "advanced_engineering"
+ADVANCED_IMPLIES = ("debugging", "testing", "version_control", "clean_code")
+
+
+@dataclass(slots=True)
+class ConceptHit:
+    """One found concept: its row in the `ConceptLayout` and how it was matched."""
+
+    row: int
+    method: str
+    phrase: str
+    score: float
+
+
+@dataclass(slots=True)
+class RequirementCoverage:
+    """One JD requirement bullet and the resume chunk that supports it best."""
+
+    section: str
+    requirement: str
+    score: float
+    evidence: str
+    covered: bool
+
+
+@dataclass(slots=True)
+class MatchResult:
+    """
+    Level-independent output of `KeywordMatcher.match`. Found concepts are a bitmask over the
+    layout rows, so tier implication during scoring is a few integer operations.
+    """
+
+    found_mask: int
+    hits: List[ConceptHit]
+    intern_context: bool
+    recent: bool
+    impact: bool
+    semantic_stats: Dict[str, int]
+    chunk_stats: Dict[str, int]
+    # Skills-taxonomy extraction (when enabled): JD skills found in the resume as (skill id, phrase)
+    # and JD skills the resume lacks.
+    skills: List[Tuple[int, str]] = field(default_factory=list)
+    missing_skills: List[int] = field(default_factory=list)
+    # JD requirement bullets scored against the resume chunks (when a semantic backend is available).
+    requirements: List[RequirementCoverage] = field(default_factory=list)
+
+
+class ConceptLayout:
+    """Row order, weights and tier bitmasks of a concept dictionary, computed once per matcher."""
+
+    __slots__ = (
+        "keys",
+        "labels",
+        "weights",
+        "full_mask",
+        "basic_mask",
+        "core_mask",
+        "advanced_mask",
+        "advanced_concept_mask",
+        "advanced_implies_mask",
+    )
+
+    def __init__(self, concepts: Dict[str, Dict]):
+        self.keys: List[str] = list(concepts)
+        self.labels: List[str] = [concept["label"] for concept in concepts.values()]
+        self.weights: List[float] = [concept.get("weight", 1.0) for concept in concepts.values()]
+        self.full_mask = (1 << len(self.keys)) - 1
+        self.basic_mask = self.core_mask = self.advanced_mask = 0
+        self.advanced_concept_mask = self.advanced_implies_mask = 0
+        for row, (key, concept) in enumerate(concepts.items()):
+            tier = concept.get("tier", "core")
+            if tier == "basic":
+                self.basic_mask |= 1 << row
+            elif tier == "core":
+                self.core_mask |= 1 << row
+            elif tier == "advanced":
+                self.advanced_mask |= 1 << row
+            if key == ADVANCED_CONCEPT:
+                self.advanced_concept_mask |= 1 << row
+            if key in ADVANCED_IMPLIES:
+                self.advanced_implies_mask |= 1 << row
+
+    def highest_tier(self, mask: int) -> int:
+        """Rank of the strongest tier present in `mask` (0 when empty; unknown tiers rank as basic)."""
+        if mask & self.advanced_mask:
+            return TIER_ADVANCED
+        if mask & self.core_mask:
+            return TIER_CORE
+        return TIER_BASIC if mask else 0
+
+    def mask_columns(self, mask: int) -> np.ndarray:
+        """Boolean column vector for `mask`, memoized per layout."""
+        return _columns(mask, len(self.keys))
+
+    def mask_matrix(self, masks: List[int]) -> np.ndarray:
+        """Resumes x concepts boolean matrix from per-result found masks."""
+        width = len(self.keys)
+        if width <= 63:
+            packed = np.fromiter(masks, dtype=np.int64, count=len(masks))
+            return (packed[:, None] >> np.arange(width, dtype=np.int64) & 1).astype(bool)
+        return np.array([[mask >> col & 1 for col in range(width)] for mask in masks], dtype=bool).reshape(-1, width)
+
+    def rows(self, mask: int) -> List[int]:
+        return [row for row in range(len(self.keys)) if mask >> row & 1]
+
+    def match_dicts(self, hits: List[ConceptHit]) -> List[Dict]:
+        """Public `matches` entries; only built when a result leaves the matcher."""
+        return [
+            {
+                "key": self.keys[hit.row],
+                "label": self.labels[hit.row],
+                "method": hit.method,
+                "matched_phrase": hit.phrase or "",
+                "score": hit.score or 1.0,
+            }
+            for hit in hits
+        ]
+
+
+@lru_cache(maxsize=256)
+def _columns(mask: int, width: int) -> np.ndarray:
+    columns = np.array([mask >> col & 1 for col in range(width)], dtype=bool)
+    columns.flags.writeable = False
+    return columns
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable
+
+import numpy as np
+
+try:
+    from backend.services.concept_index import ConceptIndex
+except ImportError:
+    from services.concept_index import ConceptIndex
+
+HIT_METHODS = ("exact", "fuzzy", "semantic")
+STAGES = ("exact", "fuzzy", "semantic", "taxonomy", "requirements")
+
+
+class MatchTelemetry:
+    """
+    Per-synonym hit counters (exact / fuzzy / semantic) and per-stage time for one compiled
+    matcher. A request records into local structures and merges under the lock once, so the cost
+    is a handful of integer adds per match. Every synonym that matched is counted, including
+    ones shadowed by an earlier-listed synonym of the same concept, so concept totals (summed from
+    the synonym rows via `ConceptIndex.spans` when a snapshot is taken) count synonym hits.
+    """
+
+    def __init__(self, index: ConceptIndex):
+        self.index = index
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        size = len(self.index.synonyms)
+        with self._lock:
+            self.hits = {method: np.zeros(size, dtype=np.int64) for method in HIT_METHODS}
+            # How often each synonym's embedding was compared against resume chunks: its semantic cost.
+            self.semantic_scored = np.zeros(size, dtype=np.int64)
+            self.stage_seconds = dict.fromkeys(STAGES, 0.0)
+            self.matches = 0
+            self.since = time.time()
+
+    def record(self, synonym_hits: Dict[str, Iterable[int]], stage_seconds: Dict[str, float]) -> None:
+        """Merges one match: every synonym row that matched, per method, and stage timings."""
+        with self._lock:
+            self.matches += 1
+            for method, rows in synonym_hits.items():
+                for row in rows:
+                    self.hits[method][row] += 1
+            for stage, seconds in stage_seconds.items():
+                self.stage_seconds[stage] += seconds
+
+    def record_scored(self, rows: np.ndarray) -> None:
+        """Synonym rows whose embeddings were compared in the semantic stage."""
+        with self._lock:
+            np.add.at(self.semantic_scored, rows, 1)
+
+    def snapshot(self) -> Dict:
+        """
+        Counters per concept and synonym, plus `never_matched`: synonyms with no exact, fuzzy or
+        semantic hit in any recorded match (candidates for pruning).
+        """
+        with self._lock:
+            hits = {method: counts.copy() for method, counts in self.hits.items()}
+            scored = self.semantic_scored.copy()
+            stage_seconds = dict(self.stage_seconds)
+            matches = self.matches
+            since = self.since
+
+        concepts: Dict[str, Dict] = {}
+        never_matched = []
+        for key, (start, end) in self.index.spans.items():
+            synonyms = []
+            for row in range(start, end):
+                counts = {method: int(hits[method][row]) for method in HIT_METHODS}
+                synonyms.append({"phrase": self.index.synonyms[row], **counts, "semantic_scored": int(scored[row])})
+                if not any(counts.values()):
+                    never_matched.append({"concept": key, "phrase": self.index.synonyms[row]})
+            concepts[key] = {
+                **{method: int(hits[method][start:end].sum()) for method in HIT_METHODS},
+                "semantic_scored": int(scored[start:end].sum()),
+                "synonyms": synonyms,
+            }
+        return {
+            "fingerprint": self.index.fingerprint,
+            "since": since,
+            "matches": matches,
+            "stage_ms": {
+                stage: {
+                    "total": round(seconds * 1000, 3),
+                    "avg": round(seconds * 1000 / matches, 4) if matches else 0.0,
+                }
+                for stage, seconds in stage_seconds.items()
+            },
+            "concepts": concepts,
+            "never_matched": never_matched,
+        }
+
+
+def dump_telemetry(snapshots: Dict[str, Dict], path: str) -> str:
+    """Writes {concept set: snapshot} as JSON (atomic replace) and returns the path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    handle, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            json.dump({"dumped_at": time.time(), "matchers": snapshots}, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
@@ -0,0 +1,241 @@
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    from backend.data import base_concepts as base_concepts_data
+    from backend.data import concept_sets as concept_sets_data
+    from backend.data import job_templates as job_templates_data
+    from backend.services.concept_index import concept_fingerprint
+    from backend.services.embedding_store import EmbeddingStore
+    from backend.services.keyword_matcher import KeywordMatcher
+    from backend.services.semantic_embedder import SemanticEmbedder
+    from backend.services.tenant_dictionaries import TenantDictionaryStore, TenantQuotaError, validate_concepts
+    from backend.utils.cache import LRUCache
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from data import base_concepts as base_concepts_data
+    from data import concept_sets as concept_sets_data
+    from data import job_templates as job_templates_data
+    from services.concept_index import concept_fingerprint
+    from services.embedding_store import EmbeddingStore
+    from services.keyword_matcher import KeywordMatcher
+    from services.semantic_embedder import SemanticEmbedder
+    from services.tenant_dictionaries import TenantDictionaryStore, TenantQuotaError, validate_concepts
+    from utils.cache import LRUCache
+    from utils.config import config
+    from utils.logger import logger
+
+DEFAULT_CONCEPT_SET = "software_engineering"
+# Artifact name prefix shared by every tenant's embeddings, so their disk use can be summed.
+TENANT_STORE_PREFIX = "concepts-tenant"
+
+
+def _tenant_label(tenant_hash: str) -> str:
+    # Set name of a tenant's matcher (compile stats, telemetry, artifact names): a prefix of the
+    # key's SHA-256 from TenantDictionaryStore.tenant_hash, never of the API key itself.
+    return f"tenant:{tenant_hash[:12]}"
+
+
+def _store_name(name: str) -> str:
+    # Each set gets its own artifact prefix so sets do not evict each other's embeddings;
+    # the default set keeps the prefix the build step pre-encodes.
+    return "concepts" if name == DEFAULT_CONCEPT_SET else f"concepts-{name.replace(':', '-')}"
+
+
+class MatcherRegistry:
+    """
+    Compiled KeywordMatchers per concept set, built on first use and kept in a bounded LRU.
+    All matchers share one embedder so the model is loaded once regardless of the template mix.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        embedder: Optional[SemanticEmbedder] = None,
+        tenants: Optional[TenantDictionaryStore] = None,
+        base_concepts: Optional[Dict[str, Dict]] = None,
+        concept_sets: Optional[Dict[str, Dict]] = None,
+        job_templates: Optional[Dict[str, Dict]] = None,
+        first_pass: Optional[SemanticEmbedder] = None,
+        store_directory: Optional[str] = None,
+    ):
+        # Dictionaries this registry resolves templates against; the catalog passes its snapshot's.
+        # Defaults are read from the data modules now, so they are never an import-time copy.
+        self.base_concepts = base_concepts_data.BASE_CONCEPTS if base_concepts is None else base_concepts
+        self.concept_sets = concept_sets_data.CONCEPT_SETS if concept_sets is None else concept_sets
+        self.job_templates = job_templates_data.JOB_TEMPLATES if job_templates is None else job_templates
+        self.embedder = embedder or SemanticEmbedder()
+        # N-gram first pass fitted on the same dictionaries (None = KeywordMatcher's default).
+        self.first_pass = first_pass
+        # Embedding artifact directory for every matcher (None = EMBEDDING_STORE_DIR).
+        self.store_directory = store_directory
+        self.matchers = LRUCache(max_entries=config.MATCHER_CACHE_SIZE if max_entries is None else max_entries)
+        self.tenants = tenants or TenantDictionaryStore()
+        # Tenant hash -> (dictionary file version, concept fingerprint). Only the compiled matchers
+        # are evicted; this map stays small and lets a request find its matcher without reading disk.
+        self._tenant_versions: Dict[str, Tuple[int, str]] = {}
+        # Concept fingerprint -> set name, for labelling per-matcher telemetry.
+        self.names: Dict[str, str] = {}
+        self.compiles = 0
+        self.compile_seconds = 0.0
+        self.last_compile_ms: Dict[str, float] = {}
+
+    def concepts_for_template(self, template_id: Optional[str]) -> Tuple[str, Dict[str, Dict]]:
+        """
+        (set name, concepts) for a job template: inline "concepts" win, then a named "concept_set",
+        otherwise the software engineering defaults.
+        """
+        template = self.job_templates.get(template_id or "", {})
+        if template.get("concepts"):
+            return f"template:{template_id}", template["concepts"]
+        set_name = template.get("concept_set")
+        if set_name in self.concept_sets:
+            return set_name, self.concept_sets[set_name]
+        return DEFAULT_CONCEPT_SET, self.base_concepts
+
+    def adopt(self, previous: "MatcherRegistry") -> None:
+        """
+        Seeds this registry with another one's compiled matchers and tenant versions. Matchers are
+        keyed by concept fingerprint, so an entry is valid for any registry whose dictionaries
+        still contain those concepts; entries nobody asks for again simply age out of the LRU.
+        Matchers built on another embedder (e.g. n-grams re-fitted on the new dictionaries) are
+        left behind and recompile on first use.
+        """
+        for key, matcher in previous.matchers.items():
+            stale_first_pass = self.first_pass is not None and matcher.first_pass not in (None, self.first_pass)
+            if matcher.embedder is not self.embedder or stale_first_pass:
+                continue
+            self.matchers.set(key, matcher)
+            self.names[key] = previous.names.get(key, key)
+        self._tenant_versions.update(previous._tenant_versions)
+
+    def warm(self) -> int:
+        """Compiles the default set, every named set and inline template sets; returns how many."""
+        sets = {DEFAULT_CONCEPT_SET: self.base_concepts, **self.concept_sets}
+        for template_id, template in self.job_templates.items():
+            if template.get("concepts"):
+                sets[f"template:{template_id}"] = template["concepts"]
+        for name, concepts in sets.items():
+            matcher = self.get(concepts, name)
+            # Concept embeddings come from (or are written to) the artifact store now, not on a request.
+            matcher._synonym_embeddings()
+        return len(sets)
+
+    def _get(self, key: str, name: str, load: Callable[[], Dict[str, Dict]]) -> KeywordMatcher:
+        matcher = self.matchers.get(key)
+        if matcher is None:
+            concepts = load()
+            start = time.perf_counter()
+            store = EmbeddingStore(directory=self.store_directory, name=_store_name(name))
+            matcher = KeywordMatcher(concepts=concepts, embedder=self.embedder, store=store, first_pass=self.first_pass)
+            elapsed = time.perf_counter() - start
+            self.compiles += 1
+            self.compile_seconds += elapsed
+            self.last_compile_ms[name] = round(elapsed * 1000, 2)
+            logger.info(f"Compiled concept set '{name}' in {elapsed * 1000:.1f}ms")
+            self.matchers.set(key, matcher)
+            self.names[key] = name
+            if len(self.names) > len(self.matchers):
+                self.names = {known: label for known, label in list(self.names.items()) if known in self.matchers}
+        return matcher
+
+    def get(self, concepts: Dict[str, Dict], name: str = DEFAULT_CONCEPT_SET) -> KeywordMatcher:
+        return self._get(concept_fingerprint(concepts), name, lambda: concepts)
+
+    def for_template(self, template_id: Optional[str]) -> KeywordMatcher:
+        name, concepts = self.concepts_for_template(template_id)
+        return self.get(concepts, name)
+
+    def _tenant_store(self, tenant_hash: str) -> EmbeddingStore:
+        return EmbeddingStore(directory=self.store_directory, name=_store_name(_tenant_label(tenant_hash)))
+
+    def register_tenant(self, api_key: str, concepts: Dict) -> KeywordMatcher:
+        """
+        Validates, compiles and persists a tenant dictionary. Raises ValueError when invalid and
+        TenantQuotaError (a ValueError) when a new tenant or more artifact disk would exceed the caps.
+        Callers must only pass authenticated tenant keys (see utils.security.is_tenant_key).
+        """
+        concepts = validate_concepts(concepts)
+        tenant = self.tenants.tenant_hash(api_key)
+        if self.tenants.version(api_key) is None and self.tenants.count() >= config.TENANT_MAX_COUNT:
+            raise TenantQuotaError(f"At most {config.TENANT_MAX_COUNT} tenant dictionaries can be stored.")
+        # This tenant's own artifacts are replaced by the upload, so they do not count against it.
+        others = EmbeddingStore(directory=self.store_directory, name=TENANT_STORE_PREFIX).disk_usage() - self._tenant_store(tenant).disk_usage()
+        if others >= config.TENANT_ARTIFACT_MAX_BYTES:
+            raise TenantQuotaError("Tenant embedding storage is full; remove unused dictionaries first.")
+        matcher = self.get(concepts, name=_tenant_label(tenant))
+        self.tenants.save(api_key, concepts)
+        self._tenant_versions[tenant] = (self.tenants.version(api_key), matcher.index.fingerprint)
+        return matcher
+
+    def remove_tenant(self, api_key: str) -> bool:
+        """Deletes the tenant's dictionary file and its embedding artifacts (its matcher ages out)."""
+        tenant = self.tenants.tenant_hash(api_key)
+        self._tenant_versions.pop(tenant, None)
+        self._tenant_store(tenant).remove_all()
+        return self.tenants.delete(api_key)
+
+    def for_tenant(self, api_key: Optional[str]) -> Optional[KeywordMatcher]:
+        """
+        The caller's compiled dictionary, or None if it never uploaded one. Evicted matchers are
+        recompiled from the dictionary file; a newer file (uploaded via another worker) wins.
+        """
+        if not api_key:
+            return None
+        version = self.tenants.version(api_key)
+        tenant = self.tenants.tenant_hash(api_key)
+        if version is None:
+            self._tenant_versions.pop(tenant, None)
+            return None
+        known = self._tenant_versions.get(tenant)
+        concepts = None
+        if known is None or known[0] != version or known[1] not in self.matchers:
+            loaded = self.tenants.load(api_key)
+            if loaded is None:
+                return None
+            version, concepts = loaded
+            known = (version, concept_fingerprint(concepts))
+            self._tenant_versions[tenant] = known
+
+        def load() -> Dict[str, Dict]:
+            # The matcher may have been evicted (e.g. by warm-up) since the check above; compile
+            # from the tenant's own file then, never from None (which would mean the defaults).
+            if concepts is not None:
+                return concepts
+            reloaded = self.tenants.load(api_key)
+            if reloaded is None:
+                raise LookupError("tenant dictionary removed")
+            return reloaded[1]
+
+        try:
+            return self._get(known[1], _tenant_label(tenant), load)
+        except LookupError:
+            self._tenant_versions.pop(tenant, None)
+            return None
+
+    def for_request(self, template_id: Optional[str] = None, api_key: Optional[str] = None) -> KeywordMatcher:
+        """Tenant dictionary first, then the template's concept set, then the defaults."""
+        return self.for_tenant(api_key) or self.for_template(template_id)
+
+    def telemetry(self, include_tenants: bool = False) -> Dict[str, Dict]:
+        """Hit/timing telemetry of every compiled matcher, keyed by concept set name."""
+        snapshots = {}
+        for key, matcher in self.matchers.items():
+            name = self.names.get(key, key)
+            if matcher.telemetry is None or (name.startswith("tenant:") and not include_tenants):
+                continue
+            snapshots[name] = matcher.telemetry.snapshot()
+        return snapshots
+
+    def stats(self) -> Dict:
+        cache = self.matchers.stats()
+        lookups = cache["hits"] + cache["misses"]
+        return {
+            **cache,
+            "hit_rate": round(cache["hits"] / lookups, 4) if lookups else 0.0,
+            "compiles": self.compiles,
+            "avg_compile_ms": round(self.compile_seconds * 1000 / self.compiles, 2) if self.compiles else 0.0,
+            "last_compile_ms": dict(self.last_compile_ms),
+            "tenants": len(self._tenant_versions),
+        }
@@ -0,0 +1,70 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+@lru_cache(maxsize=65536)
+def _bucket(gram: str, dim: int) -> int:
+    return int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little") % dim
+
+
+class NGramVectorizer:
+    """
+    Model-free text vectors: hashed character n-grams of each word, sublinear TF times IDF, then
+    L2-normalized, so inflections and compounds ("troubleshot"/"troubleshooting") score close.
+    Rows are dense float32 (not CSR) to share the transformer embeddings' scoring and storage
+    paths; benchmarks/bench_ngram_semantic.py compares the two layouts.
+    """
+
+    def __init__(self, dim: int = 2048, ngram_range: Tuple[int, int] = (3, 5), idf_corpus: Optional[Iterable[str]] = None):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.idf = np.ones(dim, dtype=np.float32)
+        corpus = list(idf_corpus or [])
+        if corpus:
+            self.fit(corpus)
+        digest = hashlib.sha256(self.idf.tobytes()).hexdigest()[:8]
+        # Stands in for a model name: embedding artifacts and chunk caches are keyed by it.
+        self.name = f"ngram-{dim}-{ngram_range[0]}{ngram_range[1]}-{digest}"
+
+    def grams(self, text: str) -> List[str]:
+        low, high = self.ngram_range
+        grams: List[str] = []
+        for word in _WORD_RE.findall(text.lower()):
+            padded = f" {word} "
+            for size in range(low, high + 1):
+                if len(padded) <= size:
+                    grams.append(padded)
+                    break
+                grams.extend(padded[start:start + size] for start in range(len(padded) - size + 1))
+        return grams
+
+    def fit(self, corpus: List[str]) -> None:
+        """Smoothed IDF over `corpus` (e.g. every dictionary synonym), so shared suffixes like "ing" weigh less."""
+        document_frequency = np.zeros(self.dim, dtype=np.float64)
+        for text in corpus:
+            buckets = {_bucket(gram, self.dim) for gram in self.grams(text)}
+            document_frequency[list(buckets)] += 1
+        self.idf = (np.log((1 + len(corpus)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    def encode(self, texts: Union[str, List[str]], normalize_embeddings: bool = True) -> np.ndarray:
+        """Same call shape as SentenceTransformer.encode: a matrix for a list, a vector for one text."""
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        matrix = np.zeros((len(batch), self.dim), dtype=np.float32)
+        for row, text in enumerate(batch):
+            grams = self.grams(text)
+            if grams:
+                np.add.at(matrix[row], [_bucket(gram, self.dim) for gram in grams], 1.0)
+        # Sublinear term frequency so a repeated word does not swamp the rest of the chunk.
+        np.log1p(matrix, out=matrix)
+        matrix *= self.idf
+        if normalize_embeddings:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix[0] if single else matrix
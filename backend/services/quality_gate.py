@@ -1,9 +1,11 @@
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
+    from backend.services.text_index import TextIndex
     from backend.utils.config import config
 except ImportError:
+    from services.text_index import TextIndex
     from utils.config import config
 
 
@@ -33,9 +35,9 @@ class QualityGate:
         location = bool(re.search(r"\\b(?:[A-Z][a-z]+\\s?){1,2},?\\s?(?:[A-Z]{2}|[A-Za-z]+)\\b", resume_text or ""))
         return {"email": email, "phone": phone, "location": location}
 
-    def detect_location_requirement(self, job_description: str) -> bool:
-        jd_text = (job_description or "").lower()
-        return any(keyword in jd_text for keyword in config.LOCATION_REQUIRED_KEYWORDS)
+    def detect_location_requirement(self, job_description: str, jd_index: Optional[TextIndex] = None) -> bool:
+        jd_index = jd_index or TextIndex(job_description)
+        return any(jd_index.contains(keyword) for keyword in config.LOCATION_REQUIRED_KEYWORDS)
 
     def detect_hallucinated_keywords(self, matches: List[Dict]) -> List[str]:
         """Flags semantic matches that are low-confidence."""
@@ -45,23 +47,41 @@ class QualityGate:
                 hallucinated.append(match["label"])
         return hallucinated
 
-    def contact_location_gates(self, job_description: str, resume_text: str) -> List[str]:
+    def contact_location_gates(
+        self,
+        job_description: str,
+        resume_text: str,
+        pii: Optional[Dict[str, bool]] = None,
+        location_required: Optional[bool] = None,
+    ) -> List[str]:
         warnings: List[str] = []
-        pii = self.detect_pii_presence(resume_text)
+        pii = pii or self.detect_pii_presence(resume_text)
 
         if not pii["email"]:
             warnings.append("Add a contact email so recruiters can reach you.")
         if not pii["phone"]:
             warnings.append("Add a phone number for fast scheduling.")
 
-        if self.detect_location_requirement(job_description) and not pii["location"]:
+        if location_required is None:
+            location_required = self.detect_location_requirement(job_description)
+        if location_required and not pii["location"]:
             warnings.append("JD requires onsite/hybrid; include your city/region to confirm location fit.")
         return warnings
 
-    def run(self, resume_text: str, job_description: str, matches: List[Dict]) -> Dict:
+    def run(
+        self,
+        resume_text: str,
+        job_description: str,
+        matches: List[Dict],
+        location_required: Optional[bool] = None,
+    ) -> Dict:
+        """`location_required` comes precomputed from the JD analysis when the caller has one."""
         lint_warnings = self.lint_resume(resume_text)
         hallucinated = self.detect_hallucinated_keywords(matches)
-        contact_warnings = self.contact_location_gates(job_description, resume_text)
+        pii = self.detect_pii_presence(resume_text)
+        contact_warnings = self.contact_location_gates(
+            job_description, resume_text, pii=pii, location_required=location_required
+        )
 
         gates: List[str] = lint_warnings + contact_warnings
         if hallucinated:
@@ -70,5 +90,5 @@ class QualityGate:
         return {
             "warnings": gates,
             "hallucinated": hallucinated,
-            "pii_detected": self.detect_pii_presence(resume_text),
+            "pii_detected": pii,
         }
@@ -0,0 +1,183 @@
+import argparse
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from backend.utils.logger import logger
+except ImportError:
+    from utils.logger import logger
+
+
+@dataclass(slots=True)
+class QuantizedMatrix:
+    """
+    Embedding rows stored as int8 codes with one float32 scale per row (symmetric, per-vector):
+    row ~= codes * scale. A 384-dim row takes 388 bytes instead of 1536. This is a storage format
+    (artifacts on disk, cached text embeddings), not a faster one: numpy has no BLAS path for
+    integer products, so scoring runs in float32. Dictionary matrices are expanded once when a
+    matcher loads them; only the few per-request rows are upcast in `cosine_scores`.
+    """
+
+    codes: np.ndarray
+    scales: np.ndarray
+
+    @classmethod
+    def quantize(cls, matrix: np.ndarray) -> "QuantizedMatrix":
+        matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        safe = np.where(scales > 0, scales, 1.0)
+        codes = np.clip(np.rint(matrix / safe[:, None]), -127, 127).astype(np.int8)
+        return cls(codes, scales.astype(np.float32))
+
+    @classmethod
+    def stack(cls, rows: Sequence["QuantizedMatrix"]) -> "QuantizedMatrix":
+        return cls(np.concatenate([row.codes for row in rows]), np.concatenate([row.scales for row in rows]))
+
+    def copy(self) -> "QuantizedMatrix":
+        return QuantizedMatrix(self.codes.copy(), self.scales.copy())
+
+    def dequantize(self) -> np.ndarray:
+        return self.codes.astype(np.float32) * self.scales[:, None]
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, rows) -> "QuantizedMatrix":
+        """Row selection; an integer keeps a one-row matrix so rows can be cached and stacked."""
+        if isinstance(rows, (int, np.integer)):
+            rows = slice(rows, rows + 1 if rows != -1 else None)
+        return QuantizedMatrix(self.codes[rows], self.scales[rows])
+
+    def __iter__(self) -> Iterator["QuantizedMatrix"]:
+        return (self[row] for row in range(len(self)))
+
+
+Embeddings = Union[np.ndarray, QuantizedMatrix]
+
+
+def cosine_scores(left: Embeddings, right: Embeddings) -> np.ndarray:
+    """
+    `left @ right.T` for plain or quantized rows. Quantized operands are upcast to float32 on every
+    call (code products are exact in float32: 127^2 times a few hundred dimensions stays far below
+    2^24) and their scales applied to the result, so pass large matrices already as float32 (see
+    `KeywordMatcher._semantic_embeddings`); an int8 operand costs a copy, not a faster product.
+    """
+    left_scales = right_scales = None
+    if isinstance(left, QuantizedMatrix):
+        left, left_scales = left.codes.astype(np.float32), left.scales
+    if isinstance(right, QuantizedMatrix):
+        right, right_scales = right.codes.astype(np.float32), right.scales
+    scores = np.asarray(left, dtype=np.float32) @ np.asarray(right, dtype=np.float32).T
+    if left_scales is not None:
+        scores *= left_scales[:, None]
+    if right_scales is not None:
+        scores *= right_scales[None, :]
+    return scores
+
+
+def as_float(matrix: Embeddings) -> np.ndarray:
+    return matrix.dequantize() if isinstance(matrix, QuantizedMatrix) else np.asarray(matrix, dtype=np.float32)
+
+
+def stack_rows(rows: List[Embeddings]) -> Embeddings:
+    if rows and isinstance(rows[0], QuantizedMatrix):
+        return QuantizedMatrix.stack(rows)
+    return np.stack(rows)
+
+
+class PCAProjection:
+    """
+    Linear projection to fewer dimensions fitted offline on dictionary phrases (see main()).
+    Projected rows are re-normalized so dot products stay cosines. Saved as .npz together with
+    the name of the model it was fitted for, since it only applies to that model's vectors.
+
+    Lossy, unlike int8 alone: benchmarks/bench_quantized_embeddings.py measures a max score drift
+    of 0.24 (n-grams, 512 dims) and 0.34 (hash, 128 dims) on the fixtures, and the hash backend's
+    semantic hits change. Check recall on your own resumes before enabling it.
+    """
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray, model_name: str):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)
+        self.model_name = model_name
+        digest = hashlib.sha256(self.components.tobytes()).hexdigest()[:8]
+        self.name = f"pca{self.components.shape[0]}-{digest}"
+
+    @classmethod
+    def fit(cls, matrix: np.ndarray, dim: int, model_name: str) -> "PCAProjection":
+        matrix = np.asarray(matrix, dtype=np.float32)
+        mean = matrix.mean(axis=0)
+        # Right singular vectors of the centered data are the principal axes, largest first.
+        _, _, axes = np.linalg.svd(matrix - mean, full_matrices=False)
+        return cls(mean, axes[:dim], model_name)
+
+    def apply(self, matrix: np.ndarray) -> np.ndarray:
+        projected = (np.asarray(matrix, dtype=np.float32) - self.mean) @ self.components.T
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        np.divide(projected, norms, out=projected, where=norms > 0)
+        return projected
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(path, mean=self.mean, components=self.components, model_name=np.array(self.model_name))
+
+    @classmethod
+    def load(cls, path: str) -> "PCAProjection":
+        with np.load(path) as data:
+            return cls(data["mean"], data["components"], str(data["model_name"]))
+
+
+def load_projection(path: str, model_name: str) -> Optional[PCAProjection]:
+    """The projection at `path` when it was fitted for `model_name`; None (with a warning) otherwise."""
+    if not path:
+        return None
+    try:
+        projection = PCAProjection.load(path)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.warning(f"PCA projection unavailable: {exc}")
+        return None
+    if projection.model_name != model_name:
+        logger.warning(f"Ignoring PCA projection fitted for {projection.model_name}, not {model_name}")
+        return None
+    logger.info(f"Using PCA projection {projection.name}: similarity scores differ from the full model's")
+    return projection
+
+
+def main() -> None:
+    """Offline step: fits a PCA projection on every dictionary synonym for SEMANTIC_PCA_PATH."""
+    try:
+        from backend.services.semantic_embedder import SemanticEmbedder, installed_dictionary_phrases
+    except ImportError:
+        from services.semantic_embedder import SemanticEmbedder, installed_dictionary_phrases
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("output", help="destination .npz path")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--backend", default=None, help="semantic backend to fit for (default: SEMANTIC_BACKEND)")
+    args = parser.parse_args()
+
+    # Raw float vectors: fitting must not see an existing projection or quantization.
+    embedder = SemanticEmbedder(backend=args.backend, quantize=False, projection_path="")
+    if not embedder.model:
+        print("Embedding model unavailable; nothing to fit.")
+        return
+    phrases = sorted(set(installed_dictionary_phrases()))
+    projection = PCAProjection.fit(embedder.encode_batch(phrases), args.dim, embedder.model_name)
+    projection.save(args.output)
+    print(f"Fitted {projection.name} for {embedder.model_name} on {len(phrases)} phrases -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,298 @@
+import hashlib
+import threading
+import time
 from functools import lru_cache
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
 try:
-    from sentence_transformers import SentenceTransformer, util
-except Exception:  # pragma: no cover - optional dependency
-    SentenceTransformer = None
-    util = None
+    from backend.data import base_concepts, concept_sets
+    from backend.services.embedding_backends import (
+        EmbeddingBackendError,
+        HashBackend,
+        OnnxBackend,
+        SentenceTransformerBackend,
+    )
+    from backend.services.embedding_service import EmbeddingServiceClient
+    from backend.services.ngram_vectorizer import NGramVectorizer
+    from backend.services.quantization import (
+        Embeddings,
+        PCAProjection,
+        QuantizedMatrix,
+        cosine_scores,
+        load_projection,
+        stack_rows,
+    )
+    from backend.utils.cache import ByteLRUCache
+    from backend.utils.config import config
+except ImportError:
+    from data import base_concepts, concept_sets
+    from services.embedding_backends import (
+        EmbeddingBackendError,
+        HashBackend,
+        OnnxBackend,
+        SentenceTransformerBackend,
+    )
+    from services.embedding_service import EmbeddingServiceClient
+    from services.ngram_vectorizer import NGramVectorizer
+    from services.quantization import (
+        Embeddings,
+        PCAProjection,
+        QuantizedMatrix,
+        cosine_scores,
+        load_projection,
+        stack_rows,
+    )
+    from utils.cache import ByteLRUCache
+    from utils.config import config
+
+SEMANTIC_BACKENDS = ("transformer", "onnx", "ngram", "hash", "auto")
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def dictionary_phrases(base: Dict[str, Dict], sets: Dict[str, Dict]) -> List[str]:
+    """
+    IDF corpus for the n-gram backend: every synonym of the default and named concept sets, so
+    weights do not depend on which concept set a request happens to use.
+    """
+    return [synonym for concepts in [base, *sets.values()] for concept in concepts.values() for synonym in concept["synonyms"]]
+
+
+def installed_dictionary_phrases() -> List[str]:
+    """Phrases of the data modules as they are now, for embedders built outside the catalog."""
+    # Attribute reads at call time, so a catalog reload (importlib.reload) is seen here too.
+    return dictionary_phrases(base_concepts.BASE_CONCEPTS, concept_sets.CONCEPT_SETS)
+
+
+# Encoder factories by backend; each takes the configured model name (only the transformer uses it)
+# and the n-gram IDF corpus (None = installed_dictionary_phrases()).
+LOCAL_BACKENDS = {
+    "transformer": lambda model_name, corpus: SentenceTransformerBackend(model_name),
+    "onnx": lambda model_name, corpus: OnnxBackend(config.SEMANTIC_ONNX_PATH, threads=config.SEMANTIC_ONNX_THREADS),
+    "ngram": lambda model_name, corpus: NGramVectorizer(
+        dim=config.SEMANTIC_NGRAM_DIM, idf_corpus=installed_dictionary_phrases() if corpus is None else corpus
+    ),
+    "hash": lambda model_name, corpus: HashBackend(dim=config.SEMANTIC_HASH_DIM),
+}
+
+
+def backend_threshold(backend: str) -> Optional[float]:
+    """Similarity cutoff for encoders whose scores are not on the transformer's scale."""
+    return {"ngram": config.SEMANTIC_NGRAM_THRESHOLD, "hash": config.SEMANTIC_HASH_THRESHOLD}.get(backend)
+
+
+def load_local_model(
+    backend: str, model_name: str, idf_corpus: Optional[List[str]] = None
+) -> Tuple[Optional[Any], str, Optional[str]]:
+    """
+    In-process encoder for `backend`: (model or None, resolved backend, load error). "auto"
+    resolves to "transformer" when the model loads and to "ngram" otherwise.
+    """
+    error = None
+    for candidate in ("transformer", "ngram") if backend == "auto" else (backend,):
+        try:
+            return LOCAL_BACKENDS[candidate](model_name, idf_corpus), candidate, error
+        except EmbeddingBackendError as exc:
+            error = str(exc)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+    return None, backend, error
 
 
 class SemanticEmbedder:
     """
-    Thin wrapper around sentence-transformers with caching and graceful fallback
+    Thin wrapper around an embedding backend with caching and graceful fallback
     when the model isn't available (e.g., offline environments).
+
+    `backend` picks the encoder (see embedding_backends): "transformer" (default), "onnx" (a locally
+    exported model on ONNX Runtime, SEMANTIC_ONNX_PATH), "ngram" (hashed character n-gram TF-IDF,
+    no model download), "hash" (deterministic fake for tests and CI) or "auto" (transformer,
+    falling back to n-grams when it cannot load).
+    `threshold` is the backend's own similarity cutoff; None means the matcher default.
+    Embeddings are cached per text hash in a byte-bounded LRU (SEMANTIC_EMBEDDING_CACHE_BYTES).
+    `load=False` defers loading the model to an explicit `load()`, e.g. from a background thread.
+
+    Storage mode: `projection_path` (SEMANTIC_PCA_PATH) applies a PCA projection fitted offline
+    for this model, and `quantize` (SEMANTIC_QUANTIZE) returns QuantizedMatrix rows (int8 codes +
+    per-row scales) instead of float32. Both are part of `model_name`, so artifacts and caches of
+    different modes never mix.
+
+    With `service_socket` (EMBEDDING_SERVICE_SOCKET) the model lives in the shared embedding
+    service process and is only loaded in-process when the service is unreachable.
+
+    `idf_corpus` is the n-gram backend's IDF corpus; the catalog passes its snapshot's phrases
+    (see for_corpus), and None means the installed data modules.
     """
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        backend: Optional[str] = None,
+        load: bool = True,
+        quantize: Optional[bool] = None,
+        projection_path: Optional[str] = None,
+        service_socket: Optional[str] = None,
+        idf_corpus: Optional[List[str]] = None,
+    ):
+        backend = (config.SEMANTIC_BACKEND if backend is None else backend).lower()
+        if backend not in SEMANTIC_BACKENDS:
+            raise ValueError(f"Unknown semantic backend {backend!r}; expected one of {', '.join(SEMANTIC_BACKENDS)}.")
+        self.backend = backend
+        self.requested_model_name = model_name
         self.model_name = model_name
+        self.idf_corpus = idf_corpus
         self.model = None
-        if SentenceTransformer:
-            try:
-                self.model = SentenceTransformer(model_name)
-            except Exception:
-                self.model = None
-
-    @lru_cache(maxsize=256)
-    def _encode(self, text: str) -> Optional[np.ndarray]:
-        if not self.model or not text.strip():
+        self.threshold: Optional[float] = None
+        self.quantize = config.SEMANTIC_QUANTIZE if quantize is None else quantize
+        self.projection_path = config.SEMANTIC_PCA_PATH if projection_path is None else projection_path
+        self.projection: Optional[PCAProjection] = None
+        self.service_socket = config.EMBEDDING_SERVICE_SOCKET if service_socket is None else service_socket
+        # "pending" until load() runs, then "loading" and finally "ready" or "unavailable".
+        self.state = "pending"
+        self.load_ms: Optional[float] = None
+        self.load_error: Optional[str] = None
+        self._load_lock = threading.Lock()
+        self.cache = ByteLRUCache(max_bytes=config.SEMANTIC_EMBEDDING_CACHE_BYTES)
+        if load:
+            self.load()
+
+    def load(self) -> bool:
+        """
+        Loads the model (once; safe to call from a background thread). Until it finishes `model`
+        is None, so callers skip the semantic stage. Returns whether a model is available.
+        """
+        with self._load_lock:
+            if self.state in ("ready", "unavailable"):
+                return self.model is not None
+            self.state = "loading"
+            start = time.perf_counter()
+            if self.idf_corpus is None:
+                self.idf_corpus = installed_dictionary_phrases()
+            model = None
+            if self.service_socket:
+                model = EmbeddingServiceClient.connect(
+                    self.service_socket,
+                    fallback=lambda backend, name: load_local_model(backend, name, self.idf_corpus)[0],
+                    timeout=config.EMBEDDING_SERVICE_TIMEOUT,
+                )
+                if model is not None:
+                    # The service decides which model runs; the fallback must rebuild that one.
+                    self.backend = model.backend
+                    self.model_name = model.name
+            if model is None:
+                model, self.backend, self.load_error = load_local_model(self.backend, self.model_name, self.idf_corpus)
+                if model is not None:
+                    self.model_name = model.name
+            self.threshold = backend_threshold(self.backend)
+            if model is not None:
+                self.projection = load_projection(self.projection_path, self.model_name)
+                if self.projection is not None:
+                    self.model_name = f"{self.model_name}+{self.projection.name}"
+                if self.quantize:
+                    self.model_name = f"{self.model_name}+int8"
+            # Published last, so a concurrent reader never sees the model under its old name.
+            self.model = model
+            self.load_ms = round((time.perf_counter() - start) * 1000, 1)
+            self.state = "ready" if model is not None else "unavailable"
+            return model is not None
+
+    def for_corpus(self, phrases: List[str]) -> "SemanticEmbedder":
+        """
+        This embedder with `phrases` as its n-gram IDF corpus. Before loading, the corpus is simply
+        adopted. A loaded in-process n-gram model whose corpus changed is not mutated under
+        concurrent readers: a new embedder is returned, which the catalog swaps in with its
+        snapshot. Other backends do not depend on the dictionary and return self.
+        """
+        phrases = list(phrases)
+        with self._load_lock:
+            if self.state == "pending":
+                self.idf_corpus = phrases
+                return self
+        if not isinstance(self.model, NGramVectorizer) or phrases == self.idf_corpus:
+            return self
+        return SemanticEmbedder(
+            model_name=self.requested_model_name,
+            backend="ngram",
+            quantize=self.quantize,
+            projection_path=self.projection_path,
+            service_socket="",
+            idf_corpus=phrases,
+        )
+
+    def status(self) -> Dict:
+        return {
+            "state": self.state,
+            "backend": self.backend,
+            "model": self.model_name,
+            "load_ms": self.load_ms,
+            "error": self.load_error,
+            "service": self.service_socket if isinstance(self.model, EmbeddingServiceClient) else None,
+        }
+
+    def service_stats(self) -> Optional[Dict]:
+        """Queue depth and batch-size histogram of the shared embedding service, when in use."""
+        return self.model.stats() if isinstance(self.model, EmbeddingServiceClient) else None
+
+    def encode_batch(self, texts: List[str]) -> Optional[Embeddings]:
+        """
+        Embeddings for `texts`, one row each. Cached rows are looked up by text hash and only the
+        misses go to the model, in a single call. Rows are L2-normalized, so `cosine_scores`
+        between two batches (a plain matrix product for float32) yields cosine similarities.
+        """
+        if not self.model or not texts:
             return None
-        return self.model.encode(text, normalize_embeddings=True)
+        keys = [hashlib.sha1(text.encode("utf-8")).digest() for text in texts]
+        rows: Dict[bytes, Embeddings] = {}
+        misses: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in rows or key in misses:
+                continue
+            row = self.cache.get(key)
+            if row is None:
+                misses[key] = text
+            else:
+                rows[key] = row
+        if misses:
+            embeddings = np.asarray(self.model.encode(list(misses.values()), normalize_embeddings=True), dtype=np.float32)
+            if self.projection is not None:
+                embeddings = self.projection.apply(embeddings)
+            if self.quantize:
+                embeddings = QuantizedMatrix.quantize(embeddings)
+            for key, row in zip(misses, embeddings):
+                # Copy so a cached row does not keep the whole batch matrix alive.
+                rows[key] = row.copy()
+                self.cache.set(key, rows[key])
+        return stack_rows([rows[key] for key in keys])
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.cache.stats()
 
     def similarity(self, text: str, candidates: Iterable[str]) -> Tuple[float, Optional[str]]:
         """
         Returns the best similarity score and the candidate phrase that matched.
         """
-        if not self.model or not util:
+        if not self.model or not text.strip():
             return 0.0, None
-
-        base_emb = self._encode(text)
-        if base_emb is None:
+        phrases = [phrase for phrase in candidates if phrase.strip()]
+        if not phrases:
             return 0.0, None
 
-        best_score = 0.0
-        best_phrase: Optional[str] = None
-
-        for phrase in candidates:
-            emb = self._encode(phrase)
-            if emb is None:
-                continue
-            score = float(util.cos_sim(base_emb, emb))
-            if score > best_score:
-                best_score = score
-                best_phrase = phrase
-
-        return best_score, best_phrase
+        embeddings = self.encode_batch([text, *phrases])
+        # Every backend returns L2-normalized vectors, so the dot product is the cosine.
+        scores = cosine_scores(embeddings[1:], embeddings[0:1])[:, 0]
+        best = int(scores.argmax())
+        if scores[best] <= 0.0:
+            return 0.0, None
+        return float(scores[best]), phrases[best]
 
     def any_above_threshold(self, text: str, candidates: Iterable[str], threshold: float = 0.6) -> Tuple[bool, float, Optional[str]]:
         score, phrase = self.similarity(text, candidates)
         return score >= threshold, score, phrase
+
+
+@lru_cache(maxsize=1)
+def ngram_embedder() -> SemanticEmbedder:
+    """Process-wide n-gram embedder, shared by every matcher that runs it as a first pass."""
+    # Always in-process: the shared service may run a different backend, and n-grams are cheap.
+    return SemanticEmbedder(backend="ngram", service_socket="")
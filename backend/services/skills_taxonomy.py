@@ -0,0 +1,253 @@
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from backend.services.text_index import normalize_text, stem, tokenize
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from services.text_index import normalize_text, stem, tokenize
+    from utils.config import config
+    from utils.logger import logger
+
+# Bump when the on-disk layout changes so stale artifacts are rebuilt instead of misread.
+ARTIFACT_VERSION = 1
+_ARRAYS = (
+    "offsets",
+    "edge_hash",
+    "edge_child",
+    "terminal",
+    "key_blob",
+    "key_offsets",
+    "label_blob",
+    "label_offsets",
+)
+
+
+def token_hash(token: str) -> int:
+    """64-bit token hash (kept positive so it fits int64 arrays)."""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") & 0x7FFF_FFFF_FFFF_FFFF
+
+
+def read_taxonomy(path: str) -> Iterable[Tuple[str, str, List[str]]]:
+    """
+    Yields (skill id, label, aliases) from a CSV with id,label,aliases columns (aliases separated
+    by "|") or a JSONL file of {"id", "label", "aliases"} objects.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".json")):
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield str(row["id"]), row["label"], list(row.get("aliases") or [])
+        else:
+            for row in csv.DictReader(f):
+                aliases = [alias for alias in (row.get("aliases") or "").split("|") if alias.strip()]
+                yield row["id"], row["label"], aliases
+
+
+def _pack_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8) if encoded else np.zeros(0, dtype=np.uint8)
+    return blob, offsets
+
+
+class TaxonomyIndex:
+    """
+    Token trie over every skill label and alias, flattened into CSR arrays (per-node edge ranges
+    sorted by token hash) and stored as .npy files that are opened with mmap. Loading is a few
+    file opens regardless of taxonomy size, and extraction is one left-to-right pass whose
+    per-token cost is a binary search, so it does not grow with the number of skills.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], morphology: bool = False):
+        self.morphology = morphology
+        self.offsets = arrays["offsets"]
+        self.edge_hash = arrays["edge_hash"]
+        self.edge_child = arrays["edge_child"]
+        self.terminal = arrays["terminal"]
+        self._keys = (arrays["key_blob"], arrays["key_offsets"])
+        self._labels = (arrays["label_blob"], arrays["label_offsets"])
+        self._root_edges = np.asarray(self.edge_hash[self.offsets[0]:self.offsets[1]])
+
+    def __len__(self) -> int:
+        return len(self._keys[1]) - 1
+
+    @staticmethod
+    def _string(packed: Tuple[np.ndarray, np.ndarray], row: int) -> str:
+        blob, offsets = packed
+        return bytes(blob[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def key(self, skill: int) -> str:
+        return self._string(self._keys, skill)
+
+    def label(self, skill: int) -> str:
+        return self._string(self._labels, skill)
+
+    def canonical_tokens(self, tokens: List[str]) -> List[str]:
+        return [stem(token) for token in tokens] if self.morphology else tokens
+
+    @classmethod
+    def compile(cls, skills: Iterable[Tuple[str, str, List[str]]], morphology: bool = False) -> Dict[str, np.ndarray]:
+        """Builds the flattened trie arrays from (id, label, aliases) rows."""
+        children: List[Dict[int, int]] = [{}]
+        terminal: List[int] = [-1]
+        keys: List[str] = []
+        labels: List[str] = []
+        for skill_key, label, aliases in skills:
+            skill = len(keys)
+            keys.append(skill_key)
+            labels.append(label)
+            for phrase in [label, *aliases]:
+                tokens = tokenize(normalize_text(phrase))
+                if morphology:
+                    tokens = [stem(token) for token in tokens]
+                if not tokens:
+                    continue
+                node = 0
+                for token in tokens:
+                    hashed = token_hash(token)
+                    child = children[node].get(hashed)
+                    if child is None:
+                        child = len(children)
+                        children[node][hashed] = child
+                        children.append({})
+                        terminal.append(-1)
+                    node = child
+                # An alias shared by several skills keeps the first skill that declared it.
+                if terminal[node] < 0:
+                    terminal[node] = skill
+
+        offsets = np.zeros(len(children) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(edges) for edges in children])
+        edge_hash = np.empty(int(offsets[-1]), dtype=np.int64)
+        edge_child = np.empty(int(offsets[-1]), dtype=np.int32)
+        for node, edges in enumerate(children):
+            ordered = sorted(edges.items())
+            start = offsets[node]
+            edge_hash[start:start + len(ordered)] = [hashed for hashed, _ in ordered]
+            edge_child[start:start + len(ordered)] = [child for _, child in ordered]
+
+        key_blob, key_offsets = _pack_strings(keys)
+        label_blob, label_offsets = _pack_strings(labels)
+        return {
+            "offsets": offsets,
+            "edge_hash": edge_hash,
+            "edge_child": edge_child,
+            "terminal": np.asarray(terminal, dtype=np.int32),
+            "key_blob": key_blob,
+            "key_offsets": key_offsets,
+            "label_blob": label_blob,
+            "label_offsets": label_offsets,
+        }
+
+    def _child(self, node: int, hashed: int) -> int:
+        start, end = int(self.offsets[node]), int(self.offsets[node + 1])
+        if start == end:
+            return -1
+        edges = self.edge_hash[start:end]
+        slot = int(np.searchsorted(edges, hashed))
+        if slot < end - start and edges[slot] == hashed:
+            return int(self.edge_child[start + slot])
+        return -1
+
+    def extract(self, tokens: List[str]) -> Dict[int, str]:
+        """
+        Leftmost-longest, non-overlapping skill mentions in `tokens` (already canonical, see
+        `canonical_tokens`): {skill id: first matched phrase}.
+        """
+        found: Dict[int, str] = {}
+        if not tokens or not len(self._root_edges):
+            return found
+        hashes = [token_hash(token) for token in tokens]
+        # Root transitions for every token in one vectorized lookup; deeper steps are rare.
+        hash_array = np.asarray(hashes, dtype=np.int64)
+        slots = np.minimum(np.searchsorted(self._root_edges, hash_array), len(self._root_edges) - 1)
+        starts = np.flatnonzero(self._root_edges[slots] == hash_array)
+        root_base = int(self.offsets[0])
+
+        covered = 0
+        for start in starts.tolist():
+            if start < covered:
+                continue
+            node = int(self.edge_child[root_base + int(slots[start])])
+            best_end, best_skill = -1, -1
+            position = start
+            while True:
+                skill = int(self.terminal[node])
+                if skill >= 0:
+                    best_end, best_skill = position + 1, skill
+                position += 1
+                if position >= len(tokens):
+                    break
+                node = self._child(node, hashes[position])
+                if node < 0:
+                    break
+            if best_skill >= 0:
+                found.setdefault(best_skill, " ".join(tokens[start:best_end]))
+                covered = best_end
+        return found
+
+
+class TaxonomyStore:
+    """Builds taxonomy artifacts next to other derived data and opens them memory-mapped."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = config.SKILLS_TAXONOMY_DIR if directory is None else directory
+
+    @staticmethod
+    def fingerprint(source_path: str, morphology: bool) -> str:
+        # Size + mtime instead of a content hash keeps startup O(1) in the taxonomy size.
+        info = os.stat(source_path)
+        payload = f"{ARTIFACT_VERSION}:{os.path.abspath(source_path)}:{info.st_size}:{info.st_mtime_ns}:{morphology}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def path_for(self, source_path: str, morphology: bool) -> str:
+        return os.path.join(self.directory, f"taxonomy-{self.fingerprint(source_path, morphology)}")
+
+    @staticmethod
+    def _load(path: str, morphology: bool) -> Optional[TaxonomyIndex]:
+        if not os.path.isdir(path):
+            return None
+        try:
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in _ARRAYS}
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable taxonomy artifact: {exc}")
+            return None
+        return TaxonomyIndex(arrays, morphology=morphology)
+
+    def load_or_build(self, source_path: str, morphology: bool = False) -> TaxonomyIndex:
+        path = self.path_for(source_path, morphology)
+        loaded = self._load(path, morphology)
+        if loaded is not None:
+            return loaded
+
+        os.makedirs(self.directory, exist_ok=True)
+        arrays = TaxonomyIndex.compile(read_taxonomy(source_path), morphology=morphology)
+        staging = tempfile.mkdtemp(dir=self.directory, suffix=".tmp")
+        try:
+            for name in _ARRAYS:
+                np.save(os.path.join(staging, f"{name}.npy"), arrays[name])
+            # Directory rename is atomic; a concurrent builder that got there first wins.
+            os.rename(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+        logger.info(f"Built skills taxonomy artifact {os.path.basename(path)} ({len(arrays['key_offsets']) - 1} skills)")
+        return self._load(path, morphology) or TaxonomyIndex(arrays, morphology=morphology)
+
+
+@lru_cache(maxsize=4)
+def load_taxonomy(source_path: str, morphology: bool = False) -> TaxonomyIndex:
+    """Process-wide taxonomy instance per source file, shared by every matcher."""
+    return TaxonomyStore().load_or_build(source_path, morphology=morphology)
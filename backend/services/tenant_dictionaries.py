@@ -0,0 +1,121 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from backend.utils.config import config
+    from backend.utils.logger import logger
+except ImportError:
+    from utils.config import config
+    from utils.logger import logger
+
+VALID_TIERS = ("basic", "core", "advanced")
+_KEY_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+MAX_SYNONYMS_PER_CONCEPT = 200
+MAX_SYNONYM_LENGTH = 100
+
+
+class TenantQuotaError(ValueError):
+    """The upload is valid but would exceed the tenant count or artifact disk caps."""
+
+
+def validate_concepts(concepts: Any) -> Dict[str, Dict]:
+    """
+    Checks an uploaded dictionary has the BASE_CONCEPTS shape and returns it normalized (defaults
+    filled, synonyms stripped). Raises ValueError with a client-facing message otherwise.
+    """
+    if not isinstance(concepts, dict) or not concepts:
+        raise ValueError("Concept dictionary must be a non-empty object keyed by concept id.")
+    if len(concepts) > config.TENANT_MAX_CONCEPTS:
+        raise ValueError(f"At most {config.TENANT_MAX_CONCEPTS} concepts are allowed.")
+
+    normalized: Dict[str, Dict] = {}
+    for key, concept in concepts.items():
+        if not isinstance(key, str) or not _KEY_RE.match(key):
+            raise ValueError(f"Invalid concept id {key!r}: use 1-64 letters, digits, '_', '-' or '.'.")
+        if not isinstance(concept, dict):
+            raise ValueError(f"Concept {key!r} must be an object.")
+        label = concept.get("label")
+        if not isinstance(label, str) or not label.strip():
+            raise ValueError(f"Concept {key!r} needs a non-empty label.")
+        tier = concept.get("tier", "core")
+        if tier not in VALID_TIERS:
+            raise ValueError(f"Concept {key!r} has tier {tier!r}; expected one of {', '.join(VALID_TIERS)}.")
+        weight = concept.get("weight", 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or not 0 < weight <= 10:
+            raise ValueError(f"Concept {key!r} weight must be a number in (0, 10].")
+        synonyms = concept.get("synonyms")
+        if not isinstance(synonyms, list) or not synonyms or len(synonyms) > MAX_SYNONYMS_PER_CONCEPT:
+            raise ValueError(f"Concept {key!r} needs 1-{MAX_SYNONYMS_PER_CONCEPT} synonyms.")
+        cleaned = []
+        for synonym in synonyms:
+            if not isinstance(synonym, str) or not synonym.strip() or len(synonym) > MAX_SYNONYM_LENGTH:
+                raise ValueError(f"Concept {key!r} has an empty or overlong synonym.")
+            cleaned.append(synonym.strip())
+        normalized[key] = {"label": label.strip(), "tier": tier, "weight": float(weight), "synonyms": cleaned}
+    if sum(len(concept["synonyms"]) for concept in normalized.values()) > config.TENANT_MAX_SYNONYMS:
+        raise ValueError(f"At most {config.TENANT_MAX_SYNONYMS} synonyms are allowed in total.")
+    return normalized
+
+
+class TenantDictionaryStore:
+    """
+    Uploaded concept dictionaries persisted as JSON, one file per API key (named by a hash of the
+    key). Files are the source of truth, so any worker can restore a dictionary after its compiled
+    matcher was evicted or the process restarted.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = config.TENANT_DICTIONARY_DIR if directory is None else directory
+
+    @staticmethod
+    def tenant_hash(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:24]
+
+    def path(self, api_key: str) -> str:
+        return os.path.join(self.directory, f"{self.tenant_hash(api_key)}.json")
+
+    def count(self) -> int:
+        """Number of stored dictionaries."""
+        return len(glob.glob(os.path.join(glob.escape(self.directory), "*.json")))
+
+    def version(self, api_key: str) -> Optional[int]:
+        """File modification stamp, or None when the tenant has no dictionary (one stat call)."""
+        try:
+            return os.stat(self.path(api_key)).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self, api_key: str) -> Optional[Tuple[int, Dict[str, Dict]]]:
+        path = self.path(api_key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                concepts = json.load(f)
+            return os.stat(path).st_mtime_ns, concepts
+        except (OSError, ValueError) as exc:
+            if os.path.exists(path):
+                logger.warning(f"Unreadable tenant dictionary {os.path.basename(path)}: {exc}")
+            return None
+
+    def save(self, api_key: str, concepts: Dict[str, Dict]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as f:
+                json.dump(concepts, f)
+            os.replace(tmp_path, self.path(api_key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def delete(self, api_key: str) -> bool:
+        try:
+            os.remove(self.path(api_key))
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,104 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
+
+# Words and individual symbols are separate tokens so "c++", "ds&a" or "rest/api" line up
+# with the same token boundaries a `(?<!\w)phrase(?!\w)` regex would enforce.
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def normalize_text(text: str) -> str:
+    lowered = (text or "").lower()
+    lowered = re.sub(r"[^a-z0-9+/#.& ]+", " ", lowered)
+    return re.sub(r"\s+", " ", lowered).strip()
+
+
+def tokenize(normalized_text: str) -> List[str]:
+    return _TOKEN_RE.findall(normalized_text or "")
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Light rule-based stemmer: folds plurals and -ing/-ed forms so "debugged", "debugging" and
+    "debug" or "issues" and "issue" share one form. Both sides must go through it to compare.
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    word = token
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith("es") and word[-3] in "sxz" or word.endswith(("ches", "shes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    else:
+        for suffix in ("ing", "ed"):
+            base = word[: -len(suffix)]
+            if word.endswith(suffix) and len(base) >= 3 and any(vowel in base for vowel in "aeiouy"):
+                word = base
+                # "debugg" -> "debug", "committ" -> "commit"
+                if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeioulsz":
+                    word = word[:-1]
+                break
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+class TextIndex:
+    """
+    Normalized view of one document (resume or JD) built once per request: the token list, a
+    token set and hashed 2-4-gram sets, so phrase checks become set lookups instead of regex scans.
+    Shared by KeywordMatcher, QualityGate and AIEvaluator.
+    """
+
+    MAX_NGRAM = 4
+
+    def __init__(self, text: str):
+        self.normalized = normalize_text(text)
+        self.tokens = tokenize(self.normalized)
+        self.token_set: Set[str] = set(self.tokens)
+        self._ngrams: Optional[Set[int]] = None
+        self._stems: Optional[List[str]] = None
+
+    def stemmed_tokens(self) -> List[str]:
+        if self._stems is None:
+            self._stems = [stem(token) for token in self.tokens]
+        return self._stems
+
+    def _ngram_hashes(self) -> Set[int]:
+        # Built on first multi-word lookup; single-token checks only need `token_set`.
+        if self._ngrams is None:
+            tokens = self.tokens
+            self._ngrams = {
+                hash(tuple(tokens[start:start + size]))
+                for size in range(2, self.MAX_NGRAM + 1)
+                for start in range(len(tokens) - size + 1)
+            }
+        return self._ngrams
+
+    def contains_tokens(self, phrase_tokens: List[str]) -> bool:
+        if not phrase_tokens:
+            return False
+        if len(phrase_tokens) == 1:
+            return phrase_tokens[0] in self.token_set
+        if len(phrase_tokens) <= self.MAX_NGRAM:
+            return hash(tuple(phrase_tokens)) in self._ngram_hashes()
+        # Longer phrases are rare; anchor on the first token and compare windows.
+        size = len(phrase_tokens)
+        return any(
+            self.tokens[start:start + size] == phrase_tokens
+            for start, token in enumerate(self.tokens)
+            if token == phrase_tokens[0]
+        )
+
+    def contains(self, phrase: str) -> bool:
+        """Word-boundary phrase presence, e.g. "pull requests" but not "api" inside "capabilities"."""
+        return self.contains_tokens(tokenize(normalize_text(phrase)))
+
+    def find_any(self, phrases: Iterable[str]) -> List[str]:
+        return [phrase for phrase in phrases if self.contains(phrase)]
+
+    def __len__(self) -> int:
+        return len(self.tokens)
@@ -1,5 +1,7 @@
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 
 class ResponseCache:
@@ -34,3 +36,92 @@ class ResponseCache:
         expires_at = time.time() + self.ttl
         self._store[key] = (expires_at, value)
         self._evict_if_needed()
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss/eviction counters, for compiled or derived
+    data (chunk results, matchers) that never expires but must not grow without limit.
+    Thread-safe: catalog warm-up and reload threads share these caches with request handlers.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._store: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._store:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store.move_to_end(key)
+            return self._store[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._store[key] = value
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of the entries, least recently used first (does not count as hits)."""
+        with self._lock:
+            return list(self._store.items())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class ByteLRUCache(LRUCache):
+    """
+    LRUCache bounded by the total `nbytes` of its values (numpy arrays) rather than their count,
+    so a few long documents cannot hold more memory than many short ones.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        super().__init__(max_entries=0)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = int(getattr(value, "nbytes", 0))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._store.pop(key, None)
+            if previous is not None:
+                self.bytes -= int(getattr(previous, "nbytes", 0))
+            self._store[key] = value
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._store.popitem(last=False)
+                self.bytes -= int(getattr(evicted, "nbytes", 0))
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats.pop("max_entries")
+        with self._lock:
+            stats.update({"bytes": self.bytes, "max_bytes": self.max_bytes})
+        return stats
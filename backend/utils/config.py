@@ -15,5 +15,103 @@ class Config:
         "LOCATION_REQUIRED_KEYWORDS",
         "onsite,on site,in-office,in office,hybrid"
     ).split(",")
+    # Optional stem + hyphen/space folding for synonyms and resumes ("bug-fixes" == "bugfix"). Off by
+    # default: it changes scores (stems are joined without a separator, so some phrases merge).
+    MORPHOLOGICAL_NORMALIZATION = os.getenv("MORPHOLOGICAL_NORMALIZATION", "false").lower() == "true"
+    # Optional typo-tolerant (edit distance 1-2) synonym matching before the semantic stage. Off by
+    # default: typo hits raise scores compared with exact matching.
+    FUZZY_MATCHING = os.getenv("FUZZY_MATCHING", "false").lower() == "true"
+    # Two-stage semantic matching: concepts whose centroid scores below threshold - margin are skipped.
+    SEMANTIC_CENTROID_PREFILTER = os.getenv("SEMANTIC_CENTROID_PREFILTER", "false").lower() == "true"
+    SEMANTIC_CENTROID_MARGIN = float(os.getenv("SEMANTIC_CENTROID_MARGIN", "0.15"))
+    # Semantic encoder: "transformer", "onnx" (locally exported model on ONNX Runtime), "ngram"
+    # (model-free character n-gram TF-IDF), "hash" (deterministic fake for tests/CI) or "auto"
+    # (transformer, n-grams when the model cannot load). SEMANTIC_NGRAM_FIRST_PASS runs the n-gram
+    # stage before the transformer so only concepts it could not resolve reach the model.
+    SEMANTIC_BACKEND = os.getenv("SEMANTIC_BACKEND", "transformer")
+    SEMANTIC_NGRAM_FIRST_PASS = os.getenv("SEMANTIC_NGRAM_FIRST_PASS", "false").lower() == "true"
+    SEMANTIC_NGRAM_DIM = int(os.getenv("SEMANTIC_NGRAM_DIM", "2048"))
+    SEMANTIC_NGRAM_THRESHOLD = float(os.getenv("SEMANTIC_NGRAM_THRESHOLD", "0.3"))
+    # ONNX backend: directory with model.onnx + tokenizer.json (e.g. optimum-cli export onnx);
+    # 0 threads = ONNX Runtime's default.
+    SEMANTIC_ONNX_PATH = os.getenv(
+        "SEMANTIC_ONNX_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".onnx-model"),
+    )
+    SEMANTIC_ONNX_THREADS = int(os.getenv("SEMANTIC_ONNX_THREADS", "0"))
+    # Hash backend: word + word-pair feature hashing into SEMANTIC_HASH_DIM dimensions.
+    SEMANTIC_HASH_DIM = int(os.getenv("SEMANTIC_HASH_DIM", "384"))
+    SEMANTIC_HASH_THRESHOLD = float(os.getenv("SEMANTIC_HASH_THRESHOLD", "0.5"))
+    # Load the model in a background thread started by the app lifespan (see GET /ready) instead
+    # of at import; requests served meanwhile skip the semantic stage.
+    SEMANTIC_BACKGROUND_LOAD = os.getenv("SEMANTIC_BACKGROUND_LOAD", "true").lower() == "true"
+    # Compact embedding storage: int8 codes with per-vector scales (disk and cache size only; scores
+    # within ~0.003). SEMANTIC_PCA_PATH adds a projection fitted offline (python -m
+    # backend.services.quantization <path>.npz --dim 128); it is lossy (max score drift 0.24-0.34
+    # and changed hits on the fixtures), so it is not safe to enable without checking recall.
+    SEMANTIC_QUANTIZE = os.getenv("SEMANTIC_QUANTIZE", "false").lower() == "true"
+    SEMANTIC_PCA_PATH = os.getenv("SEMANTIC_PCA_PATH", "")
+    # Shared embedding service (python -m backend.services.embedding_service): one model for all
+    # workers, concurrent encodes micro-batched for up to MAX_WAIT_MS. Empty = load in-process.
+    EMBEDDING_SERVICE_SOCKET = os.getenv("EMBEDDING_SERVICE_SOCKET", "")
+    EMBEDDING_SERVICE_MAX_BATCH = int(os.getenv("EMBEDDING_SERVICE_MAX_BATCH", "64"))
+    EMBEDDING_SERVICE_MAX_WAIT_MS = float(os.getenv("EMBEDDING_SERVICE_MAX_WAIT_MS", "5"))
+    EMBEDDING_SERVICE_TIMEOUT = float(os.getenv("EMBEDDING_SERVICE_TIMEOUT", "10"))
+    # Per-embedder cache of text embeddings, bounded by total bytes (LRU).
+    SEMANTIC_EMBEDDING_CACHE_BYTES = int(os.getenv("SEMANTIC_EMBEDDING_CACHE_BYTES", str(32 * 1024 * 1024)))
+    # Per-requirement coverage: JD bullets (max REQUIREMENT_MAX_ITEMS) x resume chunks similarity;
+    # a requirement counts as covered at REQUIREMENT_COVERAGE_THRESHOLD (model backends) or the
+    # backend's own threshold (n-grams).
+    REQUIREMENT_COVERAGE = os.getenv("REQUIREMENT_COVERAGE", "true").lower() == "true"
+    REQUIREMENT_MAX_ITEMS = int(os.getenv("REQUIREMENT_MAX_ITEMS", "24"))
+    REQUIREMENT_COVERAGE_THRESHOLD = float(os.getenv("REQUIREMENT_COVERAGE_THRESHOLD", "0.5"))
+    # Per-chunk match results/embeddings kept for incremental re-evaluation of edited resumes.
+    CHUNK_CACHE_SIZE = int(os.getenv("CHUNK_CACHE_SIZE", "4096"))
+    # Analyzed job descriptions (cleaned text, index, flags, requirement bullets) shared across resumes.
+    JD_ANALYSIS_CACHE_SIZE = int(os.getenv("JD_ANALYSIS_CACHE_SIZE", "256"))
+    # Compiled per-template concept matchers kept in memory (LRU).
+    MATCHER_CACHE_SIZE = int(os.getenv("MATCHER_CACHE_SIZE", "8"))
+    # Per-tenant concept dictionaries uploaded via PUT /evaluate/concepts. Only the API keys listed
+    # in TENANT_API_KEYS are tenants (and also pass the API auth check); with none, uploads are off.
+    TENANT_API_KEYS = [key.strip() for key in os.getenv("TENANT_API_KEYS", "").split(",") if key.strip()]
+    TENANT_DICTIONARY_DIR = os.getenv(
+        "TENANT_DICTIONARY_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".tenants"),
+    )
+    TENANT_MAX_CONCEPTS = int(os.getenv("TENANT_MAX_CONCEPTS", "200"))
+    TENANT_MAX_SYNONYMS = int(os.getenv("TENANT_MAX_SYNONYMS", "2000"))
+    # Caps on stored dictionaries and on the disk used by all tenants' embedding artifacts.
+    TENANT_MAX_COUNT = int(os.getenv("TENANT_MAX_COUNT", "100"))
+    TENANT_ARTIFACT_MAX_BYTES = int(os.getenv("TENANT_ARTIFACT_MAX_BYTES", str(256 * 1024 * 1024)))
+    # Upper bound on chunks embedded per resume; fragments shorter than MIN_WORDS are merged into
+    # windows and sentences longer than MAX_WORDS are split.
+    SEMANTIC_CHUNK_BUDGET = int(os.getenv("SEMANTIC_CHUNK_BUDGET", "48"))
+    SEMANTIC_CHUNK_MIN_WORDS = int(os.getenv("SEMANTIC_CHUNK_MIN_WORDS", "6"))
+    SEMANTIC_CHUNK_MAX_WORDS = int(os.getenv("SEMANTIC_CHUNK_MAX_WORDS", "40"))
+    # Optional skills taxonomy (CSV id,label,aliases or JSONL); JD skills missing from the resume
+    # are appended to missing_keywords, up to SKILLS_MISSING_LIMIT.
+    SKILLS_TAXONOMY_PATH = os.getenv("SKILLS_TAXONOMY_PATH", "")
+    SKILLS_TAXONOMY_DIR = os.getenv(
+        "SKILLS_TAXONOMY_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".taxonomy"),
+    )
+    SKILLS_MISSING_LIMIT = int(os.getenv("SKILLS_MISSING_LIMIT", "10"))
+    # Directory for memory-mapped synonym/concept embedding artifacts; empty disables persistence.
+    EMBEDDING_STORE_DIR = os.getenv(
+        "EMBEDDING_STORE_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".embeddings"),
+    )
+    # Per-synonym exact/fuzzy/semantic hit counters and stage timings, for pruning the dictionaries.
+    MATCH_TELEMETRY = os.getenv("MATCH_TELEMETRY", "true").lower() == "true"
+    MATCH_TELEMETRY_PATH = os.getenv(
+        "MATCH_TELEMETRY_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".telemetry", "match-telemetry.json"),
+    )
+    # Log file next to the stdout log; empty logs to stdout only (the test suite sets it empty).
+    LOG_FILE = os.getenv("LOG_FILE", "app.log")
+    # Token for POST /evaluate/admin/reload (sent as X-Admin-Token); empty disables the endpoint.
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+    # Seconds between checks of the concept/template data files for edits; 0 disables the watcher.
+    CATALOG_WATCH_SECONDS = float(os.getenv("CATALOG_WATCH_SECONDS", "0"))
     
 config = Config()
@@ -2,8 +2,10 @@ import logging
 import sys
 
 try:
+    from backend.utils.config import config
     from backend.utils.security import scrub_pii
 except ImportError:
+    from utils.config import config
     from utils.security import scrub_pii
 
 
@@ -17,15 +19,16 @@ class PiiFilter(logging.Filter):
 def setup_logger():
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     stream_handler = logging.StreamHandler(sys.stdout)
-    file_handler = logging.FileHandler('app.log')
     stream_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
 
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
     logger.handlers = []
     logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
+    if config.LOG_FILE:
+        file_handler = logging.FileHandler(config.LOG_FILE)
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
     logger.addFilter(PiiFilter())
     return logger
 
@@ -1,3 +1,4 @@
+import hmac
 import re
 import time
 from typing import Dict, Tuple
@@ -21,11 +22,25 @@ def scrub_pii(text: str) -> str:
 
 
 def check_api_key(provided_key: str) -> bool:
-    """Simple static token check to gate external access."""
+    """Simple static token check to gate external access; tenant keys are accepted too."""
     if not config.API_AUTH_TOKEN:
         # No auth configured; allow by default for local/dev.
         return True
-    return provided_key == config.API_AUTH_TOKEN
+    return hmac.compare_digest(provided_key or "", config.API_AUTH_TOKEN) or is_tenant_key(provided_key)
+
+
+def is_tenant_key(provided_key: str) -> bool:
+    """Whether the key is one of the configured TENANT_API_KEYS (never true when none are set)."""
+    if not provided_key:
+        return False
+    return any(hmac.compare_digest(provided_key, key) for key in config.TENANT_API_KEYS)
+
+
+def check_admin_token(provided_token: str) -> bool:
+    """Admin endpoints stay closed unless ADMIN_TOKEN is configured."""
+    if not config.ADMIN_TOKEN:
+        return False
+    return hmac.compare_digest(provided_token or "", config.ADMIN_TOKEN)
 
 
 def is_rate_limited(client_id: str) -> bool:
@@ -0,0 +1,59 @@
+"""
+Scores a few thousand synthetic match results per level with the scalar loop and with the
+vectorized batch path, and checks that both produce identical output.
+
+    python benchmarks/bench_batch_scoring.py [count]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.keyword_matcher import LEVEL_MULTIPLIERS, KeywordMatcher  # noqa: E402
+from services.match_result import ConceptHit, MatchResult  # noqa: E402
+
+
+def _random_results(matcher: KeywordMatcher, count: int):
+    rng = random.Random(7)
+    width = len(matcher.layout.keys)
+    results = []
+    for _ in range(count):
+        rows = [row for row in range(width) if rng.random() < 0.4]
+        results.append(
+            MatchResult(
+                found_mask=sum(1 << row for row in rows),
+                hits=[ConceptHit(row, "exact", "phrase", 0.0) for row in rows],
+                intern_context=rng.random() < 0.7,
+                recent=rng.random() < 0.5,
+                impact=rng.random() < 0.3,
+                semantic_stats={},
+                chunk_stats={},
+            )
+        )
+    return results
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    matcher = KeywordMatcher(fuzzy=False)
+    results = _random_results(matcher, count)
+
+    for level in LEVEL_MULTIPLIERS:
+        start = time.perf_counter()
+        scalar = [matcher.score_level(result, level)["score"] for result in results]
+        scalar_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        scores, _ = matcher.score_matrix(results, level)
+        batch_ms = (time.perf_counter() - start) * 1000
+        same = scalar == scores.tolist()
+        print(
+            f"{level:>9}: {count} resumes, loop {scalar_ms:.1f}ms, batch {batch_ms:.1f}ms "
+            f"({scalar_ms / batch_ms:.1f}x), identical={'yes' if same else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Throughput of the shared embedding service under concurrent load versus each worker encoding
+its own requests in-process. Threads stand in for workers; every request encodes the chunks of
+one fixture resume (with the embedding cache off, as for a new resume). Reports requests per
+second, the service's batch-size histogram and the peak queue depth.
+
+    python benchmarks/bench_embedding_service.py [--backend ngram] [--workers 8] [--requests 40]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.chunker import ResumeChunker  # noqa: E402
+from services.embedding_service import EmbeddingServer  # noqa: E402
+from services.semantic_embedder import DEFAULT_MODEL_NAME, SemanticEmbedder, load_local_model  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def _chunks() -> list:
+    chunker = ResumeChunker()
+    chunks = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.startswith("resume_"):
+            with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+                chunks.append(chunker.chunk(f.read())[0])
+    return chunks
+
+
+def _run(embedders, chunk_sets, requests: int) -> float:
+    """Requests per second with one thread per embedder, each sending `requests` encodes."""
+
+    def work(number, embedder):
+        for request in range(requests):
+            # Unique texts per request so the embedding cache never answers.
+            chunks = chunk_sets[request % len(chunk_sets)]
+            embedder.encode_batch([f"{chunk} [{number}.{request}]" for chunk in chunks])
+
+    threads = [threading.Thread(target=work, args=item) for item in enumerate(embedders)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(embedders) * requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="ngram")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    model, backend, error = load_local_model(args.backend, DEFAULT_MODEL_NAME)
+    if model is None:
+        print(f"{args.backend} model unavailable: {error}")
+        return
+    chunk_sets = _chunks()
+
+    local = [SemanticEmbedder(backend=args.backend, service_socket="") for _ in range(args.workers)]
+    in_process = _run(local, chunk_sets, args.requests)
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "embeddings.sock")
+        info = {"model": getattr(model, "name", DEFAULT_MODEL_NAME), "backend": backend}
+        server = EmbeddingServer(socket_path, model, info, max_wait_ms=args.max_wait_ms)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            clients = [SemanticEmbedder(backend=args.backend, service_socket=socket_path) for _ in range(args.workers)]
+            shared = _run(clients, chunk_sets, args.requests)
+            stats = clients[0].service_stats()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print(f"{backend}, {args.workers} workers x {args.requests} requests (one fixture resume's chunks each):")
+    print(f"  in-process, a model per worker: {in_process:8.1f} req/s")
+    print(f"  shared service:                 {shared:8.1f} req/s ({shared / in_process:.2f}x), one model")
+    print(
+        f"  batches {stats['batches']} for {stats['requests']} requests (avg {stats['avg_batch']} texts), "
+        f"peak queue depth {stats['max_queue_depth']}, batch sizes {stats['batch_sizes']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Recall and cost of the semantic stage per backend: the model-free character n-gram vectors and
+hash fake versus the sentence-transformers model and its ONNX Runtime export (each skipped when
+it is not installed).
+
+Recall is measured on labelled resume lines (inflections, compounds and paraphrases of synonyms)
+by running the semantic stage alone over every concept, so lines the exact/fuzzy stages would
+already catch still count; hits on other concepts are reported as false positives. The fixture
+resumes are then timed end to end. For the n-gram backend the dense rows are also compared with a
+sparse (CSR) layout of the same vectors: bytes per row and synonym x chunk scoring time (SciPy
+when installed, otherwise the equivalent per-chunk gather in numpy).
+
+    python benchmarks/bench_ngram_semantic.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # optional; only used for the CSR comparison
+    sparse = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.embedding_store import EmbeddingStore  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+# (resume line, concept it should surface).
+LABELLED = [
+    ("Troubleshot intermittent failures in the payments service", "debugging"),
+    ("Diagnosed and patched defects reported by customers", "debugging"),
+    ("Refactorings of the billing module improved readability", "clean_code"),
+    ("Wrote regression testcases for the checkout flow", "testing"),
+    ("Automated smoke-testing of every nightly build", "testing"),
+    ("Reviewed pull-requests and managed branches for the team", "version_control"),
+    ("Collaborating with designers and product managers every sprint", "teamwork"),
+    ("Containerized services with docker-compose and deployed to the cloud", "advanced_engineering"),
+    ("Learned new frameworks quickly and taught myself Rust", "learning_mindset"),
+    ("Implemented recursive algorithms and object-oriented designs", "programming_fundamentals"),
+]
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _recall(matcher: KeywordMatcher) -> tuple:
+    found = false_positives = 0
+    for line, concept in LABELLED:
+        chunks, _ = matcher._chunk_text(line)
+        hits, _ = matcher._semantic_hits(chunks, list(matcher.concepts))
+        found += concept in hits
+        false_positives += len(set(hits) - {concept})
+    return found / len(LABELLED), false_positives
+
+
+def _time_us(function, rounds: int = 200) -> float:
+    function()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) * 1e6 / rounds
+
+
+def _sparse_layout(synonym_matrix: np.ndarray, chunk_matrix: np.ndarray) -> str:
+    """Dense vs CSR storage and scoring cost of the same n-gram vectors."""
+    synonym_matrix, chunk_matrix = np.asarray(synonym_matrix), np.asarray(chunk_matrix)
+    nonzero = np.count_nonzero(chunk_matrix, axis=1)
+    # CSR row: float32 value + int32 column per non-zero, plus one int32 row pointer.
+    csr_bytes = float(nonzero.mean()) * 8 + 4
+    dense_us = _time_us(lambda: synonym_matrix @ chunk_matrix.T)
+    if sparse is not None:
+        synonyms_csr, chunks_csr = sparse.csr_matrix(synonym_matrix), sparse.csr_matrix(chunk_matrix)
+        sparse_us = _time_us(lambda: (synonyms_csr @ chunks_csr.T).toarray())
+        how = "scipy csr @ csr.T"
+    else:
+        columns = [np.flatnonzero(row) for row in chunk_matrix]
+        values = [row[column] for row, column in zip(chunk_matrix, columns)]
+
+        def gather():
+            scores = np.empty((len(synonym_matrix), len(chunk_matrix)), dtype=np.float32)
+            for row, (column, value) in enumerate(zip(columns, values)):
+                scores[:, row] = synonym_matrix[:, column] @ value
+            return scores
+
+        sparse_us = _time_us(gather)
+        how = "numpy gather, SciPy not installed"
+    return (
+        f"  dense vs CSR: {chunk_matrix.shape[1] * 4} vs {csr_bytes:.0f} bytes per chunk row "
+        f"({nonzero.mean():.0f} of {chunk_matrix.shape[1]} buckets set), scoring {dense_us:.0f}us dense vs "
+        f"{sparse_us:.0f}us sparse ({how})"
+    )
+
+
+def main() -> None:
+    backends = {"ngram": SemanticEmbedder(backend="ngram"), "hash": SemanticEmbedder(backend="hash")}
+    for backend in ("transformer", "onnx"):
+        embedder = SemanticEmbedder(backend=backend)
+        if embedder.model:
+            backends[backend] = embedder
+        else:
+            print(f"{backend} backend unavailable ({embedder.load_error}); skipping it.")
+
+    jd = _read("jd_hybrid.txt")
+    resumes = [_read(name) for name in sorted(os.listdir(FIXTURES)) if name.startswith("resume_")]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, embedder in backends.items():
+            matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=directory))
+            start = time.perf_counter()
+            matcher._synonym_embeddings()
+            build_ms = (time.perf_counter() - start) * 1000
+
+            recall, false_positives = _recall(matcher)
+
+            rounds = 20
+            start = time.perf_counter()
+            for _ in range(rounds):
+                # Clear cached chunk vectors so every round pays for encoding, as a new resume would.
+                matcher.chunk_cache = type(matcher.chunk_cache)(matcher.chunk_cache.max_entries)
+                for resume in resumes:
+                    matcher.match(resume, jd)
+            per_resume_ms = (time.perf_counter() - start) * 1000 / (rounds * len(resumes))
+
+            # Scoring alone: every synonym against every chunk of the fixtures.
+            synonym_matrix = matcher._synonym_embeddings()
+            chunks = [chunk for resume in resumes for chunk in matcher._chunk_text(resume)[0]]
+            chunk_matrix = matcher._chunk_embeddings(chunks)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                synonym_matrix @ chunk_matrix.T
+            comparisons = rounds * len(synonym_matrix) * len(chunk_matrix)
+            per_comparison_us = (time.perf_counter() - start) * 1e6 / comparisons
+
+            print(
+                f"{name}: recall {recall:.0%} on {len(LABELLED)} labelled lines ({false_positives} false positives), "
+                f"{per_resume_ms:.2f}ms per fixture resume (encoding included), "
+                f"{per_comparison_us:.4f}us per synonym x chunk comparison, synonym matrix {build_ms:.0f}ms"
+            )
+            if name == "ngram":
+                print(_sparse_layout(synonym_matrix, chunk_matrix))
+
+
+if __name__ == "__main__":
+    main()
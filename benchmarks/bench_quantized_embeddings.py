@@ -0,0 +1,111 @@
+"""
+Memory, similarity speed and score drift of the compact embedding storage modes versus float32:
+int8 codes with per-vector scales, and a PCA projection (fitted on the dictionary synonyms, as
+the offline step does) followed by int8.
+
+Every mode scores the fixture resumes' chunks against every synonym. "stored" is the size of the
+synonym/centroid artifacts plus the cached chunk rows; the dictionary matrices are expanded to
+float32 when a matcher loads them, so the matmul is timed on what requests actually score. Drift
+is measured on those scores relative to float32, and "hits changed" counts concept decisions of
+the semantic stage that differ from float32 on the fixtures. Runs the model-free n-gram and hash backends, plus the
+sentence-transformers model and its ONNX export when they are installed.
+
+    python benchmarks/bench_quantized_embeddings.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.embedding_store import EmbeddingStore  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.quantization import PCAProjection, as_float, cosine_scores  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder, installed_dictionary_phrases  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+# PCA target size per backend: roughly a third of the model's dimensions.
+PCA_DIMS = {"ngram": 512, "hash": 128, "transformer": 128, "onnx": 128}
+ROUNDS = 50
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _hits(matcher: KeywordMatcher, resumes) -> set:
+    decisions = set()
+    for number, resume in enumerate(resumes):
+        chunks, _ = matcher._chunk_text(resume)
+        hits, _ = matcher._semantic_hits(chunks, list(matcher.concepts))
+        decisions.update((number, key) for key in hits)
+    return decisions
+
+
+def _measure(embedder: SemanticEmbedder, directory: str, resumes) -> dict:
+    matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=directory))
+    synonym_matrix, _ = matcher._semantic_embeddings(embedder)
+    stored_synonyms, stored_concepts = matcher.store.load_or_build(embedder, matcher.index)
+    chunks = [chunk for resume in resumes for chunk in matcher._chunk_text(resume)[0]]
+    chunk_matrix = matcher._chunk_embeddings(chunks)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        scores = cosine_scores(synonym_matrix, chunk_matrix)
+    matmul_us = (time.perf_counter() - start) * 1e6 / ROUNDS
+    return {
+        "bytes": stored_synonyms.nbytes + stored_concepts.nbytes + chunk_matrix.nbytes,
+        "dim": synonym_matrix.shape[1],
+        "matmul_us": matmul_us,
+        "scores": scores,
+        "hits": _hits(matcher, resumes),
+    }
+
+
+def main() -> None:
+    backends = ["ngram", "hash"]
+    for backend in ("transformer", "onnx"):
+        embedder = SemanticEmbedder(backend=backend)
+        if embedder.model:
+            backends.append(backend)
+        else:
+            print(f"{backend} backend unavailable ({embedder.load_error}); skipping it.")
+
+    resumes = [_read(name) for name in sorted(os.listdir(FIXTURES)) if name.startswith("resume_")]
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in backends:
+            plain = SemanticEmbedder(backend=backend, quantize=False, projection_path="")
+            projection_path = os.path.join(directory, f"pca-{backend}.npz")
+            phrases = sorted(set(installed_dictionary_phrases()))
+            PCAProjection.fit(as_float(plain.encode_batch(phrases)), PCA_DIMS[backend], plain.model_name).save(
+                projection_path
+            )
+            modes = {
+                "float32": plain,
+                "int8": SemanticEmbedder(backend=backend, quantize=True, projection_path=""),
+                f"pca{PCA_DIMS[backend]}+int8": SemanticEmbedder(
+                    backend=backend, quantize=True, projection_path=projection_path
+                ),
+            }
+            results = {name: _measure(embedder, directory, resumes) for name, embedder in modes.items()}
+            baseline = results["float32"]
+            print(f"{backend} ({len(baseline['scores'])} synonyms x {baseline['scores'].shape[1]} fixture chunks):")
+            for name, result in results.items():
+                drift = np.abs(result["scores"] - baseline["scores"])
+                changed = len(result["hits"] ^ baseline["hits"])
+                print(
+                    f"  {name:>14}: dim {result['dim']:>4}, stored {result['bytes'] / 1024:8.1f} KiB "
+                    f"({1 - result['bytes'] / baseline['bytes']:6.1%} saved), "
+                    f"matmul {result['matmul_us']:8.1f}us ({baseline['matmul_us'] / result['matmul_us']:4.2f}x), "
+                    f"score drift mean {drift.mean():.4f} max {drift.max():.4f}, "
+                    f"hits changed {changed}/{len(baseline['hits'])}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares full synonym-level semantic matching with the centroid prefilter on the test fixtures.
+`backend` defaults to SEMANTIC_BACKEND; "hash" runs without any model download (CI).
+
+    python benchmarks/bench_semantic_prefilter.py [margin] [backend]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def main() -> None:
+    margin = float(sys.argv[1]) if len(sys.argv) > 1 else 0.15
+    embedder = SemanticEmbedder(backend=sys.argv[2] if len(sys.argv) > 2 else None)
+    if not embedder.model:
+        print(f"{embedder.backend} backend unavailable ({embedder.load_error}); nothing to benchmark.")
+        return
+
+    full = KeywordMatcher(embedder=embedder, centroid_prefilter=False)
+    prefiltered = KeywordMatcher(embedder=embedder, centroid_prefilter=True, centroid_margin=margin)
+
+    fixtures = sorted(name for name in os.listdir(FIXTURES) if name.startswith("resume_"))
+    jd = _read("jd_hybrid.txt")
+    total_full = total_pruned = 0
+    for name in fixtures:
+        resume = _read(name)
+        start = time.perf_counter()
+        baseline = full.evaluate(resume, jd)
+        full_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        result = prefiltered.evaluate(resume, jd)
+        pruned_ms = (time.perf_counter() - start) * 1000
+
+        same = baseline["matches"] == result["matches"] and baseline["score"] == result["score"]
+        stats = result["semantic_stats"]
+        total_full += baseline["semantic_stats"]["synonyms_scored"]
+        total_pruned += stats["synonyms_scored"]
+        print(
+            f"{name}: synonyms scored {baseline['semantic_stats']['synonyms_scored']} -> {stats['synonyms_scored']}, "
+            f"concepts pruned {stats['concepts_pruned']}/{stats['concepts_considered']}, "
+            f"{full_ms:.1f}ms -> {pruned_ms:.1f}ms, identical={'yes' if same else 'NO'}"
+        )
+
+    if total_pruned:
+        print(f"\nSemantic work reduction: {total_full / total_pruned:.1f}x (margin={margin})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Builds synthetic skills taxonomies of growing size and reports artifact build time, mmap load
+time and per-resume extraction latency, which should stay flat as the taxonomy grows.
+
+    python benchmarks/bench_skills_taxonomy.py [sizes...]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "backend"))
+
+from services.skills_taxonomy import TaxonomyStore  # noqa: E402
+from services.text_index import TextIndex  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+WORDS = [f"{prefix}{suffix}" for prefix in ("data", "cloud", "web", "lab", "care", "fin", "ops", "net") for suffix in range(400)]
+
+
+def _write_taxonomy(path: str, size: int) -> None:
+    rng = random.Random(size)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "label", "aliases"])
+        for skill in range(size):
+            label = " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+            aliases = "|".join(" ".join(rng.sample(WORDS, rng.randint(1, 2))) for _ in range(rng.randint(0, 3)))
+            writer.writerow([f"S{skill}", label, aliases])
+        # A few real skills so the fixtures produce hits.
+        writer.writerow(["kubernetes", "Kubernetes", "k8s"])
+        writer.writerow(["aws", "AWS", "amazon web services"])
+        writer.writerow(["system_design", "System Design", "distributed systems"])
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    resumes = [
+        TextIndex(open(os.path.join(FIXTURES, name), encoding="utf-8").read() * 4).tokens
+        for name in sorted(os.listdir(FIXTURES))
+        if name.startswith("resume_")
+    ]
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            source = os.path.join(workdir, f"skills-{size}.csv")
+            _write_taxonomy(source, size)
+            store = TaxonomyStore(directory=os.path.join(workdir, "artifacts"))
+
+            start = time.perf_counter()
+            store.load_or_build(source)
+            build_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            taxonomy = store.load_or_build(source)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            rounds = 20
+            for _ in range(rounds):
+                hits = [taxonomy.extract(tokens) for tokens in resumes]
+            extract_ms = (time.perf_counter() - start) * 1000 / (rounds * len(resumes))
+            print(
+                f"{size:>7} skills: build {build_ms:8.1f}ms, mmap load {load_ms:5.2f}ms, "
+                f"extract {extract_ms:5.2f}ms/resume ({sum(len(found) for found in hits)} hits)"
+            )
+
+
+if __name__ == "__main__":
+    main()
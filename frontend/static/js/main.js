@@ -55,6 +55,8 @@ async function evaluateResume() {
     const jobDescription = document.getElementById('job-description').value;
     const internLevelSelect = document.getElementById('intern-level');
     const internLevel = internLevelSelect ? internLevelSelect.value : 'general';
+    const jobTemplateSelect = document.getElementById('job-template');
+    const templateId = jobTemplateSelect ? jobTemplateSelect.value : '';
 
     if (!jobTitle || !jobDescription || !currentResumeText) {
         alert('Please fill in all fields and upload a resume');
@@ -70,6 +72,7 @@ async function evaluateResume() {
         formData.append('job_description', jobDescription);
         formData.append('resume_text', currentResumeText);
         formData.append('intern_level', internLevel);
+        formData.append('template_id', templateId);
 
         const response = await fetch(`${API_BASE_URL}/evaluate/`, {
             method: 'POST',
@@ -0,0 +1,19 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# Everything the app writes by default (embedding artifacts and their lock files, tenant
+# dictionaries, taxonomy cache, telemetry dumps, app.log) goes to a scratch directory during
+# tests instead of the working tree. Set before any test imports utils.config.
+_SCRATCH = tempfile.mkdtemp(prefix="resume-eval-tests-")
+atexit.register(shutil.rmtree, _SCRATCH, ignore_errors=True)
+
+# The deterministic hash backend runs the semantic stage without downloading a model, so bare
+# KeywordMatcher()/AIEvaluator instances behave the same locally and in CI.
+os.environ.setdefault("SEMANTIC_BACKEND", "hash")
+os.environ.setdefault("LOG_FILE", "")
+os.environ.setdefault("EMBEDDING_STORE_DIR", os.path.join(_SCRATCH, "embeddings"))
+os.environ.setdefault("TENANT_DICTIONARY_DIR", os.path.join(_SCRATCH, "tenants"))
+os.environ.setdefault("SKILLS_TAXONOMY_DIR", os.path.join(_SCRATCH, "taxonomy"))
+os.environ.setdefault("MATCH_TELEMETRY_PATH", os.path.join(_SCRATCH, "telemetry", "match-telemetry.json"))
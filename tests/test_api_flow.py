@@ -1,5 +1,8 @@
+import dataclasses
+import json
 import os
 import sys
+import time
 
 from fastapi.testclient import TestClient
 
@@ -33,3 +36,136 @@ def test_job_templates_endpoint_includes_levels():
     templates = data.get("templates", {})
     assert "software_engineer" in templates
     assert "levels" in templates["software_engineer"]
+
+
+def test_levels_endpoint_scores_every_level():
+    payload = {
+        "job_description": "Software engineer intern writing tests and fixing bugs",
+        "resume_text": "Intern who wrote unit tests, debugged APIs and used Git.",
+    }
+    response = client.post("/evaluate/levels", data=payload)
+    assert response.status_code == 200
+    levels = response.json()["levels"]
+    assert {"freshman", "senior", "general"} <= set(levels)
+    assert all("score" in result for result in levels.values())
+
+
+def test_template_concept_set_is_compiled_once_and_reused(monkeypatch):
+    route = next(r for r in app.routes if getattr(r, "path", "") == "/evaluate/matchers/stats")
+    monkeypatch.setattr(route.endpoint.__globals__["check_admin_token"].__globals__["config"], "ADMIN_TOKEN", "s3cret")
+    payload = {
+        "job_description": "Registered nurse for a med-surg unit",
+        "resume_text": "Registered Nurse (BLS, ACLS). Charting in Epic, IV therapy, ICU float shifts.",
+        "template_id": "registered_nurse",
+    }
+    first = client.post("/evaluate/levels", data=payload)
+    second = client.post("/evaluate/levels", data={**payload, "resume_text": "Patient care and charting."})
+    assert first.status_code == 200 and second.status_code == 200
+
+    general = first.json()["levels"]["general"]
+    assert {match["key"] for match in general["matches"]} >= {"licensure", "clinical_documentation", "acute_care"}
+    assert client.get("/evaluate/matchers/stats").status_code == 403
+    stats = client.get("/evaluate/matchers/stats", headers={"X-Admin-Token": "s3cret"}).json()
+    assert "nursing" in stats["last_compile_ms"]
+    assert stats["hits"] >= 1
+
+
+def test_tenant_dictionary_upload_is_used_for_that_api_key(tmp_path, monkeypatch):
+    route = next(route for route in app.routes if getattr(route, "path", "") == "/evaluate/concepts")
+    monkeypatch.setattr(route.endpoint.__globals__["ai_evaluator"].matchers.tenants, "directory", str(tmp_path))
+    monkeypatch.setattr(route.endpoint.__globals__["ai_evaluator"].matchers, "store_directory", str(tmp_path))
+    headers = {"x-api-key": "team-clinic"}
+    concepts = {
+        "triage": {"label": "Triage", "tier": "core", "synonyms": ["triage", "patient intake"]},
+        "charting": {"label": "Charting", "synonyms": ["charting", "epic"]},
+    }
+
+    # Auth disabled and no tenant keys configured: nobody can create a tenant.
+    assert client.put("/evaluate/concepts", json=concepts, headers=headers).status_code == 403
+    security_config = route.endpoint.__globals__["is_tenant_key"].__globals__["config"]
+    monkeypatch.setattr(security_config, "TENANT_API_KEYS", ["team-clinic"])
+    assert client.put("/evaluate/concepts", json=concepts, headers={"x-api-key": "made-up"}).status_code == 403
+    assert client.put("/evaluate/concepts", json={"triage": {"label": "x"}}, headers=headers).status_code == 422
+    uploaded = client.put("/evaluate/concepts", json=concepts, headers=headers)
+    assert uploaded.status_code == 200 and uploaded.json()["concepts"] == 2
+
+    payload = {"job_description": "Clinic nurse", "resume_text": "Handled patient intake and charting in Epic."}
+    tenant_levels = client.post("/evaluate/levels", data=payload, headers=headers).json()["levels"]
+    default_levels = client.post("/evaluate/levels", data=payload).json()["levels"]
+    assert {match["key"] for match in tenant_levels["general"]["matches"]} == {"triage", "charting"}
+    assert tenant_levels["general"]["missing_keywords"] == []
+    assert "triage" not in {match["key"] for match in default_levels["general"]["matches"]}
+
+    assert client.delete("/evaluate/concepts", headers=headers).json() == {"deleted": True}
+    assert client.get("/evaluate/concepts", headers=headers).status_code == 404
+
+
+def test_admin_reload_requires_configured_token(monkeypatch):
+    route = next(r for r in app.routes if getattr(r, "path", "") == "/evaluate/admin/reload")
+    security_config = route.endpoint.__globals__["check_admin_token"].__globals__["config"]
+
+    monkeypatch.setattr(security_config, "ADMIN_TOKEN", "")
+    assert client.post("/evaluate/admin/reload", headers={"X-Admin-Token": "anything"}).status_code == 403
+
+    monkeypatch.setattr(security_config, "ADMIN_TOKEN", "s3cret")
+    assert client.post("/evaluate/admin/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    before = client.get("/evaluate/admin/catalog", headers={"X-Admin-Token": "s3cret"}).json()
+    response = client.post("/evaluate/admin/reload?wait=true", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "unchanged"
+    assert body["version"] == before["version"]
+    assert body["generation"] == before["generation"] + 1
+    assert "software_engineer" in client.get("/evaluate/job-templates").json()["templates"]
+
+
+def test_admin_telemetry_dump_writes_counters(tmp_path, monkeypatch):
+    route = next(r for r in app.routes if getattr(r, "path", "") == "/evaluate/admin/telemetry/dump")
+    monkeypatch.setattr(route.endpoint.__globals__["check_admin_token"].__globals__["config"], "ADMIN_TOKEN", "s3cret")
+    dump_path = tmp_path / "telemetry.json"
+    monkeypatch.setattr(route.endpoint.__globals__["config"], "MATCH_TELEMETRY_PATH", str(dump_path))
+    headers = {"X-Admin-Token": "s3cret"}
+
+    client.post("/evaluate/levels", data={"job_description": "Backend role", "resume_text": "Wrote unit tests in git"})
+    telemetry = client.get("/evaluate/admin/telemetry", headers=headers).json()["matchers"]
+    assert telemetry["software_engineering"]["concepts"]["testing"]["exact"] >= 1
+
+    response = client.post("/evaluate/admin/telemetry/dump?reset=true", headers=headers)
+    assert response.status_code == 200
+    assert "software_engineering" in json.loads(dump_path.read_text())["matchers"]
+    assert client.get("/evaluate/admin/telemetry", headers=headers).json()["matchers"]["software_engineering"]["matches"] == 0
+
+
+def test_ready_reports_warm_up_started_by_lifespan():
+    with TestClient(app) as warm_client:
+        for _ in range(200):
+            response = warm_client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+        assert response.status_code == 200
+        assert response.json()["model"]["state"] in ("ready", "unavailable")
+        body = warm_client.post(
+            "/evaluate/",
+            data={"job_title": "Backend Engineer", "job_description": "Backend role", "resume_text": "Wrote unit tests"},
+        ).json()
+        assert body["semantic_status"] == response.json()["model"]["state"]
+
+
+def test_cached_keyword_match_is_keyed_by_catalog_version(monkeypatch):
+    route = next(r for r in app.routes if getattr(r, "path", "") == "/evaluate/levels")
+    evaluator = route.endpoint.__globals__["ai_evaluator"]
+    args = ("Backend role building services", "Shipped services with unit tests and git")
+    evaluator.keyword_levels(*args)
+    matcher = evaluator.matchers.for_template(None)
+    calls = []
+    original = matcher.match
+    monkeypatch.setattr(matcher, "match", lambda *a, **k: calls.append(1) or original(*a, **k))
+
+    evaluator.keyword_levels(*args)
+    assert calls == []
+    # A reload that only changed templates keeps the concepts (and matcher) but not the version.
+    snapshot = evaluator.catalog.current
+    monkeypatch.setattr(evaluator.catalog, "current", dataclasses.replace(snapshot, version="templates-edited"))
+    evaluator.keyword_levels(*args)
+    assert calls == [1]
@@ -0,0 +1,48 @@
+import os
+import sys
+import threading
+
+import numpy as np
+
+sys.path.append(os.path.abspath("backend"))
+
+from utils.cache import ByteLRUCache, LRUCache  # noqa: E402
+
+
+def _hammer(cache: LRUCache, value) -> list:
+    """get/set/evict plus iteration from several threads on a cache smaller than the key set."""
+    errors = []
+
+    def work(seed: int) -> None:
+        try:
+            for step in range(20000):
+                key = (seed * 7 + step) % 6
+                cache.get(key)
+                cache.set(key, value)
+                if step % 50 == 0:
+                    cache.items()
+                    cache.stats()
+        except Exception as exc:  # collected so the assertion reports it
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return errors
+
+
+def test_lru_caches_survive_concurrent_get_set_and_iteration():
+    cache = LRUCache(max_entries=3)
+    assert not _hammer(cache, 1)
+    assert len(cache) == 3
+
+    byte_cache = ByteLRUCache(max_bytes=3 * 8)
+    assert not _hammer(byte_cache, np.zeros(1))
+    assert len(byte_cache) == 3 and byte_cache.bytes == 24
@@ -0,0 +1,130 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath("backend"))
+
+from services import catalog as catalog_module  # noqa: E402
+from services.catalog import CatalogManager  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+
+
+def test_reload_swaps_snapshot_and_keeps_unchanged_matchers(tmp_path, monkeypatch):
+    manager = CatalogManager(watch_seconds=0, store_directory=str(tmp_path))
+    old = manager.current
+    old_default = old.matchers.for_template(None)
+    old_nurse = old.matchers.for_template("registered_nurse")
+
+    concept_sets = catalog_module.concept_sets
+    # Simulate an edited data file: reload "re-imports" to a changed nursing set.
+    nursing = dict(concept_sets.CONCEPT_SETS["nursing"])
+    nursing["telehealth"] = {"label": "Telehealth", "tier": "core", "weight": 0.5, "synonyms": ["telehealth"]}
+    monkeypatch.setattr(catalog_module.importlib, "reload", lambda module: module)
+    monkeypatch.setattr(concept_sets, "CONCEPT_SETS", {**concept_sets.CONCEPT_SETS, "nursing": nursing})
+
+    result = manager.reload()
+    new = manager.current
+    assert result["status"] == "reloaded"
+    assert new.version != old.version and new.generation == old.generation + 1
+    # In-flight holders of the old snapshot still see the old dictionaries.
+    assert old.matchers.for_template("registered_nurse") is old_nurse
+    assert "telehealth" in new.matchers.for_template("registered_nurse").concepts
+    # Unchanged concept sets are carried over, not recompiled.
+    assert new.matchers.for_template(None) is old_default
+
+    assert manager.reload()["status"] == "unchanged"
+
+
+def test_reload_refits_ngram_idf_and_defaults_on_the_new_dictionaries(tmp_path, monkeypatch):
+    embedder = SemanticEmbedder(backend="ngram", service_socket="")
+    manager = CatalogManager(embedder=embedder, watch_seconds=0, store_directory=str(tmp_path))
+    assert manager.current.matchers.embedder is embedder
+
+    base_concepts = catalog_module.base_concepts
+    edited = {**base_concepts.BASE_CONCEPTS}
+    edited["observability"] = {"label": "Observability", "tier": "advanced", "synonyms": ["opentelemetry tracing"]}
+    monkeypatch.setattr(catalog_module.importlib, "reload", lambda module: module)
+    monkeypatch.setattr(base_concepts, "BASE_CONCEPTS", edited)
+
+    assert manager.reload()["status"] == "reloaded"
+    refitted = manager.current.matchers.embedder
+    assert refitted is manager.embedder and refitted is not embedder
+    assert "opentelemetry tracing" in refitted.idf_corpus and refitted.model_name != embedder.model_name
+    assert "observability" in manager.current.matchers.for_template(None).concepts
+    # Matchers built outside the catalog read the dictionaries as they are now, too.
+    assert "observability" in KeywordMatcher(embedder=refitted, fuzzy=False).concepts
+
+
+def test_failed_reload_keeps_serving_current_snapshot(tmp_path, monkeypatch):
+    manager = CatalogManager(watch_seconds=0, store_directory=str(tmp_path))
+    current = manager.current
+
+    def broken(module):
+        raise SyntaxError("invalid syntax")
+
+    monkeypatch.setattr(catalog_module.importlib, "reload", broken)
+    result = manager.reload()
+    assert result["status"] == "failed"
+    assert "SyntaxError" in result["last_error"]
+    assert manager.current is current
+
+
+def test_matching_skips_semantic_stage_until_warm_up_loads_the_model(tmp_path):
+    manager = CatalogManager(
+        embedder=SemanticEmbedder(backend="ngram", load=False), watch_seconds=0, store_directory=str(tmp_path)
+    )
+    readiness = manager.readiness()
+    assert not readiness["ready"] and readiness["model"]["state"] == "pending"
+
+    resume = "Diagnosed and patched defects reported by customers. Wrote unit tests."
+    cold = manager.current.matchers.for_template(None).evaluate(resume, "backend engineer")
+    assert cold["matches"] and "semantic" not in {match["method"] for match in cold["matches"]}
+
+    manager.warm_up()
+    readiness = manager.readiness()
+    assert readiness["ready"] and readiness["model"]["state"] == "ready"
+    assert readiness["index"]["embedded"] == readiness["index"]["matchers"]
+    warm = manager.current.matchers.for_template(None).evaluate(resume, "backend engineer")
+    assert "semantic" in {match["method"] for match in warm["matches"]}
+
+
+def test_warm_up_runs_concurrently_with_matching(tmp_path, monkeypatch):
+    # A registry smaller than the number of sets keeps warm-up evicting while requests compile.
+    monkeypatch.setattr(catalog_module.config, "MATCHER_CACHE_SIZE", 2)
+    interval = sys.getswitchinterval()
+    manager = CatalogManager(
+        embedder=SemanticEmbedder(backend="ngram", load=False), watch_seconds=0, store_directory=str(tmp_path)
+    )
+    resume = "Diagnosed and patched defects reported by customers. Wrote unit tests."
+    templates = [None, *list(manager.current.job_templates)[:3]]
+    # Exact/fuzzy hits before warm-up; the semantic stage may only add to them.
+    cold = {template: manager.current.matchers.for_template(template).match(resume, "backend engineer").found_mask
+            for template in templates}
+    errors = []
+
+    def serve():
+        try:
+            for _ in range(20):
+                for template in templates:
+                    found = manager.current.matchers.for_template(template).match(resume, "backend engineer").found_mask
+                    assert found & cold[template] == cold[template]
+                    manager.current.matchers.stats()
+                    manager.readiness()
+        except Exception as exc:  # collected so the assertion below reports it
+            errors.append(exc)
+
+    # Switch threads as often as possible so cache get/set/evict and iteration interleave.
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=serve) for _ in range(3)]
+        warm = manager.warm_up_in_background()
+        for worker in workers:
+            worker.start()
+        for worker in [warm, *workers]:
+            worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors, errors
+    assert manager.warm_state == "ready"
@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.chunker import ResumeChunker  # noqa: E402
+
+
+def test_chunker_merges_fragments_and_drops_repeated_lines():
+    chunker = ResumeChunker(budget=10, min_words=6, max_words=40)
+    text = "Python. Git. Docker. SQL. REST APIs. Linux\nPython\nBuilt a scheduling service used by three campus teams."
+
+    chunks, dropped = chunker.chunk(text)
+
+    assert chunks == ["Python Git Docker SQL REST APIs", "Built a scheduling service used by three campus teams"]
+    assert dropped == 0
+
+
+def test_chunker_budget_keeps_experience_before_other_sections():
+    chunker = ResumeChunker(budget=3, min_words=3, max_words=8)
+    hobbies = "\n".join(f"Enjoy hiking trail number {i} on weekends" for i in range(50))
+    experience = "Work Experience\nBuilt payment retries for the billing service\nOwned the on-call rotation for alerts"
+    text = f"Interests\n{hobbies}\n{experience}\nProjects\nWrote a compiler for a toy language"
+
+    chunks, dropped = chunker.chunk(text)
+
+    assert len(chunks) == 3
+    assert dropped == len(chunker.sectioned_chunks(text)) - 3
+    assert chunks == [
+        "Built payment retries for the billing service",
+        "Owned the on-call rotation for alerts",
+        "Wrote a compiler for a toy language",
+    ]
+
+
+def test_chunker_splits_long_sentences_into_overlapping_windows():
+    chunker = ResumeChunker(budget=100, min_words=3, max_words=8)
+    words = [f"w{i}" for i in range(20)]
+
+    chunks, _ = chunker.chunk(" ".join(words))
+
+    assert all(len(chunk.split()) <= 8 for chunk in chunks)
+    assert chunks[0].split()[0] == "w0" and chunks[-1].split()[-1] == "w19"
+    assert len(chunks) == 3
@@ -0,0 +1,53 @@
+import os
+import sys
+import threading
+
+import numpy as np
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.embedding_service import EmbeddingServer  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder, load_local_model  # noqa: E402
+
+
+def _serve(socket_path):
+    model, backend, _ = load_local_model("ngram", "")
+    server = EmbeddingServer(socket_path, model, {"model": model.name, "backend": backend}, max_wait_ms=50)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_workers_share_the_service_and_concurrent_encodes_are_batched(tmp_path):
+    socket_path = str(tmp_path / "embeddings.sock")
+    server = _serve(socket_path)
+    try:
+        clients = [SemanticEmbedder(backend="transformer", service_socket=socket_path) for _ in range(6)]
+        local = SemanticEmbedder(backend="ngram", service_socket="")
+        # The service decides the model: these "transformer" clients get its n-gram backend and name.
+        assert all(client.backend == "ngram" and client.model_name == local.model_name for client in clients)
+
+        barrier = threading.Barrier(len(clients))
+        results = {}
+
+        def encode(number, client):
+            barrier.wait()
+            results[number] = client.encode_batch([f"built service {number}", "unit testing"])
+
+        threads = [threading.Thread(target=encode, args=item) for item in enumerate(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert np.allclose(results[3], local.encode_batch(["built service 3", "unit testing"]), atol=1e-6)
+        stats = clients[0].service_stats()
+        assert stats["requests"] == len(clients) and stats["batches"] < len(clients)
+        assert sum(stats["batch_sizes"].values()) == stats["batches"] and stats["fallback_calls"] == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Service gone: the same client keeps encoding with an in-process copy of the model.
+    vectors = clients[0].encode_batch(["debugging flaky builds"])
+    assert np.allclose(vectors, local.encode_batch(["debugging flaky builds"]), atol=1e-6)
+    assert clients[0].model.fallback_calls == 1
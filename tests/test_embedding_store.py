@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.concept_index import ConceptIndex  # noqa: E402
+from services.embedding_store import EmbeddingStore, QuantizedMatrix  # noqa: E402
+
+
+class _CountingEmbedder:
+    model = True
+    model_name = "counting/stub"
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode_batch(self, texts):
+        self.encoded += len(texts)
+        matrix = np.ones((len(texts), 4), dtype=np.float32)
+        matrix[:, 0] = np.arange(len(texts))
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def test_store_reuses_mmap_artifact_and_rebuilds_when_concepts_change(tmp_path):
+    concepts = {
+        "testing": {"label": "Testing", "synonyms": ["unit tests", "pytest"]},
+        "git": {"label": "Git", "synonyms": ["git"]},
+    }
+    store = EmbeddingStore(directory=str(tmp_path))
+    embedder = _CountingEmbedder()
+
+    synonyms, centroids = store.load_or_build(embedder, ConceptIndex(concepts))
+    assert synonyms.shape == (3, 4) and centroids.shape == (2, 4)
+    assert embedder.encoded == 3
+
+    reloaded, _ = store.load_or_build(embedder, ConceptIndex(concepts))
+    assert isinstance(reloaded, np.memmap)
+    assert embedder.encoded == 3
+
+    concepts["git"]["synonyms"].append("github")
+    rebuilt, _ = store.load_or_build(embedder, ConceptIndex(concepts))
+    assert rebuilt.shape == (4, 4)
+    assert embedder.encoded == 7
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".npy")]) == 2
+
+
+def test_quantized_artifact_round_trips_and_scores_like_float(tmp_path):
+    class _QuantizedEmbedder(_CountingEmbedder):
+        model_name = "counting/stub+int8"
+
+        def encode_batch(self, texts):
+            return QuantizedMatrix.quantize(super().encode_batch(texts))
+
+    concepts = {
+        "testing": {"label": "Testing", "synonyms": ["unit tests", "pytest"]},
+        "git": {"label": "Git", "synonyms": ["git"]},
+    }
+    index = ConceptIndex(concepts)
+    built = EmbeddingStore(directory=str(tmp_path)).load_or_build(_QuantizedEmbedder(), index)
+    embedder = _QuantizedEmbedder()
+    synonyms, centroids = EmbeddingStore(directory=str(tmp_path)).load_or_build(embedder, index)
+
+    assert embedder.encoded == 0  # loaded from disk, codes and scales sidecar included
+    assert synonyms.codes.dtype == np.int8 and isinstance(centroids, QuantizedMatrix)
+    assert np.array_equal(synonyms.codes, built[0].codes)
+    reference = _CountingEmbedder().encode_batch(index.synonyms)
+    assert np.allclose(synonyms.dequantize(), reference, atol=0.01)
+    assert synonyms.nbytes < reference.nbytes
@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.embedding_store import EmbeddingStore  # noqa: E402
+from services.jd_analysis import JDAnalyzer  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+
+JD = """Software Engineer Intern (hybrid, Austin TX)
+
+Requirements:
+- Build and maintain REST APIs in Python
+- Write unit and integration tests
+"""
+
+
+def test_analysis_is_shared_by_variants_of_one_posting():
+    analyzer = JDAnalyzer(max_entries=8)
+
+    analysis = analyzer.analyze(JD)
+    assert analysis.intern and analysis.location_required
+    assert [text for _, text in analysis.requirements] == [
+        "Build and maintain REST APIs in Python",
+        "Write unit and integration tests",
+    ]
+    assert "\n" not in analysis.text  # cleaned for matching, bullets parsed before cleaning
+
+    assert analyzer.analyze(JD) is analysis
+    # Trailing whitespace changes the raw hash but not the fingerprint.
+    assert analyzer.analyze(JD + "  \n") is analysis
+    assert analyzer.analyze(JD.replace("hybrid", "remote")) is not analysis
+
+
+def test_matcher_embeds_requirements_once_per_analysis(tmp_path):
+    embedder = SemanticEmbedder(backend="ngram")
+    calls = []
+    encode_batch = embedder.encode_batch
+
+    def counting_encode(texts):
+        calls.append(list(texts))
+        return encode_batch(texts)
+
+    embedder.encode_batch = counting_encode
+    matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=str(tmp_path)))
+    analysis = JDAnalyzer(max_entries=8).analyze(JD)
+
+    for resume in ("Built REST APIs in Python with pytest suites", "Wrote integration tests for a Flask service"):
+        result = matcher.match(resume, analysis.text, jd=analysis)
+        assert result.intern_context and len(result.requirements) == 2
+
+    requirement_batches = [batch for batch in calls if batch == [text for _, text in analysis.requirements]]
+    assert len(requirement_batches) == 1
+    assert embedder.model_name in analysis.requirement_embeddings
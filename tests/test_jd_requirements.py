@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.embedding_store import EmbeddingStore  # noqa: E402
+from services.jd_requirements import parse_requirements  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+
+JD = """Backend engineer for our payments team.
+
+Responsibilities:
+- Build and maintain REST APIs in Python
+- Write unit and integration tests
+- Build and maintain REST APIs in Python
+
+Benefits:
+- Free lunch every day of the week
+
+Requirements:
+1. Experience with PostgreSQL databases
+2) Familiarity with Docker and Kubernetes
+"""
+
+
+def test_parse_requirements_reads_requirement_bullets_only():
+    assert parse_requirements(JD) == [
+        ("responsibilities", "Build and maintain REST APIs in Python"),
+        ("responsibilities", "Write unit and integration tests"),
+        ("requirements", "Experience with PostgreSQL databases"),
+        ("requirements", "Familiarity with Docker and Kubernetes"),
+    ]
+    # Free-form postings fall back to sentences.
+    assert parse_requirements("We need a backend engineer. You will write tests and review code.") == [
+        ("description", "We need a backend engineer"),
+        ("description", "You will write tests and review code"),
+    ]
+
+
+def test_requirement_coverage_reports_best_chunk_per_requirement(tmp_path):
+    matcher = KeywordMatcher(embedder=SemanticEmbedder(backend="ngram"), store=EmbeddingStore(directory=str(tmp_path)))
+    resume = (
+        "Experience\n"
+        "Built and maintained REST APIs in Python and Flask for the billing platform.\n"
+        "Wrote unit tests and integration tests with pytest for every service.\n"
+        "Organized the office book club and the annual summer picnic."
+    )
+
+    report = matcher.evaluate(resume, JD)["requirement_coverage"]
+
+    by_requirement = {item["requirement"]: item for item in report["requirements"]}
+    assert report["total"] == 4
+    assert by_requirement["Build and maintain REST APIs in Python"]["covered"]
+    assert "REST APIs" in by_requirement["Build and maintain REST APIs in Python"]["evidence"]
+    assert "unit tests" in by_requirement["Write unit and integration tests"]["evidence"]
+    assert not by_requirement["Familiarity with Docker and Kubernetes"]["covered"]
+    assert report["covered"] == sum(item["covered"] for item in report["requirements"])
@@ -1,9 +1,14 @@
 import os
 import sys
+import zlib
+
+import numpy as np
 
 sys.path.append(os.path.abspath("backend"))
 
+from services.embedding_store import EmbeddingStore  # noqa: E402
 from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.match_result import MatchResult  # noqa: E402
 
 
 def test_overqualification_boosts_score():
@@ -30,3 +35,215 @@ def test_recency_and_impact_boosts():
 
     # Recency + impact bumps should push score above baseline coverage.
     assert result["score"] >= 70
+
+
+def test_exact_matching_respects_word_boundaries():
+    matcher = KeywordMatcher()
+    resume = "Digital capabilities, good communication. Shipped C++ services and a REST/API gateway."
+
+    result = matcher.evaluate(resume_text=resume, job_description="backend engineer", intern_level="general")
+
+    exact = {match["key"]: match["matched_phrase"] for match in result["matches"] if match["method"] == "exact"}
+    # "git" in "digital" / "go" in "good" must not count; "c++" and "api" next to symbols still do.
+    assert "version_control" not in exact
+    assert exact["programming_fundamentals"] == "c++"
+    assert exact["web_fundamentals"] == "api"
+
+
+class _KeywordEmbedder:
+    """Deterministic stand-in: texts containing an anchor word share a direction, the rest are hashed apart."""
+
+    model = True
+    model_name = "keyword-stub"
+    anchors = {"squashed": "debugging"}
+
+    def _vector(self, text):
+        lowered = text.lower()
+        key = next((target for word, target in self.anchors.items() if word in lowered), lowered)
+        rng = np.random.default_rng(zlib.crc32(key.encode("utf-8")))
+        vector = rng.standard_normal(256).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def encode_batch(self, texts):
+        return np.stack([self._vector(text) for text in texts]) if texts else None
+
+
+def test_semantic_stage_matches_in_one_batch(tmp_path):
+    matcher = KeywordMatcher(embedder=_KeywordEmbedder(), store=EmbeddingStore(directory=str(tmp_path)))
+    resume = "Squashed flaky defects in the checkout service; Wrote pytest suites"
+
+    result = matcher.evaluate(resume_text=resume, job_description="backend engineer", intern_level="general")
+
+    by_key = {match["key"]: match for match in result["matches"]}
+    assert by_key["testing"]["method"] == "exact"
+    assert by_key["debugging"]["method"] == "semantic"
+    assert by_key["debugging"]["matched_phrase"] == "Squashed flaky defects in the checkout service"
+    assert by_key["debugging"]["score"] >= 0.62
+
+
+def test_telemetry_counts_hits_per_synonym_and_method(tmp_path):
+    matcher = KeywordMatcher(
+        embedder=_KeywordEmbedder(), store=EmbeddingStore(directory=str(tmp_path)), fuzzy=True, morphology=False
+    )
+    resume = "Squashed flaky defects in the checkout service; Wrote pytest suites with git"
+
+    matcher.match(resume, "backend engineer")
+    matcher.match(resume, "backend engineer")
+    snapshot = matcher.telemetry.snapshot()
+
+    assert snapshot["matches"] == 2
+    testing = {entry["phrase"]: entry for entry in snapshot["concepts"]["testing"]["synonyms"]}
+    assert testing["pytest"]["exact"] == 2
+    assert snapshot["concepts"]["version_control"]["exact"] == 2
+    assert snapshot["concepts"]["debugging"]["semantic"] == 2
+    assert snapshot["concepts"]["debugging"]["semantic_scored"] > 0
+    assert {"concept": "testing", "phrase": "pytest"} not in snapshot["never_matched"]
+    assert set(snapshot["stage_ms"]) == {"exact", "fuzzy", "semantic", "taxonomy", "requirements"}
+
+    matcher.telemetry.reset()
+    assert matcher.telemetry.snapshot()["matches"] == 0
+
+
+def test_telemetry_counts_synonyms_shadowed_by_the_winning_one(tmp_path):
+    concepts = {
+        "testing": {"label": "Testing", "tier": "core", "synonyms": ["unit tests", "pytest", "test suites"]},
+        "debugging": {"label": "Debugging", "tier": "core", "synonyms": ["bug fix", "bugfix"]},
+    }
+    matcher = KeywordMatcher(
+        concepts=concepts, embedder=_KeywordEmbedder(), store=EmbeddingStore(directory=str(tmp_path)), morphology=True
+    )
+
+    matcher.match("Wrote unit tests with pytest and shipped a bugfix", "backend engineer")
+    snapshot = matcher.telemetry.snapshot()
+
+    testing = {entry["phrase"]: entry["exact"] for entry in snapshot["concepts"]["testing"]["synonyms"]}
+    assert testing == {"unit tests": 1, "pytest": 1, "test suites": 0}
+    # Both spellings fold onto one pattern with morphology on; neither is a pruning candidate.
+    assert snapshot["concepts"]["debugging"]["exact"] == 2
+    assert snapshot["never_matched"] == [{"concept": "testing", "phrase": "test suites"}]
+
+
+def test_centroid_prefilter_prunes_without_changing_matches(tmp_path):
+    store = EmbeddingStore(directory=str(tmp_path))
+    resume = "Squashed flaky defects; Wrote pytest suites"
+    full = KeywordMatcher(embedder=_KeywordEmbedder(), store=store, centroid_prefilter=False)
+    pruned = KeywordMatcher(embedder=_KeywordEmbedder(), store=store, centroid_prefilter=True, centroid_margin=0.5)
+
+    baseline = full.evaluate(resume_text=resume, job_description="backend engineer")
+    result = pruned.evaluate(resume_text=resume, job_description="backend engineer")
+
+    assert result["matches"] == baseline["matches"]
+    assert result["semantic_stats"]["concepts_pruned"] > 0
+    assert result["semantic_stats"]["synonyms_scored"] < baseline["semantic_stats"]["synonyms_scored"]
+
+
+def test_typos_match_as_fuzzy_before_semantic_stage():
+    matcher = KeywordMatcher(fuzzy=True, morphology=False)
+    resume = "Handled debuging and troubleshoting for the checkout service. Used git daily."
+
+    result = matcher.evaluate(resume_text=resume, job_description="backend engineer", intern_level="general")
+
+    by_key = {match["key"]: match for match in result["matches"]}
+    assert by_key["debugging"]["method"] == "fuzzy"
+    assert by_key["debugging"]["matched_phrase"] == "debugging"
+    assert by_key["version_control"]["method"] == "exact"
+    assert matcher.fuzzy_index.correct("go") is None
+
+
+def test_morphology_folds_inflections_and_hyphen_variants():
+    matcher = KeywordMatcher(fuzzy=False, morphology=True)
+    resume = "Shipped bug-fixes, reviewed pull-requests and maintained REST APIs."
+
+    result = matcher.evaluate(resume_text=resume, job_description="backend engineer", intern_level="general")
+
+    found = {match["key"]: match["method"] for match in result["matches"]}
+    assert found == {"debugging": "exact", "version_control": "exact", "web_fundamentals": "exact"}
+    assert matcher.index.deduplicated > 0
+    assert matcher.index.pattern_count < KeywordMatcher(morphology=False).index.pattern_count
+
+
+def test_evaluate_levels_matches_single_level_scoring():
+    matcher = KeywordMatcher()
+    resume = "Intern project: deployed Docker services, wrote unit tests and fixed bugs in 2024."
+    jd = "Software engineer intern working on APIs and testing."
+
+    levels = matcher.evaluate_levels(resume_text=resume, job_description=jd)
+
+    assert set(levels) == {"freshman", "sophomore", "junior", "senior", "general"}
+    for level, result in levels.items():
+        single = matcher.evaluate(resume_text=resume, job_description=jd, intern_level=level)
+        assert result["score"] == single["score"]
+        assert result["missing_keywords"] == single["missing_keywords"]
+    assert levels["freshman"]["score"] >= 98
+
+
+def test_reevaluation_reuses_unchanged_chunks(tmp_path):
+    embedder = _KeywordEmbedder()
+    matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=str(tmp_path)))
+    resume = "Wrote unit tests for the API.\nSquashed production issues.\nUsed Git daily."
+    edited = resume.replace("Used Git daily", "Used Git and GitHub daily")
+
+    first = matcher.evaluate(resume_text=resume, job_description="intern", intern_level="general")
+    second = matcher.evaluate(resume_text=edited, job_description="intern", intern_level="general")
+    fresh = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=str(tmp_path))).evaluate(
+        resume_text=edited, job_description="intern", intern_level="general"
+    )
+
+    assert (first["chunk_stats"]["chunks"], first["chunk_stats"]["reused"]) == (3, 0)
+    assert (second["chunk_stats"]["chunks"], second["chunk_stats"]["reused"]) == (3, 2)
+    assert second["score"] == fresh["score"]
+    assert second["matches"] == fresh["matches"]
+
+
+def test_tier_implication_uses_concept_bitmasks():
+    matcher = KeywordMatcher()
+    layout = matcher.layout
+    advanced_only = MatchResult(
+        found_mask=layout.advanced_concept_mask,
+        hits=[],
+        intern_context=False,
+        recent=False,
+        impact=False,
+        semantic_stats={},
+        chunk_stats={},
+    )
+
+    result = matcher.score_level(advanced_only)
+
+    # Advanced evidence implies every core and basic concept, so nothing is reported missing.
+    assert layout.highest_tier(advanced_only.found_mask) == 3
+    assert result["missing_keywords"] == []
+    assert result["score"] == 100
+    assert not hasattr(advanced_only, "__dict__")
+
+
+def test_batch_scoring_matches_single_resume_scoring():
+    matcher = KeywordMatcher()
+    jd = "Software engineer intern working on APIs and testing."
+    resumes = [
+        "Intern project: deployed Docker services, wrote unit tests and fixed bugs in 2024.",
+        "Python and Git. Improved latency by 25% with code reviews.",
+        "Team player who loves learning new things.",
+        "",
+        "Built REST APIs in Flask; debugging production incidents and writing clean code.",
+    ]
+    results = matcher.match_batch(resumes, jd) + [matcher.match("Python and Git", "backend engineer")]
+
+    for level in ("freshman", "sophomore", "junior", "senior", "general"):
+        batch = matcher.score_batch(results, level)
+        assert batch == [matcher.score_level(result, level) for result in results]
+
+
+def test_dotted_synonyms_and_wrapped_phrases_still_match():
+    concepts = {
+        "node": {"label": "Node.js", "tier": "core", "synonyms": ["node.js", "asp.net"]},
+        "bug_fixing": {"label": "Bug fixing", "tier": "core", "synonyms": ["fixed bugs"]},
+    }
+    matcher = KeywordMatcher(concepts=concepts, embedder=_KeywordEmbedder(), fuzzy=False)
+
+    result = matcher.evaluate("Built APIs in Node.js and React.\nOn call, fixed\nbugs in billing.", "backend engineer")
+
+    assert {(match["key"], match["method"]) for match in result["matches"]} == {
+        ("node", "exact"),
+        ("bug_fixing", "exact"),
+    }
@@ -0,0 +1,113 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath("backend"))
+
+from data.base_concepts import BASE_CONCEPTS  # noqa: E402
+from services import matcher_registry as registry_module  # noqa: E402
+from services.matcher_registry import MatcherRegistry  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder  # noqa: E402
+from services.tenant_dictionaries import TenantDictionaryStore  # noqa: E402
+from utils.cache import LRUCache  # noqa: E402
+
+
+def test_registry_resolves_template_concepts_and_bounds_compiled_matchers():
+    registry = MatcherRegistry(max_entries=2)
+
+    assert registry.concepts_for_template("accountant")[0] == "finance"
+    assert registry.concepts_for_template("software_engineer")[1] == BASE_CONCEPTS
+    assert registry.concepts_for_template("no-such-template")[1] == BASE_CONCEPTS
+
+    nurse = registry.for_template("registered_nurse")
+    assert registry.for_template("registered_nurse") is nurse
+    registry.for_template("accountant")
+    registry.for_template("teacher_k12")
+
+    stats = registry.stats()
+    assert stats["compiles"] == 3
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hit_rate"] == 0.25
+    assert registry.for_template("registered_nurse") is not nurse
+
+
+def test_evicted_tenant_dictionary_is_restored_from_disk(tmp_path):
+    registry = MatcherRegistry(max_entries=1, tenants=TenantDictionaryStore(directory=str(tmp_path)))
+    concepts = {"forklift": {"label": "Forklift", "synonyms": ["forklift", "pallet jack"]}}
+
+    uploaded = registry.register_tenant("key-a", concepts)
+    registry.for_template("accountant")  # evicts the tenant matcher
+    restored = MatcherRegistry(max_entries=1, tenants=registry.tenants).for_request(api_key="key-a")
+
+    assert restored is not uploaded
+    assert restored.index.fingerprint == uploaded.index.fingerprint
+    assert registry.for_request(api_key="key-a").concepts["forklift"]["weight"] == 1.0
+    assert registry.for_request(api_key="someone-else").concepts == BASE_CONCEPTS
+    with pytest.raises(ValueError):
+        registry.register_tenant("key-a", {"bad key!": concepts["forklift"]})
+
+
+class _EvictAfterCheck(LRUCache):
+    """Evicts everything right after a membership check, like a warm-up thread in that window."""
+
+    def __contains__(self, key):
+        found = super().__contains__(key)
+        with self._lock:
+            self._store.clear()
+        return found
+
+
+def test_tenant_matcher_evicted_mid_lookup_recompiles_the_tenant_dictionary(tmp_path):
+    registry = MatcherRegistry(tenants=TenantDictionaryStore(directory=str(tmp_path)), store_directory=str(tmp_path))
+    concepts = {"forklift": {"label": "Forklift", "synonyms": ["forklift", "pallet jack"]}}
+    registry.register_tenant("key-a", concepts)
+    racing = _EvictAfterCheck(max_entries=8)
+    for key, matcher in registry.matchers.items():
+        racing.set(key, matcher)
+    registry.matchers = racing
+
+    assert list(registry.for_request(api_key="key-a").concepts) == ["forklift"]
+
+
+def test_tenant_names_never_contain_the_api_key(tmp_path):
+    api_key = "acme-secret-key-0001"
+    registry = MatcherRegistry(
+        embedder=SemanticEmbedder(backend="hash"),
+        tenants=TenantDictionaryStore(directory=str(tmp_path / "tenants")),
+        store_directory=str(tmp_path / "embeddings"),
+    )
+    registry.register_tenant(api_key, {"forklift": {"label": "Forklift", "synonyms": ["forklift"]}})
+    registry.for_request(api_key=api_key)._synonym_embeddings()
+
+    names = [*registry.stats()["last_compile_ms"], *os.listdir(tmp_path / "embeddings")]
+    assert names and not any(api_key[:4] in name for name in names)
+
+
+def test_tenant_count_and_artifact_disk_are_capped(tmp_path, monkeypatch):
+    registry_config = registry_module.config
+    monkeypatch.setattr(registry_config, "TENANT_MAX_COUNT", 1)
+    registry = MatcherRegistry(
+        tenants=TenantDictionaryStore(directory=str(tmp_path / "tenants")), store_directory=str(tmp_path / "embeddings")
+    )
+    concepts = {"forklift": {"label": "Forklift", "synonyms": ["forklift", "pallet jack"]}}
+
+    registry.register_tenant("key-a", concepts)
+    registry.register_tenant("key-a", concepts)  # re-uploads do not count as a new tenant
+    with pytest.raises(registry_module.TenantQuotaError):
+        registry.register_tenant("key-b", concepts)
+
+    artifact = tmp_path / "embeddings" / f"{registry_module.TENANT_STORE_PREFIX}-00000000-model-synonyms.npy"
+    artifact.parent.mkdir()
+    artifact.write_bytes(b"x" * 64)
+    monkeypatch.setattr(registry_config, "TENANT_MAX_COUNT", 10)
+    monkeypatch.setattr(registry_config, "TENANT_ARTIFACT_MAX_BYTES", 64)
+    with pytest.raises(registry_module.TenantQuotaError):
+        registry.register_tenant("key-b", concepts)
+
+    tenant = registry.tenants.tenant_hash("key-a")[:12]
+    own = tmp_path / "embeddings" / f"{registry_module.TENANT_STORE_PREFIX}-{tenant}-model-synonyms.npy"
+    own.write_bytes(b"x")
+    assert registry.remove_tenant("key-a") and not own.exists() and artifact.exists()
+    assert registry.for_request(api_key="key-a").concepts == BASE_CONCEPTS
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.embedding_store import EmbeddingStore  # noqa: E402
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.semantic_embedder import SemanticEmbedder, ngram_embedder  # noqa: E402
+
+
+def test_ngram_backend_works_without_a_model():
+    embedder = SemanticEmbedder(backend="ngram")
+
+    assert embedder.model is not None and embedder.backend == "ngram"
+    vectors = embedder.encode_batch(["troubleshooting", "Troubleshot flaky builds", "Organized the spring gala"])
+    assert vectors.shape == (3, embedder.model.dim)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > embedder.threshold > vectors[0] @ vectors[2]
+
+
+def test_ngram_first_pass_resolves_concepts_before_the_model(tmp_path):
+    class _SilentModel:
+        """Model stand-in that never finds anything, so every semantic hit comes from the first pass."""
+
+        model = True
+        model_name = "silent-stub"
+
+        def encode_batch(self, texts):
+            return np.zeros((len(texts), 8), dtype=np.float32)
+
+    model = _SilentModel()
+    matcher = KeywordMatcher(
+        embedder=model, store=EmbeddingStore(directory=str(tmp_path)), first_pass=ngram_embedder(), fuzzy=False
+    )
+
+    result = matcher.evaluate("Diagnosed and patched defects reported by customers", "backend engineer")
+
+    by_key = {match["key"]: match for match in result["matches"]}
+    assert by_key["debugging"]["method"] == "semantic"
+    assert result["semantic_stats"]["first_pass_hits"] >= 1
+    # The model still scores what the first pass left, but never the concepts it resolved.
+    assert result["semantic_stats"]["concepts_considered"] == len(matcher.concepts) - len(result["matches"])
+
+
+def test_encode_batch_only_sends_misses_and_bounds_cache_bytes():
+    embedder = SemanticEmbedder(backend="ngram")
+    row_bytes = embedder.model.dim * 4
+    embedder.cache.max_bytes = 3 * row_bytes
+    encoded = []
+    encode = embedder.model.encode
+
+    def counting_encode(texts, normalize_embeddings=True):
+        encoded.append(list(texts))
+        return encode(texts, normalize_embeddings=normalize_embeddings)
+
+    embedder.model.encode = counting_encode
+
+    first = embedder.encode_batch(["unit testing", "debugging", "unit testing"])
+    second = embedder.encode_batch(["debugging", "code review"])
+
+    assert encoded == [["unit testing", "debugging"], ["code review"]]
+    assert np.array_equal(first[1], second[0]) and np.array_equal(first[0], first[2])
+    assert embedder.cache_stats()["hits"] == 1 and embedder.cache_stats()["misses"] == 3
+
+    embedder.encode_batch(["pair programming", "ci pipelines"])
+    stats = embedder.cache_stats()
+    assert stats["bytes"] <= 3 * row_bytes and stats["evictions"] == 2
+    assert embedder.any_above_threshold("unit tests", ["unit testing", "gala"], threshold=0.3)[2] == "unit testing"
+
+
+def test_quantized_mode_scores_like_float32():
+    plain = SemanticEmbedder(backend="ngram", quantize=False, projection_path="")
+    quantized = SemanticEmbedder(backend="ngram", quantize=True, projection_path="")
+
+    assert quantized.model_name == f"{plain.model_name}+int8"
+    rows = quantized.encode_batch(["unit testing", "debugging"])
+    assert rows.codes.dtype == np.int8 and rows.nbytes < plain.encode_batch(["unit testing", "debugging"]).nbytes
+    candidates = ["unit testing", "code review", "gala"]
+    plain_score, plain_phrase = plain.similarity("unit tests", candidates)
+    score, phrase = quantized.similarity("unit tests", candidates)
+    assert phrase == plain_phrase and abs(score - plain_score) < 0.01
+
+
+def test_quantized_artifacts_are_scored_as_float32(tmp_path):
+    embedder = SemanticEmbedder(backend="ngram", quantize=True, projection_path="")
+    matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=str(tmp_path)), fuzzy=False)
+
+    synonyms, centroids = matcher._semantic_embeddings(embedder)
+    stored, _ = matcher.store.load_or_build(embedder, matcher.index)
+    # int8 on disk; expanded once at load so requests do not upcast the codes on every call.
+    assert stored.codes.dtype == np.int8
+    assert synonyms.dtype == np.float32 and centroids.dtype == np.float32
+    assert np.allclose(synonyms, stored.dequantize())
+    assert matcher._semantic_embeddings(embedder)[0] is synonyms
+
+
+def test_hash_backend_runs_the_semantic_pipeline_without_a_model(tmp_path):
+    embedder = SemanticEmbedder(backend="hash")
+    again = SemanticEmbedder(backend="hash")
+
+    assert embedder.model_name == "hash-384" and embedder.threshold is not None
+    assert np.array_equal(embedder.encode_batch(["unit testing"]), again.encode_batch(["unit testing"]))
+    matcher = KeywordMatcher(embedder=embedder, store=EmbeddingStore(directory=str(tmp_path)), fuzzy=False)
+
+    result = matcher.evaluate("Code kept readable.", "backend engineer")
+
+    assert [(match["key"], match["method"]) for match in result["matches"]] == [("clean_code", "semantic")]
+    assert any(path.name.startswith("concepts-hash-384-") for path in tmp_path.iterdir())
+
+
+def test_missing_onnx_model_leaves_the_embedder_unavailable():
+    embedder = SemanticEmbedder(backend="onnx")
+
+    assert embedder.model is None and embedder.state == "unavailable" and embedder.load_error
+    assert embedder.encode_batch(["unit testing"]) is None
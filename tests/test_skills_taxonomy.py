@@ -0,0 +1,76 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.keyword_matcher import KeywordMatcher  # noqa: E402
+from services.skills_taxonomy import TaxonomyStore  # noqa: E402
+from services.text_index import TextIndex  # noqa: E402
+
+TAXONOMY = """id,label,aliases
+S1,Machine Learning,ML|machine-learning
+S2,Learning Management Systems,LMS
+S3,PostgreSQL,postgres|psql
+S4,Kubernetes,k8s
+S5,Tableau,
+"""
+
+
+def _store(tmp_path):
+    source = tmp_path / "skills.csv"
+    source.write_text(TAXONOMY, encoding="utf-8")
+    return TaxonomyStore(directory=str(tmp_path / "artifacts")), str(source)
+
+
+def test_taxonomy_artifact_is_memory_mapped_and_extracts_longest_matches(tmp_path):
+    store, source = _store(tmp_path)
+    built = store.load_or_build(source)
+    loaded = store.load_or_build(source)
+
+    assert len(built) == len(loaded) == 5
+    assert isinstance(loaded.edge_hash, np.memmap)
+    tokens = TextIndex("Shipped machine learning models on k8s with Postgres; learning fast.").tokens
+    found = {loaded.key(skill): phrase for skill, phrase in loaded.extract(tokens).items()}
+    assert found == {"S1": "machine learning", "S4": "k8s", "S3": "postgres"}
+
+
+def test_taxonomy_skills_join_matches_and_missing_keywords(tmp_path):
+    store, source = _store(tmp_path)
+    matcher = KeywordMatcher(morphology=False, taxonomy=store.load_or_build(source))
+    jd = "We use PostgreSQL, Kubernetes and Tableau."
+    resume = "Tuned psql queries and wrote unit tests."
+
+    result = matcher.evaluate(resume_text=resume, job_description=jd)
+
+    taxonomy = [match for match in result["matches"] if match["method"] == "taxonomy"]
+    assert taxonomy == [
+        {"key": "S3", "label": "PostgreSQL", "method": "taxonomy", "matched_phrase": "psql", "score": 1.0}
+    ]
+    assert result["missing_keywords"][-2:] == ["Kubernetes", "Tableau"]
+    batch = matcher.evaluate_batch([resume], jd)[0]
+    assert (batch["score"], batch["matches"], batch["missing_keywords"]) == (
+        result["score"],
+        result["matches"],
+        result["missing_keywords"],
+    )
+
+
+def test_jd_taxonomy_skills_are_extracted_once_per_batch(tmp_path):
+    store, source = _store(tmp_path)
+    taxonomy = store.load_or_build(source)
+    matcher = KeywordMatcher(morphology=False, taxonomy=taxonomy)
+    extracted = []
+    extract = taxonomy.extract
+
+    def counting_extract(tokens):
+        extracted.append(len(tokens))
+        return extract(tokens)
+
+    taxonomy.extract = counting_extract
+    results = matcher.match_batch(["Tuned psql queries.", "Ran k8s clusters.", "Wrote unit tests."], "PostgreSQL and Kubernetes.")
+
+    # One JD extraction plus one per resume, instead of two per resume.
+    assert len(extracted) == 1 + 3
+    assert [len(result.missing_skills) for result in results] == [1, 1, 2]
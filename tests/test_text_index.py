@@ -0,0 +1,18 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath("backend"))
+
+from services.text_index import TextIndex  # noqa: E402
+
+
+def test_text_index_phrase_lookups_respect_word_boundaries():
+    index = TextIndex("Fixed bugs across Pull-Requests; shipped C++ tooling and collaborated in team meetings.")
+
+    assert index.contains("fixed bugs")
+    assert index.contains("pull requests")
+    assert index.contains("c++")
+    assert index.contains("collaborated in team meetings")
+    assert not index.contains("bugs across pull requests today")
+    assert not index.contains("api")
+    assert index.find_any(["git", "tooling", "meetings"]) == ["tooling", "meetings"]